@@ -1,2 +1,15 @@
+import time
+
+IMPORT_STARTED_NS = time.perf_counter_ns()
+
 __version__ = "2.0.1"
 
+__all__ = ["AddResult", "InvalidTargetError", "Lantern", "__version__"]
+
+
+def __getattr__(name: str):
+    if name in ("AddResult", "InvalidTargetError", "Lantern"):
+        from lantern import api
+
+        return getattr(api, name)
+    raise AttributeError(f"module 'lantern' has no attribute {name!r}")
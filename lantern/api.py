@@ -0,0 +1,260 @@
+import asyncio
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
+
+from lantern.cache import ProblemCache
+from lantern.catalog import Catalog
+from lantern.filesystem import FileSystemManager
+from lantern.index import ProblemIndex
+from lantern.leetcode import DEFAULT_CHUNK_CONCURRENCY, DEFAULT_CHUNK_SIZE, LeetCodeClient, LeetCodeError
+from lantern.statements import StatementStore
+from lantern.trace import traced
+
+if TYPE_CHECKING:
+    import aiohttp
+
+SLUG_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+
+Target = Union[str, int]
+T = TypeVar("T")
+
+
+class InvalidTargetError(ValueError):
+    def __init__(self, target: Target, reason: str):
+        super().__init__(f"{reason}: {target}")
+        self.target = target
+
+
+@dataclass
+class AddResult:
+    target: Target
+    language: str
+    slug: Optional[str] = None
+    problem: Optional[Dict] = None
+    folder: Optional[Path] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class Lantern:
+    def __init__(
+        self,
+        root: Union[str, Path],
+        leetcode_client: Optional[LeetCodeClient] = None,
+        cache: Optional[ProblemCache] = None,
+        catalog: Optional[Catalog] = None,
+        session: Optional["aiohttp.ClientSession"] = None,
+        index: Optional[ProblemIndex] = None,
+        refresh: bool = False,
+        offline: bool = False,
+    ):
+        self.root = Path(root)
+        self.fs_manager = FileSystemManager(self.root)
+        self.session = session
+        self._index = index
+        self._initialized = False
+        self._owns_client = leetcode_client is None
+        self.client = leetcode_client or LeetCodeClient(
+            cache=cache or ProblemCache(),
+            refresh=refresh,
+            offline=offline,
+            catalog=catalog if catalog is not None else Catalog(),
+        )
+
+    async def __aenter__(self) -> "Lantern":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def initialize(self) -> FileSystemManager:
+        if not self._initialized:
+            self.fs_manager.initialize()
+            if self._index is not None:
+                self.fs_manager.index = self._index
+            self._initialized = True
+        return self.fs_manager
+
+    async def close(self) -> None:
+        if self._owns_client:
+            await self.client.close()
+            if self.client.cache is not None:
+                self.client.cache.close()
+            if self.client.catalog is not None:
+                self.client.catalog.close()
+
+    def resolve(self, target: Target) -> str:
+        if isinstance(target, int):
+            problem = self.client.catalog.get_by_id(target) if self.client.catalog else None
+            if not problem:
+                raise InvalidTargetError(target, "Problem not found in the catalog")
+            return problem["question_slug"]
+
+        from lantern.utils import extract_question_slug
+
+        target = target.strip()
+        slug = extract_question_slug(target)
+        if slug:
+            return slug
+        if SLUG_RE.match(target):
+            return target
+        raise InvalidTargetError(target, "Invalid LeetCode URL")
+
+    def wants_statement(self, slug: str) -> bool:
+        if self.client.offline:
+            return False
+        if not self._initialized and not StatementStore.default_path(self.root).exists():
+            return False
+        statements = self.initialize().statements
+        if statements is None:
+            return False
+        return self.client.refresh or slug not in statements
+
+    @traced()
+    async def fetch_statements(
+        self,
+        slugs: Iterable[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int = DEFAULT_CHUNK_CONCURRENCY,
+        on_result: Optional[Callable[[str, Optional[LeetCodeError]], None]] = None,
+    ) -> Dict[str, LeetCodeError]:
+        statements = self.initialize().create_statement_store()
+        errors: Dict[str, LeetCodeError] = {}
+        pending: List[Tuple[str, Dict, Dict]] = []
+        async for slug, outcome in self.client.iter_statements(
+            slugs, chunk_size, concurrency, self.session
+        ):
+            if isinstance(outcome, LeetCodeError):
+                errors[slug] = outcome
+            else:
+                pending.append((slug, outcome["problem"], outcome["statement"]))
+                if len(pending) >= chunk_size:
+                    statements.set_many(pending)
+                    pending = []
+            if on_result:
+                on_result(slug, errors.get(slug))
+        statements.set_many(pending)
+        return errors
+
+    async def fetch(self, target: Target) -> Dict:
+        return await self.client.fetch_problem_data(self.resolve(target), self.session)
+
+    @traced()
+    def scaffold(self, problem_data: Dict, language: str) -> Path:
+        fs_manager = self.initialize()
+        folder = fs_manager.ensure_question_folder(
+            problem_data["question_id"], problem_data["question_slug"]
+        )
+        fs_manager.ensure_question_readme(folder, problem_data)
+        fs_manager.ensure_solution_file(folder, language)
+        return folder
+
+    @traced()
+    def add_problem(self, problem_data: Dict, language: str) -> Path:
+        folder = self.scaffold(problem_data, language)
+        self.fs_manager.update_readme_table(problem_data, language)
+        return folder
+
+    @traced()
+    async def add(self, target: Target, language: str) -> AddResult:
+        from lantern.utils import parse_language
+
+        result = AddResult(target, parse_language(language))
+        try:
+            result.slug = self.resolve(target)
+            if self.wants_statement(result.slug):
+                if result.slug not in await self.fetch_statements([result.slug]):
+                    result.problem = self.fs_manager.statements.get_problem(result.slug)
+            if result.problem is None:
+                result.problem = await self.client.fetch_problem_data(result.slug, self.session)
+            result.folder = self.add_problem(result.problem, result.language)
+        except (LeetCodeError, InvalidTargetError, OSError) as e:
+            result.error = e
+        return result
+
+    @traced()
+    async def add_many(
+        self,
+        entries: Iterable[Tuple[Target, str]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int = DEFAULT_CHUNK_CONCURRENCY,
+        on_result: Optional[Callable[[AddResult], None]] = None,
+    ) -> List[AddResult]:
+        from lantern.utils import parse_language
+
+        results = [AddResult(target, parse_language(language)) for target, language in entries]
+        by_slug: Dict[str, List[AddResult]] = {}
+        for result in results:
+            try:
+                result.slug = self.resolve(result.target)
+            except InvalidTargetError as e:
+                result.error = e
+                if on_result:
+                    on_result(result)
+                continue
+            by_slug.setdefault(result.slug, []).append(result)
+
+        fs_manager = self.initialize()
+        table_updates: List[Tuple[Dict, str]] = []
+        async for slug, outcome in self._iter_problems(list(by_slug), chunk_size, concurrency):
+            for result in by_slug[slug]:
+                if isinstance(outcome, LeetCodeError):
+                    result.error = outcome
+                else:
+                    result.problem = outcome
+                    try:
+                        result.folder = self.scaffold(outcome, result.language)
+                        table_updates.append((outcome, result.language))
+                    except OSError as e:
+                        result.error = e
+                if on_result:
+                    on_result(result)
+
+        fs_manager.update_readme_table_many(table_updates)
+        return results
+
+    async def _iter_problems(
+        self, slugs: List[str], chunk_size: int, concurrency: int
+    ) -> AsyncIterator[Tuple[str, Union[Dict, LeetCodeError]]]:
+        missing_statements = [slug for slug in slugs if self.wants_statement(slug)]
+        if missing_statements:
+            errors = await self.fetch_statements(missing_statements, chunk_size, concurrency)
+            fetched = {slug for slug in missing_statements if slug not in errors}
+            for slug in fetched:
+                yield slug, self.fs_manager.statements.get_problem(slug)
+            slugs = [slug for slug in slugs if slug not in fetched]
+
+        async for slug, outcome in self.client.iter_many(
+            slugs, chunk_size, concurrency, self.session
+        ):
+            yield slug, outcome
+
+    def _run(self, coroutine: Awaitable[T]) -> T:
+        async def run_and_release() -> T:
+            try:
+                return await coroutine
+            finally:
+                if self._owns_client:
+                    await self.client.close()
+
+        return asyncio.run(run_and_release())
+
+    def add_sync(self, target: Target, language: str) -> AddResult:
+        return self._run(self.add(target, language))
+
+    def close_sync(self) -> None:
+        self._run(self.close())
+
+    def add_many_sync(
+        self,
+        entries: Iterable[Tuple[Target, str]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int = DEFAULT_CHUNK_CONCURRENCY,
+        on_result: Optional[Callable[[AddResult], None]] = None,
+    ) -> List[AddResult]:
+        return self._run(self.add_many(entries, chunk_size, concurrency, on_result))
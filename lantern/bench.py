@@ -0,0 +1,200 @@
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+from lantern.filesystem import FileSystemManager
+from lantern.table import TABLE_DIVIDER, TABLE_HEADER, render_row
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.25
+SCAFFOLD_SAMPLE = 200
+
+
+def make_problem(question_id: int) -> Dict:
+    return {
+        "question_id": str(question_id),
+        "question_title": f"Synthetic Problem {question_id}",
+        "question_slug": f"synthetic-problem-{question_id}",
+        "difficulty": ("Easy", "Medium", "Hard")[question_id % 3],
+        "topic_tags": "Array, Hash Table",
+    }
+
+
+def generate_repository(root: Path, count: int) -> FileSystemManager:
+    lines = ["# LeetCode Solutions", "", TABLE_HEADER, TABLE_DIVIDER]
+    for question_id in range(1, count + 1):
+        slug = f"synthetic-problem-{question_id}"
+        lines.append(render_row({
+            "question_id": question_id,
+            "title": f"Synthetic Problem {question_id}",
+            "url": f"https://leetcode.com/problems/{slug}/",
+            "solutions": [("Python", f"./problemset/{question_id:04d}-{slug}/solution.py")],
+            "tags": "Array, Hash Table",
+            "difficulty": ("Easy", "Medium", "Hard")[question_id % 3],
+        }))
+    lines.append("")
+    (root / "README.md").write_text("\n".join(lines))
+
+    manager = FileSystemManager(root)
+    manager.initialize()
+    return manager
+
+
+def measure(
+    func: Callable[[], object],
+    setup: Optional[Callable[[], None]] = None,
+    repeat: int = DEFAULT_REPEAT,
+    ops: int = 1,
+) -> Dict:
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    if setup:
+        setup()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    median = statistics.median(timings)
+    return {
+        "median_ms": median * 1000,
+        "ops_per_sec": ops / median if median else float("inf"),
+        "peak_kib": peak / 1024,
+    }
+
+
+def cold_manager(root: Path) -> FileSystemManager:
+    manager = FileSystemManager(root)
+    manager.initialize()
+    return manager
+
+
+def bench_size(root: Path, count: int, repeat: int) -> List[Dict]:
+    generate_repository(root, count)
+    readme_content = (root / "README.md").read_text()
+    results = []
+
+    def record(name: str, stats: Dict):
+        results.append({"name": name, "size": count, **stats})
+
+    record("find_table_in_readme", measure(
+        lambda: cold_manager(root).find_table_in_readme(), repeat=repeat
+    ))
+    record("parse_table_rows", measure(
+        lambda: cold_manager(root).parse_table_rows(), repeat=repeat
+    ))
+
+    def restore_readme():
+        (root / "README.md").write_text(readme_content)
+
+    new_problem = make_problem(count + 1)
+    record("update_readme_table", measure(
+        lambda: cold_manager(root).update_readme_table(new_problem, "python"),
+        setup=restore_readme,
+        repeat=repeat,
+    ))
+    restore_readme()
+
+    scaffold_ids = range(count + 1, count + 1 + SCAFFOLD_SAMPLE)
+
+    def clear_scaffold():
+        for question_id in scaffold_ids:
+            folder = root / "problemset" / f"{question_id:04d}-synthetic-problem-{question_id}"
+            if folder.exists():
+                for child in folder.iterdir():
+                    child.unlink()
+                folder.rmdir()
+
+    def scaffold():
+        manager = cold_manager(root)
+        for question_id in scaffold_ids:
+            problem_data = make_problem(question_id)
+            folder = manager.ensure_question_folder(
+                problem_data["question_id"], problem_data["question_slug"]
+            )
+            manager.ensure_question_readme(folder, problem_data)
+            manager.ensure_solution_file(folder, "python")
+
+    record("scaffold_folders", measure(
+        scaffold, setup=clear_scaffold, repeat=repeat, ops=SCAFFOLD_SAMPLE
+    ))
+    clear_scaffold()
+    return results
+
+
+def bench_cli_startup(repeat: int) -> Dict:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "import lantern.cli"], check=True)
+        timings.append(time.perf_counter() - start)
+
+    median = statistics.median(timings)
+    return {
+        "name": "cli_startup",
+        "size": 0,
+        "median_ms": median * 1000,
+        "ops_per_sec": 1 / median,
+        "peak_kib": None,
+    }
+
+
+def run_benchmarks(
+    sizes: Sequence[int] = DEFAULT_SIZES, repeat: int = DEFAULT_REPEAT, cli_startup: bool = True
+) -> List[Dict]:
+    results = []
+    for count in sizes:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            results.extend(bench_size(Path(tmpdir), count, repeat))
+    if cli_startup:
+        results.append(bench_cli_startup(repeat))
+    return results
+
+
+def save_baseline(results: List[Dict], path: Path):
+    path.write_text(json.dumps({"results": results}, indent=2) + "\n")
+
+
+def load_baseline(path: Path) -> List[Dict]:
+    return json.loads(path.read_text())["results"]
+
+
+def find_regressions(
+    results: List[Dict], baseline: List[Dict], threshold: float = DEFAULT_THRESHOLD
+) -> List[Dict]:
+    baseline_by_key = {(entry["name"], entry["size"]): entry for entry in baseline}
+    regressions = []
+    for result in results:
+        previous = baseline_by_key.get((result["name"], result["size"]))
+        if not previous:
+            continue
+        slowdown = result["median_ms"] / previous["median_ms"] - 1 if previous["median_ms"] else 0
+        if slowdown > threshold:
+            regressions.append({**result, "baseline_ms": previous["median_ms"], "slowdown": slowdown})
+    return regressions
+
+
+def format_results(results: List[Dict]) -> str:
+    lines = [f"{'benchmark':<24} {'size':>8} {'median ms':>12} {'ops/sec':>12} {'peak KiB':>10}"]
+    for result in results:
+        peak = f"{result['peak_kib']:.0f}" if result["peak_kib"] is not None else "-"
+        lines.append(
+            f"{result['name']:<24} {result['size']:>8} {result['median_ms']:>12.2f} "
+            f"{result['ops_per_sec']:>12.1f} {peak:>10}"
+        )
+    return "\n".join(lines)
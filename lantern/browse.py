@@ -0,0 +1,357 @@
+import asyncio
+import os
+import shlex
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from rich.cells import set_cell_size
+from rich.segment import Segment
+from rich.style import Style
+from textual import events, on, work
+from textual.app import ComposeResult, SuspendNotSupported
+from textual.binding import Binding
+from textual.containers import Center, Container, Vertical
+from textual.geometry import Size
+from textual.message import Message
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+from textual.widgets import Input, Label
+
+from lantern.filesystem import FileSystemManager
+from lantern.search import SearchIndex
+
+SEARCH_LIMIT = 200
+DIFFICULTY_ORDER = {"Easy": 0, "Medium": 1, "Hard": 2}
+COLUMNS = (
+    ("id", "#", 6),
+    ("title", "Title", 48),
+    ("difficulty", "Difficulty", 10),
+    ("languages", "Languages", 24),
+    ("tags", "Tags", 60),
+)
+COLUMN_GAP = 2
+
+HEADER_STYLE = Style(color="#89b4fa", bold=True)
+ROW_STYLE = Style(color="#cdd6f4")
+ZEBRA_STYLE = Style(color="#cdd6f4", bgcolor="#181825")
+CURSOR_STYLE = Style(color="#1e1e2e", bgcolor="#89b4fa")
+
+
+def load_rows(root: Path) -> List[Dict]:
+    manager = FileSystemManager(root)
+    manager.initialize()
+    try:
+        manager.create_search_index()
+        return manager.list_rows()
+    finally:
+        if manager.index is not None:
+            manager.index.close()
+        if manager.search is not None:
+            manager.search.close()
+
+
+def row_cells(row: Dict) -> Tuple[str, ...]:
+    return (
+        str(row["question_id"]),
+        row["title"],
+        row["difficulty"],
+        ", ".join(lang for lang, _ in row["solutions"]) or "-",
+        row["tags"],
+    )
+
+
+def sort_key(column: str):
+    if column == "id":
+        return lambda row: row["question_id"]
+    if column == "difficulty":
+        return lambda row: (DIFFICULTY_ORDER.get(row["difficulty"], len(DIFFICULTY_ORDER)), row["question_id"])
+    if column == "languages":
+        return lambda row: ([lang.lower() for lang, _ in row["solutions"]], row["question_id"])
+    return lambda row: (row[column].lower(), row["question_id"])
+
+
+def open_path(path: Path):
+    if sys.platform == "darwin":
+        command = ["open", str(path)]
+    elif os.name == "nt":
+        os.startfile(str(path))
+        return
+    else:
+        command = ["xdg-open", str(path)]
+    subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+class ProblemTable(ScrollView, can_focus=True):
+    BINDINGS = [
+        Binding("up", "cursor_up", show=False),
+        Binding("down", "cursor_down", show=False),
+        Binding("pageup", "page_up", show=False),
+        Binding("pagedown", "page_down", show=False),
+        Binding("home", "first", show=False),
+        Binding("end", "last", show=False),
+        Binding("enter", "select", show=False),
+    ]
+
+    class Selected(Message):
+        def __init__(self, row: Dict):
+            super().__init__()
+            self.row = row
+
+    class HeaderClicked(Message):
+        def __init__(self, column: str):
+            super().__init__()
+            self.column = column
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.all_rows: List[Dict] = []
+        self.rows: List[Dict] = []
+        self.by_id: Dict[int, Dict] = {}
+        self.cells: Dict[int, Tuple[str, ...]] = {}
+        self.widths = [width for _, _, width in COLUMNS]
+        self.cursor = 0
+
+    def set_rows(self, rows: List[Dict]):
+        self.all_rows = rows
+        self.by_id = {row["question_id"]: row for row in rows}
+        self.cells = {row["question_id"]: row_cells(row) for row in rows}
+        self.widths = [
+            max(len(label), min(cap, max((len(cells[i]) for cells in self.cells.values()), default=0)))
+            for i, (_, label, cap) in enumerate(COLUMNS)
+        ]
+        self.show(list(rows))
+
+    def show(self, rows: List[Dict]):
+        self.rows = rows
+        self.cursor = 0
+        self.scroll_to(y=0, animate=False)
+        self.virtual_size = Size(sum(self.widths) + COLUMN_GAP * len(self.widths), len(rows) + 1)
+        self.refresh()
+
+    def sort(self, column: str, reverse: bool = False):
+        current = self.current_row()
+        self.rows.sort(key=sort_key(column), reverse=reverse)
+        if current is not None:
+            self.cursor = next(i for i, row in enumerate(self.rows) if row is current)
+        self.scroll_to_cursor()
+        self.refresh()
+
+    def current_row(self) -> Optional[Dict]:
+        return self.rows[self.cursor] if self.rows else None
+
+    @property
+    def page_size(self) -> int:
+        return max(1, self.size.height - 1)
+
+    def format_line(self, cells: Tuple[str, ...], style: Style) -> Strip:
+        text = "".join(
+            set_cell_size(cell, width) + " " * COLUMN_GAP for cell, width in zip(cells, self.widths)
+        )
+        return Strip([Segment(text, style)], len(text))
+
+    def render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        width = self.size.width
+
+        if y == 0:
+            style = HEADER_STYLE
+            cells = tuple(label for _, label, _ in COLUMNS)
+        else:
+            index = scroll_y + y - 1
+            if index >= len(self.rows):
+                return Strip.blank(width)
+            if index == self.cursor:
+                style = CURSOR_STYLE
+            else:
+                style = ZEBRA_STYLE if index % 2 else ROW_STYLE
+            cells = self.cells[self.rows[index]["question_id"]]
+
+        return self.format_line(cells, style).crop_extend(scroll_x, scroll_x + width, style)
+
+    def move_cursor(self, position: int):
+        if not self.rows:
+            return
+        self.cursor = max(0, min(len(self.rows) - 1, position))
+        self.scroll_to_cursor()
+        self.refresh()
+
+    def scroll_to_cursor(self):
+        if self.cursor < self.scroll_y:
+            self.scroll_to(y=self.cursor, animate=False)
+        elif self.cursor >= self.scroll_y + self.page_size:
+            self.scroll_to(y=self.cursor - self.page_size + 1, animate=False)
+
+    def action_cursor_up(self):
+        self.move_cursor(self.cursor - 1)
+
+    def action_cursor_down(self):
+        self.move_cursor(self.cursor + 1)
+
+    def action_page_up(self):
+        self.move_cursor(self.cursor - self.page_size)
+
+    def action_page_down(self):
+        self.move_cursor(self.cursor + self.page_size)
+
+    def action_first(self):
+        self.move_cursor(0)
+
+    def action_last(self):
+        self.move_cursor(len(self.rows) - 1)
+
+    def action_select(self):
+        row = self.current_row()
+        if row is not None:
+            self.post_message(self.Selected(row))
+
+    def on_click(self, event: events.Click) -> None:
+        if event.y == 0:
+            x = event.x + self.scroll_x
+            for (key, _, _), width in zip(COLUMNS, self.widths):
+                if x < width + COLUMN_GAP:
+                    self.post_message(self.HeaderClicked(key))
+                    return
+                x -= width + COLUMN_GAP
+            return
+        self.move_cursor(self.scroll_y + event.y - 1)
+
+
+class BrowseScreen(Container):
+    BINDINGS = [
+        Binding("o", "open_folder", "Open folder"),
+        Binding("s", "cycle_sort", "Sort"),
+        Binding("r", "reverse_sort", "Reverse"),
+        Binding("slash", "focus_search", "Search"),
+    ]
+
+    def __init__(self, root_dir: Path, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.root_dir = root_dir
+        self.sort_column = "id"
+        self.sort_reverse = False
+        self.search_index: Optional[SearchIndex] = None
+
+    def compose(self) -> ComposeResult:
+        with Vertical(classes="browse-vertical"):
+            yield Label("Loading problems...", classes="browse-status")
+            yield Input(placeholder="/ to search by title, slug, number or tag", classes="browse-search")
+            yield ProblemTable(classes="browse-table")
+            with Center():
+                yield Label(
+                    "enter: open solution, o: open folder, s: sort, r: reverse, /: search, esc: back",
+                    classes="footer",
+                )
+
+    def on_mount(self) -> None:
+        self.query_one(ProblemTable).focus()
+        self.load()
+
+    @work(exclusive=True, group="browse-load")
+    async def load(self) -> None:
+        rows = await asyncio.to_thread(load_rows, self.root_dir)
+        table = self.query_one(ProblemTable)
+        table.set_rows(rows)
+        self.search_index = SearchIndex(SearchIndex.default_path(self.root_dir))
+        query = self.query_one(".browse-search", Input).value
+        if query.strip():
+            self.apply_search(query)
+        else:
+            table.sort(self.sort_column, self.sort_reverse)
+            self.update_status()
+
+    def update_status(self) -> None:
+        table = self.query_one(ProblemTable)
+        query = self.query_one(".browse-search", Input).value.strip()
+        if query:
+            self.query_one(".browse-status", Label).update(
+                f"{len(table.rows)} of {len(table.all_rows)} problems match {query!r}"
+            )
+            return
+
+        labels = {key: label for key, label, _ in COLUMNS}
+        direction = "descending" if self.sort_reverse else "ascending"
+        self.query_one(".browse-status", Label).update(
+            f"{len(table.rows)} problems, sorted by {labels[self.sort_column]} ({direction})"
+        )
+
+    def apply_search(self, query: str) -> None:
+        table = self.query_one(ProblemTable)
+        if not query.strip():
+            table.show(list(table.all_rows))
+            table.sort(self.sort_column, self.sort_reverse)
+        elif self.search_index is not None:
+            results = self.search_index.search(query, SEARCH_LIMIT)
+            table.show([
+                table.by_id[result["question_id"]]
+                for result in results
+                if result["question_id"] in table.by_id
+            ])
+        self.update_status()
+
+    @on(Input.Changed, ".browse-search")
+    def handle_search_changed(self, event: Input.Changed) -> None:
+        self.apply_search(event.value)
+
+    @on(Input.Submitted, ".browse-search")
+    def handle_search_submitted(self, event: Input.Submitted) -> None:
+        self.query_one(ProblemTable).focus()
+
+    def action_focus_search(self) -> None:
+        self.query_one(".browse-search", Input).focus()
+
+    def on_unmount(self) -> None:
+        if self.search_index is not None:
+            self.search_index.close()
+
+    def sort_by(self, column: str, reverse: bool) -> None:
+        self.sort_column = column
+        self.sort_reverse = reverse
+        self.query_one(ProblemTable).sort(column, reverse)
+        self.update_status()
+
+    @on(ProblemTable.HeaderClicked)
+    def handle_header_clicked(self, event: ProblemTable.HeaderClicked) -> None:
+        self.sort_by(event.column, not self.sort_reverse if event.column == self.sort_column else False)
+
+    def action_cycle_sort(self) -> None:
+        keys = [key for key, _, _ in COLUMNS]
+        self.sort_by(keys[(keys.index(self.sort_column) + 1) % len(keys)], False)
+
+    def action_reverse_sort(self) -> None:
+        self.sort_by(self.sort_column, not self.sort_reverse)
+
+    def selected_solution(self) -> Optional[Path]:
+        row = self.query_one(ProblemTable).current_row()
+        if not row or not row["solutions"]:
+            return None
+        return (self.root_dir / row["solutions"][0][1]).resolve()
+
+    def action_open_folder(self) -> None:
+        solution = self.selected_solution()
+        if solution is None:
+            return
+        try:
+            open_path(solution.parent)
+        except OSError as e:
+            self.notify(f"Could not open folder: {e}", severity="error")
+
+    @on(ProblemTable.Selected)
+    def handle_row_selected(self, event: ProblemTable.Selected) -> None:
+        self.action_open_solution()
+
+    def action_open_solution(self) -> None:
+        solution = self.selected_solution()
+        if solution is None:
+            return
+
+        editor = os.environ.get("VISUAL") or os.environ.get("EDITOR")
+        try:
+            if editor:
+                with self.app.suspend():
+                    subprocess.run([*shlex.split(editor), str(solution)])
+            else:
+                open_path(solution)
+        except (OSError, SuspendNotSupported) as e:
+            self.notify(f"Could not open solution: {e}", severity="error")
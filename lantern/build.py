@@ -0,0 +1,161 @@
+import functools
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+BUILD_DIRNAME = "build"
+DEFAULT_BUILD_CACHE_MB = 256
+COMPILE_TIMEOUT = 120.0
+
+COMPILERS = {
+    "cpp": ("g++", ["-O2", "-std=c++17"]),
+    "go": ("go", ["build"]),
+    "java": ("javac", []),
+}
+VERSION_ARGS = {"g++": ["--version"], "go": ["version"], "javac": ["-version"]}
+
+JAVA_CLASS_RE = re.compile(r"^\s*(?:public\s+)?(?:final\s+)?class\s+(\w+)", re.MULTILINE)
+
+
+class CompileError(Exception):
+    pass
+
+
+class ToolchainMissingError(CompileError):
+    pass
+
+
+@functools.lru_cache(maxsize=None)
+def compiler_version(compiler: str) -> str:
+    if shutil.which(compiler) is None:
+        raise ToolchainMissingError(f"{compiler} is not installed")
+    completed = subprocess.run(
+        [compiler, *VERSION_ARGS.get(compiler, ["--version"])], capture_output=True, text=True
+    )
+    output = (completed.stdout or completed.stderr).strip()
+    return output.splitlines()[0] if output else compiler
+
+
+def java_class_name(source: Path) -> str:
+    match = JAVA_CLASS_RE.search(source.read_text())
+    if not match:
+        raise CompileError("No class found in solution.java")
+    return match.group(1)
+
+
+def compile_into(language: str, source: Path, output_dir: Path):
+    compiler, flags = COMPILERS[language]
+    if shutil.which(compiler) is None:
+        raise ToolchainMissingError(f"{compiler} is not installed")
+
+    if language == "java":
+        command = [compiler, *flags, "-d", str(output_dir), str(source)]
+    else:
+        command = [compiler, *flags, "-o", str(output_dir / "solution"), str(source)]
+
+    completed = subprocess.run(command, capture_output=True, text=True, timeout=COMPILE_TIMEOUT)
+    if completed.returncode != 0:
+        raise CompileError(completed.stderr.strip() or completed.stdout.strip())
+
+
+def run_command(language: str, source: Path, output_dir: Path) -> List[str]:
+    if language == "java":
+        return ["java", "-cp", str(output_dir), java_class_name(source)]
+    return [str(output_dir / "solution")]
+
+
+def compile_solution(language: str, source: Path, workdir: Path) -> List[str]:
+    if language == "python":
+        return [sys.executable, str(source)]
+    if language not in COMPILERS:
+        raise CompileError(f"Unsupported language: {language}")
+
+    compile_into(language, source, workdir)
+    return run_command(language, source, workdir)
+
+
+def directory_size(path: Path) -> int:
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            try:
+                total += os.lstat(os.path.join(dirpath, filename)).st_size
+            except OSError:
+                continue
+    return total
+
+
+class BuildCache:
+    def __init__(self, path: Path, max_bytes: int = DEFAULT_BUILD_CACHE_MB * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def default_path(cls, root: Path) -> Path:
+        from lantern.utils import get_state_dir
+
+        return get_state_dir(root) / BUILD_DIRNAME
+
+    def key(self, language: str, source: Path) -> str:
+        from lantern.utils import content_digest
+
+        compiler, flags = COMPILERS[language]
+        header = "\0".join([language, compiler_version(compiler), *flags]).encode()
+        return content_digest(header + b"\0" + source.read_bytes())
+
+    def build(self, language: str, source: Path) -> Tuple[List[str], bool]:
+        if language == "python":
+            return [sys.executable, str(source)], True
+        if language not in COMPILERS:
+            raise CompileError(f"Unsupported language: {language}")
+
+        entry = self.path / self.key(language, source)
+        if entry.is_dir():
+            now = time.time()
+            os.utime(entry, (now, now))
+            return run_command(language, source, entry), True
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=".tmp-", dir=self.path))
+        try:
+            compile_into(language, source, staging)
+            try:
+                os.rename(staging, entry)
+            except OSError:
+                if not entry.is_dir():
+                    raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        return run_command(language, source, entry), False
+
+    def entries(self) -> List[Tuple[float, int, Path]]:
+        if not self.path.is_dir():
+            return []
+        entries = []
+        with os.scandir(self.path) as children:
+            for child in children:
+                if not child.is_dir() or child.name.startswith(".tmp-"):
+                    continue
+                try:
+                    entries.append((child.stat().st_mtime, directory_size(Path(child.path)), Path(child.path)))
+                except OSError:
+                    continue
+        return entries
+
+    def prune(self) -> int:
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+            removed += 1
+        return removed
@@ -0,0 +1,56 @@
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+DEFAULT_TTL = 7 * 24 * 60 * 60
+
+
+class ProblemCache:
+    def __init__(self, path: Optional[Path] = None, ttl: float = DEFAULT_TTL):
+        from lantern.utils import get_cache_dir
+
+        self.path = path or get_cache_dir() / "problems.db"
+        self.ttl = ttl
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS problems ("
+                "slug TEXT PRIMARY KEY, data TEXT NOT NULL, fetched_at REAL NOT NULL)"
+            )
+        return self._conn
+
+    def get(self, slug: str, allow_stale: bool = False) -> Optional[Dict]:
+        row = self._connect().execute(
+            "SELECT data, fetched_at FROM problems WHERE slug = ?", (slug,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        data, fetched_at = row
+        if not allow_stale and time.time() - fetched_at > self.ttl:
+            return None
+        return json.loads(data)
+
+    def set(self, slug: str, problem_data: Dict):
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO problems (slug, data, fetched_at) VALUES (?, ?, ?)",
+                (slug, json.dumps(problem_data), time.time()),
+            )
+
+    def delete(self, slug: str):
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM problems WHERE slug = ?", (slug,))
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
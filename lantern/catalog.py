@@ -0,0 +1,132 @@
+import sqlite3
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from lantern.leetcode import LeetCodeClient
+
+DEFAULT_PAGE_SIZE = 100
+
+
+class Catalog:
+    def __init__(self, path: Optional[Path] = None):
+        from lantern.utils import get_cache_dir
+
+        self.path = path or get_cache_dir() / "catalog.db"
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path)
+            with self._conn:
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS questions ("
+                    "slug TEXT PRIMARY KEY, frontend_id INTEGER NOT NULL, title TEXT NOT NULL, "
+                    "difficulty TEXT NOT NULL, topic_tags TEXT NOT NULL, paid_only INTEGER NOT NULL)"
+                )
+                self._conn.execute(
+                    "CREATE INDEX IF NOT EXISTS questions_frontend_id ON questions (frontend_id)"
+                )
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS sync_state (key TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+                )
+        return self._conn
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM questions").fetchone()[0]
+
+    def _row_to_problem(self, row: Optional[Tuple]) -> Optional[Dict]:
+        if row is None:
+            return None
+        slug, frontend_id, title, difficulty, topic_tags = row
+        return {
+            "question_id": str(frontend_id),
+            "question_title": title,
+            "question_slug": slug,
+            "difficulty": difficulty,
+            "topic_tags": topic_tags,
+        }
+
+    def get_by_slug(self, slug: str) -> Optional[Dict]:
+        row = self._connect().execute(
+            "SELECT slug, frontend_id, title, difficulty, topic_tags FROM questions WHERE slug = ?",
+            (slug,),
+        ).fetchone()
+        return self._row_to_problem(row)
+
+    def get_by_id(self, question_id: int) -> Optional[Dict]:
+        row = self._connect().execute(
+            "SELECT slug, frontend_id, title, difficulty, topic_tags FROM questions WHERE frontend_id = ?",
+            (int(question_id),),
+        ).fetchone()
+        return self._row_to_problem(row)
+
+    def tag_counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for (topic_tags,) in self._connect().execute("SELECT topic_tags FROM questions"):
+            for tag in topic_tags.split(","):
+                tag = tag.strip()
+                if tag:
+                    counts[tag] = counts.get(tag, 0) + 1
+        return counts
+
+    def store_page(self, questions: List[Dict], next_skip: int, total: int):
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO questions "
+                "(slug, frontend_id, title, difficulty, topic_tags, paid_only) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        question["question_slug"],
+                        int(question["question_id"]),
+                        question["question_title"],
+                        question["difficulty"],
+                        question["topic_tags"],
+                        int(question.get("paid_only", False)),
+                    )
+                    for question in questions
+                ],
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)",
+                [("next_skip", next_skip), ("total", total)],
+            )
+
+    def sync_progress(self) -> Tuple[int, Optional[int]]:
+        state = dict(self._connect().execute("SELECT key, value FROM sync_state").fetchall())
+        return state.get("next_skip", 0), state.get("total")
+
+    def reset_progress(self):
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM sync_state")
+
+    async def sync(
+        self,
+        client: "LeetCodeClient",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        restart: bool = False,
+        on_page: Optional[Callable[[int, int], None]] = None,
+    ) -> None:
+        if restart:
+            self.reset_progress()
+
+        skip, total = self.sync_progress()
+        while total is None or skip < total:
+            total, questions = await client.fetch_problemset_page(skip, page_size)
+            if not questions:
+                break
+
+            skip += len(questions)
+            self.store_page(questions, skip, total)
+            if on_page:
+                on_page(skip, total)
+
+        self.reset_progress()
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
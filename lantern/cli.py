@@ -1,80 +1,877 @@
 import argparse
 import asyncio
 import sys
+import time
 from pathlib import Path
+from typing import Callable, Dict, List, Optional, TextIO, Tuple
 
-import aiohttp
-
+from lantern import IMPORT_STARTED_NS
+from lantern.api import AddResult, Lantern
+from lantern.cache import ProblemCache
+from lantern.catalog import DEFAULT_PAGE_SIZE, Catalog
 from lantern.filesystem import FileSystemManager
-from lantern.leetcode import LeetCodeClient
-from lantern.tui import run_tui
-from lantern.utils import extract_question_slug
-
+from lantern.leetcode import DEFAULT_CHUNK_CONCURRENCY, DEFAULT_CHUNK_SIZE, LeetCodeClient, LeetCodeError
+from lantern.trace import span
+from lantern.utils import extract_question_slug, parse_language
 
-def parse_language(lang: str) -> str:
-    lang_map = {
-        "py": "python",
-        "python": "python",
-        "go": "go",
-        "java": "java",
-        "cpp": "cpp",
-        "c++": "cpp",
-    }
-    return lang_map.get(lang.lower(), "python")
 
-
-async def process_cli(url: str, language: str, root_dir: Path) -> None:
+async def process_cli(
+    url: str,
+    language: str,
+    root_dir: Path,
+    leetcode_client: Optional[LeetCodeClient] = None,
+) -> None:
     slug = extract_question_slug(url)
     if not slug:
         print("Error: Invalid LeetCode URL", file=sys.stderr)
         sys.exit(1)
 
-    fs_manager = FileSystemManager(root_dir)
-    fs_manager.initialize()
-
-    leetcode_client = LeetCodeClient()
-    async with aiohttp.ClientSession() as session:
-        problem_data = await leetcode_client.fetch_problem_data(session, slug)
+    leetcode_client = leetcode_client or LeetCodeClient(cache=ProblemCache())
+    with span("process_cli", slug=slug, language=language):
+        async with leetcode_client:
+            result = await Lantern(root_dir, leetcode_client).add(slug, language)
 
-    if not problem_data:
-        print("Error: Failed to fetch problem data", file=sys.stderr)
+    if isinstance(result.error, LeetCodeError):
+        print(f"Error: Failed to fetch problem data: {result.error}", file=sys.stderr)
+        sys.exit(1)
+    if result.error is not None:
+        print(f"Error: {result.error}", file=sys.stderr)
         sys.exit(1)
 
-    question_folder = fs_manager.ensure_question_folder(
-        problem_data["question_id"], problem_data["question_slug"]
-    )
-    fs_manager.ensure_question_readme(question_folder, problem_data)
-    fs_manager.ensure_solution_file(question_folder, language)
-    fs_manager.update_readme_table(problem_data, language)
+    print(f"Successfully added problem: {result.problem['question_title']}")
 
-    print(f"Successfully added problem: {problem_data['question_title']}")
 
+def parse_batch_entries(stream: TextIO) -> List[Tuple[str, str]]:
+    entries = []
+    for line_number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
 
-def main() -> None:
+        parts = line.replace(",", " ").split()
+        if len(parts) != 2:
+            raise ValueError(f"line {line_number}: expected '<url> <language>', got {line!r}")
+
+        url, lang = parts
+        entries.append((url, parse_language(lang)))
+    return entries
+
+
+async def process_batch(
+    entries: List[Tuple[str, str]],
+    root_dir: Path,
+    concurrency: int = 8,
+    leetcode_client: Optional[LeetCodeClient] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    leetcode_client = leetcode_client or LeetCodeClient(cache=ProblemCache())
+    reported = set()
+
+    def report(result: AddResult) -> None:
+        if result.slug is None:
+            print(f"Error: Invalid LeetCode URL: {result.target}", file=sys.stderr)
+        elif isinstance(result.error, LeetCodeError):
+            if result.slug not in reported:
+                print(
+                    f"Error: Failed to fetch problem data for {result.target}: {result.error}",
+                    file=sys.stderr,
+                )
+        elif result.error is not None:
+            print(f"Error: Failed to add {result.target}: {result.error}", file=sys.stderr)
+        elif result.slug not in reported:
+            print(f"Added problem: {result.problem['question_title']}")
+        if result.slug is not None:
+            reported.add(result.slug)
+
+    async with leetcode_client:
+        results = await Lantern(root_dir, leetcode_client).add_many(
+            entries, chunk_size=chunk_size, concurrency=concurrency, on_result=report
+        )
+
+    added = sum(result.ok for result in results)
+    print(f"Successfully added {added} of {len(entries)} problems")
+    return len(results) - added
+
+
+async def sync_catalog(
+    catalog: Catalog,
+    leetcode_client: LeetCodeClient,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    restart: bool = False,
+) -> bool:
+    def report(synced: int, total: int) -> None:
+        print(f"\rSynced {synced}/{total} problems", end="", flush=True)
+
+    try:
+        async with leetcode_client:
+            await catalog.sync(
+                leetcode_client, page_size=page_size, restart=restart, on_page=report
+            )
+    except LeetCodeError as e:
+        print()
+        print(f"Error: Catalog sync interrupted ({e}), run it again to resume", file=sys.stderr)
+        return False
+    print()
+
+    print(f"Catalog contains {len(catalog)} problems")
+    return True
+
+
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="TUI to manage Leetcode solution indexes.")
-    parser.add_argument(
+    target_group = parser.add_mutually_exclusive_group()
+    target_group.add_argument(
         "--url",
         type=str,
         help="LeetCode problem URL",
     )
+    target_group.add_argument(
+        "--id",
+        type=int,
+        dest="question_id",
+        help="LeetCode problem number (requires a synced catalog)",
+    )
     parser.add_argument(
         "-l",
         "--language",
         type=str,
         help="Programming language (py/cpp/java/go)",
     )
+    parser.add_argument(
+        "--batch",
+        type=str,
+        metavar="FILE",
+        help="File with one '<url> <language>' pair per line ('-' reads stdin)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Maximum number of concurrent requests in batch mode (default: 8)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Problems requested per GraphQL query in batch mode (default: {DEFAULT_CHUNK_SIZE})",
+    )
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached problem metadata and fetch it again",
+    )
+    cache_group.add_argument(
+        "--offline",
+        action="store_true",
+        help="Only use cached problem metadata, never touch the network",
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Do not forward the request to a running 'lantern serve' daemon",
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        metavar="FILE",
+        help="Write timing spans and counters to FILE in Chrome trace-event format",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Report per-module import cost of the headless CLI and exit",
+    )
+
+    subparsers = parser.add_subparsers(dest="command")
 
+    catalog_parser = subparsers.add_parser("catalog", help="Manage the local problem catalog")
+    catalog_subparsers = catalog_parser.add_subparsers(dest="catalog_command", required=True)
+    sync_parser = catalog_subparsers.add_parser(
+        "sync", help="Download the full problem list into the local catalog"
+    )
+    sync_parser.add_argument(
+        "--page-size",
+        type=int,
+        default=DEFAULT_PAGE_SIZE,
+        help=f"Problems requested per page (default: {DEFAULT_PAGE_SIZE})",
+    )
+    sync_parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Start from the first page instead of resuming an interrupted sync",
+    )
+
+    index_parser = subparsers.add_parser(
+        "index", help="Manage the structured problem index (.lantern/index.db)"
+    )
+    index_subparsers = index_parser.add_subparsers(dest="index_command", required=True)
+    index_subparsers.add_parser(
+        "import", help="Build the index from the table in README.md"
+    )
+    index_subparsers.add_parser(
+        "render", help="Re-render the README.md table from the index"
+    )
+
+    verify_parser = subparsers.add_parser(
+        "verify", help="Report drift between the README table and the problemset folder"
+    )
+    rebuild_parser = subparsers.add_parser(
+        "rebuild", help="Regenerate the README table from the problemset folder"
+    )
+    for reconcile_parser in (verify_parser, rebuild_parser):
+        reconcile_parser.add_argument(
+            "--workers",
+            type=int,
+            help="Threads used to scan problem folders (default: based on CPU count)",
+        )
+
+    watch_parser = subparsers.add_parser(
+        "watch", help="Keep the README table in sync with the problemset folder"
+    )
+    watch_parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="Poll the filesystem instead of using inotify",
+    )
+    watch_parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="Polling interval in seconds (default: 1.0)",
+    )
+    watch_parser.add_argument(
+        "--debounce",
+        type=float,
+        default=0.3,
+        help="Seconds of quiet before a burst of changes is applied (default: 0.3)",
+    )
+
+    stats_parser = subparsers.add_parser(
+        "stats", help="Show totals by difficulty, language and tag"
+    )
+    stats_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print machine-readable JSON",
+    )
+
+    shard_parser = subparsers.add_parser(
+        "shard", help="Split the README table into pages, or merge the pages back"
+    )
+    shard_parser.add_argument(
+        "--by",
+        choices=["range", "difficulty", "none"],
+        required=True,
+        help="Split by id range or by difficulty; 'none' restores a single table",
+    )
+    shard_parser.add_argument(
+        "--size",
+        type=int,
+        default=500,
+        help="Problems per page when splitting by id range (default: 500)",
+    )
+
+    search_parser = subparsers.add_parser(
+        "search", help="Fuzzy-search solved problems by title, slug, number or tag"
+    )
+    search_parser.add_argument("query", nargs="+", help="Search terms")
+    search_parser.add_argument(
+        "-n",
+        "--limit",
+        type=int,
+        default=20,
+        help="Maximum number of results (default: 20)",
+    )
+    search_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print machine-readable JSON",
+    )
+
+    statements_parser = subparsers.add_parser(
+        "statements", help="Manage the local store of full problem statements"
+    )
+    statements_subparsers = statements_parser.add_subparsers(
+        dest="statements_command", required=True
+    )
+    fetch_parser = statements_subparsers.add_parser(
+        "fetch", help="Download statements, hints and examples for every problem in README.md"
+    )
+    fetch_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Problems requested per GraphQL query (default: {DEFAULT_CHUNK_SIZE})",
+    )
+    fetch_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CHUNK_CONCURRENCY,
+        help=f"Queries in flight at once (default: {DEFAULT_CHUNK_CONCURRENCY})",
+    )
+    render_parser = statements_subparsers.add_parser(
+        "render", help="Regenerate problem READMEs from the statement store without the network"
+    )
+    render_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Also overwrite problem READMEs that were edited by hand",
+    )
+    statements_subparsers.add_parser("status", help="Show how much the statement store holds")
+
+    test_parser = subparsers.add_parser(
+        "test", help="Run solutions against the test cases in each problem's tests.json"
+    )
+    test_parser.add_argument(
+        "question_ids",
+        type=int,
+        nargs="*",
+        metavar="ID",
+        help="Problem numbers to test (default: all)",
+    )
+    test_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Worker processes (default: number of CPUs)",
+    )
+    test_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=5.0,
+        help="Seconds allowed per test case (default: 5)",
+    )
+    test_parser.add_argument(
+        "--memory",
+        type=int,
+        default=512,
+        help="Memory limit per test case in MiB (default: 512)",
+    )
+    test_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-run every solution instead of skipping unchanged ones",
+    )
+    test_parser.add_argument(
+        "--build-cache-size",
+        type=int,
+        default=256,
+        metavar="MB",
+        help="Size cap for compiled artifacts in .lantern/build, 0 disables the cache (default: 256)",
+    )
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="Keep a warm daemon on a Unix socket that CLI invocations forward to"
+    )
+    serve_action = serve_parser.add_mutually_exclusive_group()
+    serve_action.add_argument(
+        "--stop",
+        action="store_true",
+        help="Stop the daemon serving this repository",
+    )
+    serve_action.add_argument(
+        "--status",
+        action="store_true",
+        help="Report whether a daemon is serving this repository",
+    )
+    serve_parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        metavar="SECONDS",
+        help="Exit after this many seconds without requests",
+    )
+
+    bench_parser = subparsers.add_parser(
+        "bench", help="Benchmark README and folder operations on synthetic repositories"
+    )
+    bench_parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000],
+        help="Number of problems in each synthetic repository (default: 1000 10000 100000)",
+    )
+    bench_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Timed runs per benchmark (default: 5)",
+    )
+    bench_parser.add_argument(
+        "--save",
+        type=Path,
+        metavar="FILE",
+        help="Write the results to FILE as a JSON baseline",
+    )
+    bench_parser.add_argument(
+        "--baseline",
+        type=Path,
+        metavar="FILE",
+        help="Compare against a saved baseline and fail on regressions",
+    )
+    bench_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown against the baseline before failing (default: 0.25)",
+    )
+
+    return parser
+
+
+def run_serve_command(args: argparse.Namespace, root_dir: Path) -> None:
+    from lantern.daemon import PING_TIMEOUT, DaemonError, LanternDaemon, socket_path, try_request
+
+    if args.stop or args.status:
+        try:
+            response = try_request(
+                root_dir, {"command": "stop" if args.stop else "ping"}, PING_TIMEOUT
+            )
+        except DaemonError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        if response is None:
+            print(f"No daemon is serving {root_dir}", file=sys.stderr)
+            sys.exit(1)
+        print(response["message"])
+        return
+
+    daemon = LanternDaemon(root_dir, idle_timeout=args.idle_timeout)
+    print(f"Serving {root_dir} on {socket_path(root_dir)}")
+    try:
+        asyncio.run(daemon.serve())
+    except DaemonError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def forward_to_daemon(root_dir: Path, request: Dict) -> bool:
+    from lantern.daemon import DaemonError, try_request
+
+    try:
+        response = try_request(root_dir, request)
+    except DaemonError as e:
+        print(f"Error: {e}; the daemon may still finish the request", file=sys.stderr)
+        sys.exit(1)
+    if response is None:
+        return False
+    if response["status"] != "ok":
+        print(f"Error: {response['message']}", file=sys.stderr)
+        sys.exit(1)
+    print(response["message"])
+    return True
+
+
+def run_bench_command(args: argparse.Namespace) -> None:
+    from lantern.bench import (
+        find_regressions,
+        format_results,
+        load_baseline,
+        run_benchmarks,
+        save_baseline,
+    )
+
+    results = run_benchmarks(args.sizes, args.repeat)
+    print(format_results(results))
+
+    if args.save:
+        save_baseline(results, args.save)
+        print(f"Saved baseline to {args.save}")
+
+    if args.baseline:
+        regressions = find_regressions(results, load_baseline(args.baseline), args.threshold)
+        for regression in regressions:
+            print(
+                f"Regression: {regression['name']} (size {regression['size']}) took "
+                f"{regression['median_ms']:.2f} ms vs {regression['baseline_ms']:.2f} ms "
+                f"(+{regression['slowdown']:.0%})",
+                file=sys.stderr,
+            )
+        if regressions:
+            sys.exit(1)
+
+
+def make_metadata_lookup() -> Callable[[str], Optional[Dict]]:
+    cache = ProblemCache()
+    catalog = Catalog()
+
+    def lookup(slug: str) -> Optional[Dict]:
+        return cache.get(slug, allow_stale=True) or catalog.get_by_slug(slug)
+
+    return lookup
+
+
+def run_reconcile_command(command: str, root_dir: Path, workers: Optional[int]) -> None:
+    from lantern.rebuild import apply_report, reconcile
+
+    fs_manager = FileSystemManager(root_dir)
+    fs_manager.initialize()
+    lookup = make_metadata_lookup()
+
+    report = reconcile(fs_manager, lookup, workers)
+    for label, question_ids in (
+        ("Missing on disk", report.missing),
+        ("Not in table", report.orphaned),
+        ("Mismatched solutions", report.mismatched),
+    ):
+        if question_ids:
+            print(f"{label} ({len(question_ids)}): {', '.join(map(str, question_ids))}")
+
+    if command == "rebuild":
+        apply_report(fs_manager, report)
+        print(f"Rebuilt table with {len(report.rows)} problems")
+    elif report.clean:
+        print(f"Table matches {len(report.rows)} problem folders")
+    else:
+        sys.exit(1)
+
+
+def run_watch_command(args: argparse.Namespace, root_dir: Path) -> None:
+    from lantern.rebuild import DriftReport
+    from lantern.watch import watch
+
+    fs_manager = FileSystemManager(root_dir)
+    fs_manager.initialize()
+
+    def report_update(report: DriftReport) -> None:
+        for label, question_ids in (
+            ("Added", report.orphaned),
+            ("Updated", report.mismatched),
+            ("Removed", report.missing),
+        ):
+            if question_ids:
+                print(f"{label}: {', '.join(map(str, question_ids))}", flush=True)
+
+    print(f"Watching {fs_manager.solutions_folder} (Ctrl-C to stop)", flush=True)
+    try:
+        watch(
+            fs_manager,
+            make_metadata_lookup(),
+            debounce=args.debounce,
+            poll=args.poll,
+            interval=args.interval,
+            on_update=report_update,
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+def run_stats_command(as_json: bool, root_dir: Path) -> None:
+    import json
+
+    from lantern.stats import format_summary
+
+    fs_manager = FileSystemManager(root_dir)
+    fs_manager.initialize()
+    summary = fs_manager.load_stats().summary(Catalog().tag_counts())
+
+    if as_json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print(format_summary(summary))
+
+
+def run_shard_command(args: argparse.Namespace, root_dir: Path) -> None:
+    from lantern.shards import SHARD_DIRNAME, ShardLayout
+
+    if args.size < 1:
+        print("Error: --size must be at least 1", file=sys.stderr)
+        sys.exit(1)
+
+    fs_manager = FileSystemManager(root_dir)
+    fs_manager.initialize()
+    layout = None if args.by == "none" else ShardLayout(args.by, args.size)
+    fs_manager.set_shard_layout(layout)
+
+    table = fs_manager.load_table()
+    if layout is None:
+        print(f"README.md now holds all {len(table)} problems in a single table")
+    else:
+        print(f"Split {len(table)} problems into {len(table.names)} pages under {SHARD_DIRNAME}/")
+
+
+def run_search_command(args: argparse.Namespace, root_dir: Path) -> None:
+    import json
+
+    fs_manager = FileSystemManager(root_dir)
+    fs_manager.initialize()
+    results = fs_manager.create_search_index().search(" ".join(args.query), args.limit)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    if not results:
+        print("No matches")
+        sys.exit(1)
+    for result in results:
+        print(
+            f"{result['question_id']:>5}  {result['title']:<48} {result['difficulty']:<7} {result['tags']}"
+        )
+
+
+def run_statements_command(
+    args: argparse.Namespace, root_dir: Path, leetcode_client: LeetCodeClient
+) -> None:
+    api = Lantern(root_dir, leetcode_client)
+    fs_manager = api.initialize()
+
+    if args.statements_command == "fetch":
+        if args.concurrency < 1 or args.chunk_size < 1:
+            print("Error: --concurrency and --chunk-size must be at least 1", file=sys.stderr)
+            sys.exit(1)
+        slugs = [extract_question_slug(row["url"]) for row in fs_manager.list_rows()]
+        slugs = [slug for slug in slugs if slug]
+        if not leetcode_client.refresh:
+            slugs = fs_manager.create_statement_store().missing(slugs)
+
+        fetched = 0
+
+        def report(slug: str, error: Optional[LeetCodeError]) -> None:
+            nonlocal fetched
+            if error is not None:
+                print(f"\nError: Failed to fetch statement for {slug}: {error}", file=sys.stderr)
+                return
+            fetched += 1
+            print(f"\rFetched {fetched}/{len(slugs)} statements", end="", flush=True)
+
+        async def fetch() -> Dict[str, LeetCodeError]:
+            async with leetcode_client:
+                return await api.fetch_statements(
+                    slugs, args.chunk_size, args.concurrency, on_result=report
+                )
+
+        errors = asyncio.run(fetch()) if slugs else {}
+        if slugs:
+            print()
+        summary = fs_manager.render_question_readmes()
+        print(f"Stored {fetched} new statements, rendered {summary['written']} problem READMEs")
+        if summary["edited"]:
+            print(
+                f"Skipped {summary['edited']} edited problem READMEs, "
+                "run 'lantern statements render --force' to overwrite them"
+            )
+        if errors:
+            sys.exit(1)
+        return
+
+    if fs_manager.statements is None:
+        print("Error: No statement store found, run 'lantern statements fetch' first", file=sys.stderr)
+        sys.exit(1)
+
+    if args.statements_command == "render":
+        summary = fs_manager.render_question_readmes(args.force)
+        print(
+            f"Rendered {summary['written']} problem READMEs "
+            f"({summary['unchanged']} unchanged, {summary['missing']} without a stored statement)"
+        )
+        if summary["edited"]:
+            print(
+                f"Skipped {summary['edited']} edited problem READMEs, use --force to overwrite them"
+            )
+    elif args.statements_command == "status":
+        usage = fs_manager.statements.usage()
+        print(
+            f"{usage['statements']} statements in {usage['blobs']} blobs, "
+            f"{usage['stored_bytes'] / 1024:.1f} KiB stored "
+            f"({usage['raw_bytes'] / 1024:.1f} KiB uncompressed)"
+        )
+
+
+def run_test_command(args: argparse.Namespace, root_dir: Path) -> None:
+    from lantern.build import BuildCache
+    from lantern.runner import RESULTS_FILENAME, ResultCache, discover_solutions, run_tests
+    from lantern.utils import find_solutions_folder, get_language_name, get_state_dir
+
+    jobs = discover_solutions(find_solutions_folder(root_dir), args.question_ids)
+    cache = None if args.no_cache else ResultCache(get_state_dir(root_dir) / RESULTS_FILENAME)
+    build_cache = None
+    if args.build_cache_size > 0:
+        build_cache = BuildCache(BuildCache.default_path(root_dir), args.build_cache_size * 1024 * 1024)
+
+    def report(result: Dict) -> None:
+        suffix = " (cached)" if result["cached"] else ""
+        message = f" - {result['message']}" if result["message"] else ""
+        print(
+            f"{result['question_id']:>5} {get_language_name(result['language']):<7} "
+            f"{result['status']:<14} {result['passed']}/{result['cases']}{suffix}{message}",
+            flush=True,
+        )
+
+    results = run_tests(
+        jobs, cache, args.jobs, args.timeout, args.memory, on_result=report, build_cache=build_cache
+    )
+
+    counts: Dict[str, int] = {}
+    for result in results:
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+    print(", ".join(f"{count} {status}" for status, count in sorted(counts.items())) or "No solutions found")
+
+    if any(result["status"] not in ("passed", "no-tests") for result in results):
+        sys.exit(1)
+
+
+def run_index_command(command: str, root_dir: Path) -> None:
+    fs_manager = FileSystemManager(root_dir)
+    fs_manager.initialize()
+
+    if command == "import":
+        index = fs_manager.create_index()
+        print(f"Imported {len(index)} problems into {index.path}")
+    elif command == "render":
+        if fs_manager.index is None:
+            print("Error: No index found, run 'lantern index import' first", file=sys.stderr)
+            sys.exit(1)
+        fs_manager.render_readme_from_index()
+        print(f"Rendered {len(fs_manager.index)} problems into {fs_manager.readme_path}")
+
+
+def start_trace(main_started_ns: int):
+    from lantern import trace
+
+    tracer = trace.enable(IMPORT_STARTED_NS)
+    tracer.add_span(
+        "import lantern", "startup", IMPORT_STARTED_NS, main_started_ns, tracer.current_tid(), {}
+    )
+    return tracer
+
+
+def main() -> None:
+    main_started_ns = time.perf_counter_ns()
+    parser = build_parser()
     args = parser.parse_args()
+    if not args.trace:
+        run_command(args)
+        return
+
+    from lantern import trace
+
+    tracer = start_trace(main_started_ns)
+    try:
+        run_command(args)
+    finally:
+        trace.disable()
+        tracer.save(args.trace)
+        print(f"Wrote trace to {args.trace}", file=sys.stderr)
+
+
+def run_command(args: argparse.Namespace) -> None:
+    if args.profile_startup:
+        from lantern.startup import format_profile, profile_imports
+
+        print(format_profile(profile_imports()))
+        return
 
     root_dir = Path.cwd()
+    wants_add = (args.url or args.question_id is not None) and args.language
+    if wants_add and not (args.command or args.batch or args.no_daemon):
+        request = {
+            "command": "add",
+            "url": args.url,
+            "question_id": args.question_id,
+            "language": args.language,
+            "refresh": args.refresh,
+            "offline": args.offline,
+        }
+        with span("forward_to_daemon"):
+            forwarded = forward_to_daemon(root_dir, request)
+        if forwarded:
+            return
+
+    catalog = Catalog()
+    leetcode_client = LeetCodeClient(
+        cache=ProblemCache(), refresh=args.refresh, offline=args.offline, catalog=catalog
+    )
+
+    if args.command == "catalog":
+        if not asyncio.run(
+            sync_catalog(catalog, leetcode_client, args.page_size, args.restart)
+        ):
+            sys.exit(1)
+        return
 
-    if args.url and args.language:
+    if args.command in ("verify", "rebuild"):
+        run_reconcile_command(args.command, root_dir, args.workers)
+        return
+
+    if args.command == "watch":
+        run_watch_command(args, root_dir)
+        return
+
+    if args.command == "stats":
+        run_stats_command(args.json, root_dir)
+        return
+
+    if args.command == "shard":
+        run_shard_command(args, root_dir)
+        return
+
+    if args.command == "search":
+        run_search_command(args, root_dir)
+        return
+
+    if args.command == "statements":
+        run_statements_command(args, root_dir, leetcode_client)
+        return
+
+    if args.command == "test":
+        run_test_command(args, root_dir)
+        return
+
+    if args.command == "serve":
+        run_serve_command(args, root_dir)
+        return
+
+    if args.command == "bench":
+        run_bench_command(args)
+        return
+
+    if args.command == "index":
+        run_index_command(args.index_command, root_dir)
+        return
+
+    if args.question_id is not None:
+        problem = catalog.get_by_id(args.question_id)
+        if not problem:
+            print(
+                f"Error: Problem {args.question_id} not found, run 'lantern catalog sync' first",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        args.url = f"https://leetcode.com/problems/{problem['question_slug']}/"
+
+    if args.batch:
+        if args.url or args.language:
+            print("Error: --batch cannot be combined with --url or --language", file=sys.stderr)
+            sys.exit(1)
+        if args.concurrency < 1 or args.chunk_size < 1:
+            print("Error: --concurrency and --chunk-size must be at least 1", file=sys.stderr)
+            sys.exit(1)
+        try:
+            if args.batch == "-":
+                entries = parse_batch_entries(sys.stdin)
+            else:
+                with open(args.batch) as batch_file:
+                    entries = parse_batch_entries(batch_file)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        failures = asyncio.run(
+            process_batch(
+                entries, root_dir, args.concurrency, leetcode_client, args.chunk_size
+            )
+        )
+        if failures:
+            sys.exit(1)
+    elif args.url and args.language:
         language = parse_language(args.language)
-        asyncio.run(process_cli(args.url, language, root_dir))
+        asyncio.run(process_cli(args.url, language, root_dir, leetcode_client))
     elif args.url or args.language:
-        print("Error: Both --url and --language must be provided for CLI mode", file=sys.stderr)
+        print("Error: Both --url (or --id) and --language must be provided for CLI mode", file=sys.stderr)
         sys.exit(1)
     else:
+        from lantern.tui import run_tui
+
         run_tui(root_dir)
 
 
@@ -0,0 +1,233 @@
+import asyncio
+import json
+import os
+import signal
+import socket
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from lantern import __version__
+from lantern.api import Lantern
+from lantern.cache import ProblemCache
+from lantern.catalog import Catalog
+from lantern.leetcode import LeetCodeClient, LeetCodeError
+
+SOCKET_FILENAME = "daemon.sock"
+MAX_SOCKET_PATH = 100
+CONNECT_TIMEOUT = 0.5
+PING_TIMEOUT = 2.0
+
+
+class DaemonError(Exception):
+    pass
+
+
+class DaemonUnavailable(DaemonError):
+    pass
+
+
+def socket_path(root: Path) -> Path:
+    from lantern.utils import content_digest, get_state_dir
+
+    root = root.resolve()
+    path = get_state_dir(root) / SOCKET_FILENAME
+    if len(os.fsencode(path)) < MAX_SOCKET_PATH:
+        return path
+
+    import tempfile
+
+    digest = content_digest(os.fsencode(root))[:16]
+    return Path(tempfile.gettempdir()) / f"lantern-{os.getuid()}-{digest}.sock"
+
+
+def send_request(root: Path, request: Dict, timeout: Optional[float] = None) -> Dict:
+    if not hasattr(socket, "AF_UNIX"):
+        raise DaemonUnavailable("Unix sockets are not supported on this platform")
+
+    path = socket_path(root)
+    if not path.exists():
+        raise DaemonUnavailable("No daemon is running")
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(CONNECT_TIMEOUT)
+        try:
+            sock.connect(str(path))
+        except OSError as e:
+            raise DaemonUnavailable(f"Daemon is not accepting connections: {e}") from e
+        sock.settimeout(timeout)
+        try:
+            sock.sendall(json.dumps(dict(request, version=__version__)).encode() + b"\n")
+            with sock.makefile("rb") as stream:
+                line = stream.readline()
+            response = json.loads(line) if line else None
+        except (OSError, ValueError) as e:
+            raise DaemonError(f"No valid reply from the daemon: {e}") from e
+
+    if response is None:
+        raise DaemonError("Daemon closed the connection without replying")
+    if response.get("status") == "unsupported":
+        raise DaemonUnavailable(response.get("message", ""))
+    return response
+
+
+def try_request(root: Path, request: Dict, timeout: Optional[float] = None) -> Optional[Dict]:
+    try:
+        return send_request(root, request, timeout)
+    except DaemonUnavailable:
+        return None
+
+
+class LanternDaemon:
+    def __init__(
+        self,
+        root: Path,
+        leetcode_client: Optional[LeetCodeClient] = None,
+        idle_timeout: Optional[float] = None,
+    ):
+        self.root = root
+        self.path = socket_path(root)
+        self.idle_timeout = idle_timeout
+        self.leetcode_client = leetcode_client or LeetCodeClient(
+            cache=ProblemCache(), catalog=Catalog()
+        )
+        self.lantern = Lantern(root, self.leetcode_client)
+        self.requests = 0
+        self.last_request = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+        self._stopped: Optional[asyncio.Event] = None
+
+    async def handle_request(self, request: Dict) -> Dict:
+        self.requests += 1
+        self.last_request = time.monotonic()
+        if request.get("version") != __version__:
+            return {"status": "unsupported", "message": f"Daemon runs lantern {__version__}"}
+
+        command = request.get("command")
+        if command == "ping":
+            return {
+                "status": "ok",
+                "message": f"Serving {self.root} (pid {os.getpid()}, {self.requests} requests)",
+            }
+        if command == "stop":
+            self._stopped.set()
+            return {"status": "ok", "message": "Daemon stopped"}
+        if command == "add":
+            return await self.add(request)
+        return {"status": "error", "message": f"Unknown command: {command}"}
+
+    async def add(self, request: Dict) -> Dict:
+        target = request.get("url") or ""
+        if request.get("question_id") is not None:
+            target = int(request["question_id"])
+
+        client = self.leetcode_client
+        async with self._lock:
+            client.refresh = bool(request.get("refresh"))
+            client.offline = bool(request.get("offline"))
+            try:
+                result = await self.lantern.add(target, request.get("language", ""))
+            finally:
+                client.refresh = client.offline = False
+
+        if isinstance(result.error, LeetCodeError):
+            return {"status": "error", "message": f"Failed to fetch problem data: {result.error}"}
+        if result.error is not None:
+            return {"status": "error", "message": str(result.error)}
+        return {"status": "ok", "message": f"Successfully added problem: {result.problem['question_title']}"}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            line = await reader.readline()
+            try:
+                request = json.loads(line)
+            except ValueError:
+                response = {"status": "error", "message": "Malformed request"}
+            else:
+                try:
+                    response = await self.handle_request(request)
+                except Exception as e:
+                    response = {"status": "error", "message": f"{type(e).__name__}: {e}"}
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def claim_socket(self):
+        try:
+            running = await asyncio.to_thread(
+                try_request, self.root, {"command": "ping"}, PING_TIMEOUT
+            )
+        except DaemonError as e:
+            raise DaemonError(f"Another process is listening on {self.path}: {e}") from e
+        if running is not None:
+            raise DaemonError(f"A daemon is already serving {self.root}")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    async def wait_until_stopped(self):
+        while True:
+            if self.idle_timeout is None:
+                await self._stopped.wait()
+                return
+            remaining = self.last_request + self.idle_timeout - time.monotonic()
+            if remaining <= 0:
+                return
+            try:
+                await asyncio.wait_for(self._stopped.wait(), remaining)
+                return
+            except asyncio.TimeoutError:
+                continue
+
+    async def serve(self, ready: Optional[asyncio.Event] = None):
+        if not hasattr(socket, "AF_UNIX"):
+            raise DaemonError("Unix sockets are not supported on this platform")
+
+        self._lock = asyncio.Lock()
+        self._stopped = asyncio.Event()
+        await self.claim_socket()
+        self.lantern.initialize().load_table()
+
+        umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(self.handle_connection, path=str(self.path))
+        finally:
+            os.umask(umask)
+
+        loop = asyncio.get_running_loop()
+        handled_signals = []
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, self._stopped.set)
+                handled_signals.append(signum)
+            except (NotImplementedError, RuntimeError, ValueError):
+                pass
+
+        try:
+            async with server:
+                if ready is not None:
+                    ready.set()
+                await self.wait_until_stopped()
+        finally:
+            for signum in handled_signals:
+                loop.remove_signal_handler(signum)
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+            await self.leetcode_client.close()
+            self.close()
+
+    def close(self):
+        fs_manager = self.lantern.fs_manager
+        stores = (fs_manager.index, fs_manager.search, fs_manager.statements, self.leetcode_client.cache)
+        for store in stores:
+            if store is not None:
+                store.close()
+        if self.leetcode_client.catalog is not None:
+            self.leetcode_client.catalog.close()
@@ -1,6 +1,13 @@
-import re
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple, Union
+
+from lantern.index import ProblemIndex
+from lantern.search import SearchIndex
+from lantern.shards import TOC_MARKER, ShardedTable, ShardLayout, find_toc, write_layout
+from lantern.statements import StatementStore, render_question_readme
+from lantern.stats import StatsStore
+from lantern.table import ReadmeTable
+from lantern.trace import count, traced
 
 
 class FileSystemManager:
@@ -8,17 +15,31 @@ class FileSystemManager:
         self.root = root
         self.solutions_folder = None
         self.readme_path = None
+        self._table: Optional[ReadmeTable] = None
+        self._table_signature: Optional[Tuple[int, int]] = None
+        self._table_digest: Optional[str] = None
+        self.index: Optional[ProblemIndex] = None
+        self.stats: Optional[StatsStore] = None
+        self.search: Optional[SearchIndex] = None
+        self.statements: Optional[StatementStore] = None
 
+    @traced(category="fs")
     def initialize(self):
         from lantern.utils import ensure_solutions_folder, ensure_readme
         
         self.solutions_folder = ensure_solutions_folder(self.root)
         self.readme_path = ensure_readme(self.root)
+        self.index = ProblemIndex.open_existing(self.root)
+        self.stats = StatsStore.open_existing(self.root)
+        self.search = SearchIndex.open_existing(self.root)
+        self.statements = StatementStore.open_existing(self.root)
 
+    @traced(category="fs")
     def get_question_folder(self, question_id: str, question_slug: str) -> Path:
         folder_name = f"{question_id}-{question_slug}"
         return self.solutions_folder / folder_name
 
+    @traced(category="fs")
     def ensure_question_folder(self, question_id: str, question_slug: str) -> Path:
         from lantern.utils import format_question_id
         
@@ -27,15 +48,72 @@ class FileSystemManager:
         folder.mkdir(exist_ok=True)
         return folder
 
+    @traced(category="fs")
     def ensure_question_readme(self, folder: Path, problem_data: Dict):
+        statement = None
+        if self.statements is not None:
+            statement = self.statements.get(problem_data["question_slug"])
+        if statement is None and (folder / "README.md").exists():
+            return
+        self.write_question_readme(folder, problem_data, statement)
+
+    @traced(category="fs")
+    def write_question_readme(
+        self, folder: Path, problem_data: Dict, statement: Optional[Dict] = None, force: bool = False
+    ) -> str:
+        from lantern.utils import content_digest
+
+        slug = problem_data["question_slug"]
         readme = folder / "README.md"
-        if not readme.exists():
-            content = f"# {problem_data['question_id']}. {problem_data['question_title']}\n\n"
-            content += f"**Difficulty:** {problem_data['difficulty']}\n\n"
-            content += f"**Tags:** {problem_data['topic_tags']}\n\n"
-            content += f"**Link:** https://leetcode.com/problems/{problem_data['question_slug']}/\n"
-            readme.write_text(content)
+        data = render_question_readme(problem_data, statement).encode("utf-8")
+        digest = content_digest(data)
+        recorded = None
+        if statement is not None and self.statements is not None:
+            recorded = self.statements.rendered_digest(slug)
+
+        if readme.exists():
+            existing = readme.read_bytes()
+            count("bytes_read", len(existing))
+            if existing == data:
+                if statement is not None and self.statements is not None and recorded != digest:
+                    self.statements.set_rendered(slug, digest)
+                return "unchanged"
+            is_stub = existing == render_question_readme(problem_data).encode("utf-8")
+            if not (force or is_stub or content_digest(existing) == recorded):
+                return "edited"
+
+        readme.write_bytes(data)
+        count("bytes_written", len(data))
+        if statement is not None and self.statements is not None:
+            self.statements.set_rendered(slug, digest)
+        return "written"
+
+    @traced(category="fs")
+    def render_question_readmes(self, force: bool = False) -> Dict[str, int]:
+        import os
+
+        summary = {"written": 0, "unchanged": 0, "edited": 0, "missing": 0}
+        with os.scandir(self.solutions_folder) as entries:
+            for entry in entries:
+                question_id, _, slug = entry.name.partition("-")
+                if not (question_id.isdigit() and slug and entry.is_dir()):
+                    continue
+                statement = self.statements.get(slug) if self.statements is not None else None
+                if statement is None:
+                    summary["missing"] += 1
+                    continue
+                problem_data = self.statements.get_problem(slug)
+                status = self.write_question_readme(Path(entry.path), problem_data, statement, force)
+                summary[status] += 1
+        return summary
 
+    @traced(category="fs")
+    def create_statement_store(self) -> StatementStore:
+        if self.statements is None:
+            self.statements = StatementStore(StatementStore.default_path(self.root))
+        return self.statements
+
+    @traced(category="fs")
     def ensure_solution_file(self, folder: Path, language: str):
         from lantern.utils import get_language_extension
         
@@ -44,153 +122,228 @@ class FileSystemManager:
         if not solution_file.exists():
             solution_file.write_text("")
 
+    @traced(category="fs")
+    def load_table(self) -> Union[ReadmeTable, ShardedTable]:
+        from lantern.utils import content_digest
+
+        if self._table is None or self._table_signature != self._current_signature():
+            data = self.readme_path.read_bytes()
+            count("bytes_read", len(data))
+            content = data.decode("utf-8")
+            layout = None
+            if TOC_MARKER in content:
+                layout, _, _ = find_toc(content.split("\n"))
+
+            if layout is None:
+                self._table = ReadmeTable.parse(content)
+                self._table_digest = content_digest(data)
+            else:
+                self._table = ShardedTable(self.root, layout, content)
+                self._table.readme_digest = content_digest(data)
+                self._table_digest = self._table.digest()
+            self._table_signature = self._current_signature()
+            self.sync_stats()
+            self.sync_search()
+        return self._table
+
+    def _current_signature(self) -> Tuple:
+        stat = self.readme_path.stat()
+        signature: Tuple = (stat.st_mtime_ns, stat.st_size)
+        if isinstance(self._table, ShardedTable):
+            signature += self._table.signature()
+        return signature
+
+    @traced(category="fs")
+    def save_table(self, table: Union[ReadmeTable, ShardedTable]):
+        from lantern.utils import atomic_write_text, content_digest
+
+        if not table.dirty:
+            return
+
+        if isinstance(table, ShardedTable):
+            table.save(self.readme_path)
+            self._table_digest = table.digest()
+        else:
+            content = table.render()
+            atomic_write_text(self.readme_path, content, self._table_digest)
+            table.dirty = False
+            self._table_digest = content_digest(content.encode("utf-8"))
+        self._table_signature = self._current_signature()
+        if self.stats is not None:
+            self.stats.data["readme_digest"] = self._table_digest
+            self.stats.dirty = True
+            self.stats.save()
+        if self.search is not None:
+            self.search.flush()
+            self.search.set_meta("readme_digest", self._table_digest)
+
+    @traced(category="fs")
+    def sync_stats(self):
+        if self.stats is None or self._table is None:
+            return
+        if self.stats.data["readme_digest"] != self._table_digest:
+            self.stats.rebuild(self._table, self.root)
+            self.stats.data["readme_digest"] = self._table_digest
+            self.stats.save()
+
+    @traced(category="fs")
+    def sync_search(self):
+        if self.search is None or self._table is None:
+            return
+        if self.search.get_meta("readme_digest") != self._table_digest:
+            self.search.rebuild(self._table)
+            self.search.set_meta("readme_digest", self._table_digest)
+
+    @traced(category="fs")
+    def create_search_index(self) -> SearchIndex:
+        if self.search is None:
+            self.search = SearchIndex(SearchIndex.default_path(self.root))
+        self.load_table()
+        self.sync_search()
+        return self.search
+
+    @traced(category="fs")
+    def load_stats(self) -> StatsStore:
+        if self.stats is None:
+            self.stats = StatsStore(StatsStore.default_path(self.root))
+        self.load_table()
+        self.sync_stats()
+        return self.stats
+
+    @traced(category="fs")
+    def set_shard_layout(self, layout: Optional[ShardLayout]):
+        rows = self.parse_table_rows()
+        write_layout(self.root, self.readme_path, rows, layout)
+        self._table = None
+        self.load_table()
+
+    @traced(category="fs")
+    def upsert_row(self, table: ReadmeTable, row: Dict) -> bool:
+        changed = table.upsert(row)
+        if changed and self.stats is not None:
+            self.stats.update_row(row)
+        if changed and self.search is not None:
+            self.search.stage_upsert(row)
+        return changed
+
+    @traced(category="fs")
+    def remove_row(self, table: ReadmeTable, question_id: int) -> bool:
+        removed = table.remove(question_id)
+        if removed and self.stats is not None:
+            self.stats.remove_row(question_id)
+        if removed and self.search is not None:
+            self.search.stage_remove(question_id)
+        return removed
+
+    @traced(category="fs")
     def find_table_in_readme(self) -> Tuple[int, int]:
-        content = self.readme_path.read_text()
-        lines = content.split("\n")
-        
-        table_start = -1
-        table_end = -1
-        
-        for i, line in enumerate(lines):
-            if re.search(r"#.*Title.*Solution.*Tags.*Difficulty", line, re.IGNORECASE):
-                table_start = i
-                break
-        
-        if table_start == -1:
-            return -1, -1
-        
-        for i in range(table_start + 1, len(lines)):
-            if not lines[i].strip().startswith("|") or lines[i].strip() == "":
-                table_end = i
-                break
-        
-        if table_end == -1:
-            table_end = len(lines)
-        
-        return table_start, table_end
+        table = self.load_table()
+        return table.start, table.end
 
+    @traced(category="fs")
     def create_table_if_missing(self):
-        start, end = self.find_table_in_readme()
-        if start == -1:
-            content = self.readme_path.read_text()
-            if not content.endswith("\n"):
-                content += "\n"
-            content += "\n| # | Title | Solution | Tags | Difficulty |\n"
-            content += "|:----:|:--------:|:--------:|:-------:|:----------:|\n"
-            self.readme_path.write_text(content)
+        table = self.load_table()
+        table.ensure_table()
+        self.save_table(table)
 
+    @traced(category="fs")
     def parse_table_rows(self) -> List[Dict]:
-        start, end = self.find_table_in_readme()
-        if start == -1:
-            return []
-        
-        content = self.readme_path.read_text()
-        lines = content.split("\n")
-        
-        rows = []
-        for i in range(start + 2, end):
-            line = lines[i].strip()
-            if not line.startswith("|") or line == "":
-                continue
-            
-            parts = [p.strip() for p in line.split("|")[1:-1]]
-            if len(parts) < 5:
-                continue
-            
-            question_id_match = re.search(r"(\d+)", parts[0])
-            if not question_id_match:
-                continue
-            
-            question_id = question_id_match.group(1)
-            title_match = re.search(r"\[([^\]]+)\]\(([^\)]+)\)", parts[1])
-            title = title_match.group(1) if title_match else parts[1]
-            url = title_match.group(2) if title_match else ""
-            
-            solution_parts = []
-            solution_matches = re.findall(r"\[([^\]]+)\]\(([^\)]+)\)", parts[2])
-            for lang, path in solution_matches:
-                solution_parts.append((lang, path))
-            
-            rows.append({
-                "question_id": int(question_id),
-                "title": title,
-                "url": url,
-                "solutions": solution_parts,
-                "tags": parts[3],
-                "difficulty": parts[4],
-                "raw_line": line,
-            })
-        
-        return rows
+        return [
+            dict(row, solutions=list(row["solutions"]))
+            for row in self.load_table()
+        ]
+
+    @traced(category="fs")
+    def get_row(self, question_id: int) -> Optional[Dict]:
+        if self.index is not None:
+            return self.index.get(question_id)
+        return self.load_table().get(question_id)
+
+    @traced(category="fs")
+    def list_rows(self) -> List[Dict]:
+        if self.index is not None:
+            return list(self.index.rows())
+        return self.parse_table_rows()
 
+    @traced(category="fs")
     def update_readme_table(self, problem_data: Dict, language: str):
-        from lantern.utils import format_question_id, get_language_extension
-        
-        self.create_table_if_missing()
-        
+        self.update_readme_table_many([(problem_data, language)])
+
+    @traced(category="fs")
+    def update_readme_table_many(self, entries: List[Tuple[Dict, str]]):
+        if not entries:
+            return
+
+        table = self.load_table()
+        table.ensure_table()
+        changed_rows: Dict[int, Dict] = {}
+        for problem_data, language in entries:
+            question_id = int(problem_data["question_id"])
+            existing_row = changed_rows.get(question_id) or self.get_row(question_id)
+            row = self.build_table_row(existing_row, problem_data, language)
+            changed_rows[question_id] = row
+            self.upsert_row(table, row)
+
+        if self.index is not None:
+            self.index.upsert_rows(changed_rows.values())
+        self.save_table(table)
+
+    @traced(category="fs")
+    def create_index(self) -> ProblemIndex:
+        index = ProblemIndex(ProblemIndex.default_path(self.root))
+        index.upsert_rows(self.parse_table_rows())
+        self.index = index
+        return index
+
+    @traced(category="fs")
+    def render_readme_from_index(self):
+        if self.index is None:
+            return
+
+        table = self.load_table()
+        table.ensure_table()
+        indexed_ids = set()
+        for row in self.index.rows():
+            indexed_ids.add(row["question_id"])
+            self.upsert_row(table, row)
+        for row in list(table):
+            if row["question_id"] not in indexed_ids:
+                self.remove_row(table, row["question_id"])
+        self.save_table(table)
+
+    @traced(category="fs")
+    def build_table_row(
+        self, existing_row: Optional[Dict], problem_data: Dict, language: str
+    ) -> Dict:
+        from lantern.utils import format_question_id, get_language_extension, get_language_name
+
         question_id = int(problem_data["question_id"])
         question_slug = problem_data["question_slug"]
         formatted_id = format_question_id(problem_data["question_id"])
         folder = self.get_question_folder(formatted_id, question_slug)
         relative_path = folder.relative_to(self.root) / f"solution.{get_language_extension(language)}"
         relative_path_str = str(relative_path).replace("\\", "/")
-        
-        rows = self.parse_table_rows()
-        
-        existing_row = None
-        for row in rows:
-            if row["question_id"] == question_id:
-                existing_row = row
-                break
-        
+        lang_name = get_language_name(language)
+
         if existing_row:
-            solutions = existing_row["solutions"]
-            lang_name = language.capitalize()
-            if lang_name == "Cpp":
-                lang_name = "C++"
-            
+            solutions = list(existing_row["solutions"])
             solution_exists = any(lang == lang_name for lang, _ in solutions)
             if not solution_exists:
                 solutions.append((lang_name, f"./{relative_path_str}"))
-            
-            existing_row["solutions"] = solutions
-            existing_row["tags"] = problem_data["topic_tags"]
-            existing_row["difficulty"] = problem_data["difficulty"]
-        else:
-            lang_name = language.capitalize()
-            if lang_name == "Cpp":
-                lang_name = "C++"
-            
-            rows.append({
-                "question_id": question_id,
-                "title": problem_data["question_title"],
-                "url": f"https://leetcode.com/problems/{question_slug}/",
-                "solutions": [(lang_name, f"./{relative_path_str}")],
-                "tags": problem_data["topic_tags"],
-                "difficulty": problem_data["difficulty"],
-                "raw_line": None,
-            })
-        
-        rows.sort(key=lambda x: x["question_id"])
-        
-        content = self.readme_path.read_text()
-        lines = content.split("\n")
-        start, end = self.find_table_in_readme()
-        
-        new_lines = lines[:start + 2]
-        for row in rows:
-            formatted_id = format_question_id(str(row["question_id"]))
-            title_link = f"[{row['title']}]({row['url']})"
-            
-            solution_links = []
-            for lang, path in row["solutions"]:
-                solution_links.append(f"[{lang}]({path})")
-            solution_str = ", ".join(solution_links) if solution_links else "-"
-            
-            new_lines.append(
-                f"| {formatted_id} | {title_link} | {solution_str} | {row['tags']} | {row['difficulty']} |"
+
+            return dict(
+                existing_row,
+                solutions=solutions,
+                tags=problem_data["topic_tags"],
+                difficulty=problem_data["difficulty"],
             )
-        
-        new_lines.extend(lines[end:])
-        self.readme_path.write_text("\n".join(new_lines))
 
+        return {
+            "question_id": question_id,
+            "title": problem_data["question_title"],
+            "url": f"https://leetcode.com/problems/{question_slug}/",
+            "solutions": [(lang_name, f"./{relative_path_str}")],
+            "tags": problem_data["topic_tags"],
+            "difficulty": problem_data["difficulty"],
+            "raw_line": None,
+        }
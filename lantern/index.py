@@ -0,0 +1,140 @@
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+INDEX_FILENAME = "index.db"
+
+
+class ProblemIndex:
+    def __init__(self, path: Path):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @classmethod
+    def default_path(cls, root: Path) -> Path:
+        from lantern.utils import get_state_dir
+
+        return get_state_dir(root) / INDEX_FILENAME
+
+    @classmethod
+    def open_existing(cls, root: Path) -> Optional["ProblemIndex"]:
+        path = cls.default_path(root)
+        return cls(path) if path.exists() else None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            with self._conn:
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS problems ("
+                    "question_id INTEGER PRIMARY KEY, slug TEXT NOT NULL, title TEXT NOT NULL, "
+                    "url TEXT NOT NULL, tags TEXT NOT NULL, difficulty TEXT NOT NULL)"
+                )
+                self._conn.execute(
+                    "CREATE INDEX IF NOT EXISTS problems_slug ON problems (slug)"
+                )
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS solutions ("
+                    "question_id INTEGER NOT NULL REFERENCES problems (question_id) ON DELETE CASCADE, "
+                    "position INTEGER NOT NULL, language TEXT NOT NULL, path TEXT NOT NULL, "
+                    "PRIMARY KEY (question_id, position))"
+                )
+            self._conn.execute("PRAGMA foreign_keys = ON")
+        return self._conn
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM problems").fetchone()[0]
+
+    def _solutions(self, question_id: int) -> List[tuple]:
+        return [
+            tuple(row)
+            for row in self._connect().execute(
+                "SELECT language, path FROM solutions WHERE question_id = ? ORDER BY position",
+                (question_id,),
+            )
+        ]
+
+    def _to_row(self, record: Optional[tuple]) -> Optional[Dict]:
+        if record is None:
+            return None
+        question_id, slug, title, url, tags, difficulty = record
+        return {
+            "question_id": question_id,
+            "slug": slug,
+            "title": title,
+            "url": url,
+            "solutions": self._solutions(question_id),
+            "tags": tags,
+            "difficulty": difficulty,
+            "raw_line": None,
+        }
+
+    def get(self, question_id: int) -> Optional[Dict]:
+        record = self._connect().execute(
+            "SELECT question_id, slug, title, url, tags, difficulty FROM problems WHERE question_id = ?",
+            (question_id,),
+        ).fetchone()
+        return self._to_row(record)
+
+    def get_by_slug(self, slug: str) -> Optional[Dict]:
+        record = self._connect().execute(
+            "SELECT question_id, slug, title, url, tags, difficulty FROM problems WHERE slug = ?",
+            (slug,),
+        ).fetchone()
+        return self._to_row(record)
+
+    def rows(self) -> Iterator[Dict]:
+        conn = self._connect()
+        solutions: Dict[int, List[tuple]] = {}
+        for question_id, language, path in conn.execute(
+            "SELECT question_id, language, path FROM solutions ORDER BY question_id, position"
+        ):
+            solutions.setdefault(question_id, []).append((language, path))
+
+        for question_id, slug, title, url, tags, difficulty in conn.execute(
+            "SELECT question_id, slug, title, url, tags, difficulty FROM problems ORDER BY question_id"
+        ):
+            yield {
+                "question_id": question_id,
+                "slug": slug,
+                "title": title,
+                "url": url,
+                "solutions": solutions.get(question_id, []),
+                "tags": tags,
+                "difficulty": difficulty,
+                "raw_line": None,
+            }
+
+    def upsert_rows(self, rows: Iterable[Dict]):
+        from lantern.utils import extract_question_slug
+
+        conn = self._connect()
+        with conn:
+            for row in rows:
+                question_id = row["question_id"]
+                slug = row.get("slug") or extract_question_slug(row["url"]) or ""
+                conn.execute(
+                    "INSERT OR REPLACE INTO problems (question_id, slug, title, url, tags, difficulty) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (question_id, slug, row["title"], row["url"], row["tags"], row["difficulty"]),
+                )
+                conn.execute("DELETE FROM solutions WHERE question_id = ?", (question_id,))
+                conn.executemany(
+                    "INSERT INTO solutions (question_id, position, language, path) VALUES (?, ?, ?, ?)",
+                    [
+                        (question_id, position, language, path)
+                        for position, (language, path) in enumerate(row["solutions"])
+                    ],
+                )
+
+    def remove(self, question_id: int) -> bool:
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute("DELETE FROM problems WHERE question_id = ?", (question_id,))
+        return cursor.rowcount > 0
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -1,9 +1,138 @@
-import aiohttp
-from typing import Optional, Dict
+import asyncio
+import random
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Optional, Dict, List, Sequence, Tuple, Union
+
+from lantern.cache import ProblemCache
+from lantern.catalog import Catalog
+from lantern.ratelimit import AdaptiveLimiter, parse_retry_after, shared_limiter
+from lantern.trace import count, span, traced
+
+if TYPE_CHECKING:
+    import aiohttp
+
+GRAPHQL_URL = "https://leetcode.com/graphql"
+
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_READ_TIMEOUT = 30.0
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_BASE = 0.5
+DEFAULT_BACKOFF_MAX = 8.0
+DEFAULT_CONNECTION_LIMIT = 32
+DEFAULT_CHUNK_SIZE = 25
+DEFAULT_CHUNK_CONCURRENCY = 4
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+THROTTLE_STATUSES = frozenset({429, 503})
+
+QUESTION_FIELDS = """
+        questionFrontendId
+        title
+        difficulty
+        topicTags { name }"""
+
+STATEMENT_FIELDS = f"""{QUESTION_FIELDS}
+        content
+        hints
+        exampleTestcases"""
+
+QUESTION_QUERY = f"""
+query getQuestionDetails($titleSlug: String!) {{
+    question(titleSlug: $titleSlug) {{{QUESTION_FIELDS}
+    }}
+}}"""
+
+PROBLEMSET_QUERY = """
+query problemsetQuestionList($categorySlug: String, $limit: Int, $skip: Int, $filters: QuestionListFilterInput) {
+    problemsetQuestionList: questionList(
+        categorySlug: $categorySlug
+        limit: $limit
+        skip: $skip
+        filters: $filters
+    ) {
+        total: totalNum
+        questions: data {
+            questionFrontendId
+            title
+            titleSlug
+            difficulty
+            isPaidOnly
+            topicTags { name }
+        }
+    }
+}"""
+
+
+def build_batch_query(count: int, fields: str = QUESTION_FIELDS) -> str:
+    variables = ", ".join(f"$s{i}: String!" for i in range(count))
+    aliases = "".join(
+        f"""
+    q{i}: question(titleSlug: $s{i}) {{{fields}
+    }}"""
+        for i in range(count)
+    )
+    return f"query getQuestionsBatch({variables}) {{{aliases}\n}}"
+
+
+class LeetCodeError(Exception):
+    pass
+
+
+class ProblemNotFoundError(LeetCodeError):
+    def __init__(self, question_slug: str):
+        super().__init__(f"Problem '{question_slug}' not found")
+        self.question_slug = question_slug
+
+
+class NotCachedError(LeetCodeError):
+    def __init__(self, question_slug: str):
+        super().__init__(f"Problem '{question_slug}' is not cached and offline mode is enabled")
+        self.question_slug = question_slug
+
+
+class LeetCodeHTTPError(LeetCodeError):
+    def __init__(self, status: int):
+        super().__init__(f"LeetCode responded with HTTP {status}")
+        self.status = status
+
+
+class LeetCodeTransportError(LeetCodeError):
+    pass
+
+
+class LeetCodeResponseError(LeetCodeError):
+    pass
 
 
 class LeetCodeClient:
-    def __init__(self):
+    def __init__(
+        self,
+        cache: Optional[ProblemCache] = None,
+        refresh: bool = False,
+        offline: bool = False,
+        catalog: Optional[Catalog] = None,
+        graphql_url: str = GRAPHQL_URL,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+        limiter: Optional[AdaptiveLimiter] = None,
+    ):
+        self.cache = cache
+        self.catalog = catalog
+        self.graphql_url = graphql_url
+        self.refresh = refresh
+        self.offline = offline
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.connection_limit = connection_limit
+        self.limiter = limiter or shared_limiter(graphql_url)
+        self.retries = 0
+        self._session: Optional["aiohttp.ClientSession"] = None
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
             "Accept": "application/json",
@@ -12,44 +141,299 @@ class LeetCodeClient:
             "Referer": "https://leetcode.com/",
         }
 
+    async def __aenter__(self) -> "LeetCodeClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def get_session(self) -> "aiohttp.ClientSession":
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                ttl_dns_cache=300,
+                keepalive_timeout=30,
+            )
+            timeout = aiohttp.ClientTimeout(
+                sock_connect=self.connect_timeout, sock_read=self.read_timeout
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=timeout, headers=self.headers
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def backoff_delay(self, attempt: int) -> float:
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    async def post_graphql(
+        self, payload: Dict, session: Optional["aiohttp.ClientSession"] = None
+    ) -> Dict[str, Any]:
+        import aiohttp
+
+        session = session or self.get_session()
+        attempt = 0
+        while True:
+            retry_after = None
+            with span("LeetCodeClient.limiter", "http"):
+                await self.limiter.acquire()
+            started = time.monotonic()
+            request_span = span("LeetCodeClient.post_graphql", "http", attempt=attempt)
+            try:
+                with request_span:
+                    count("http_requests")
+                    async with session.post(
+                        self.graphql_url, json=payload, headers=self.headers
+                    ) as response:
+                        request_span.set(status=response.status)
+                        if response.status == 200:
+                            try:
+                                data = await response.json()
+                            except (aiohttp.ContentTypeError, ValueError) as e:
+                                raise LeetCodeResponseError(f"Invalid JSON response: {e}") from e
+                            self.limiter.on_success(time.monotonic() - started)
+                            return data
+                        if response.status in THROTTLE_STATUSES:
+                            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                            self.limiter.on_throttle(retry_after)
+                        if response.status not in RETRY_STATUSES or attempt >= self.max_retries:
+                            raise LeetCodeHTTPError(response.status)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt >= self.max_retries:
+                    raise LeetCodeTransportError(
+                        f"Request failed after {attempt + 1} attempts: {e!r}"
+                    ) from e
+            finally:
+                self.limiter.release()
+
+            if not retry_after:
+                await asyncio.sleep(self.backoff_delay(attempt))
+            attempt += 1
+            self.retries += 1
+            count("http_retries")
+
+    @traced(category="http")
     async def fetch_problem_data(
-        self, session: aiohttp.ClientSession, question_slug: str
-    ) -> Optional[Dict]:
-        graphql_url = "https://leetcode.com/graphql"
-        query = {
-            "query": """
-            query getQuestionDetails($titleSlug: String!) {
-                question(titleSlug: $titleSlug) {
-                    questionFrontendId
-                    title
-                    difficulty
-                    topicTags { name }
-                }
-            }""",
-            "variables": {"titleSlug": question_slug},
+        self, question_slug: str, session: Optional["aiohttp.ClientSession"] = None
+    ) -> Dict:
+        cached = self.cached_problem(question_slug)
+        if cached:
+            return cached
+
+        if self.offline:
+            raise NotCachedError(question_slug)
+
+        problem_data = await self._fetch_remote(question_slug, session)
+        if self.cache is not None:
+            self.cache.set(question_slug, problem_data)
+        return problem_data
+
+    def cached_problem(self, question_slug: str) -> Optional[Dict]:
+        if self.refresh:
+            return None
+        if self.cache is not None:
+            cached = self.cache.get(question_slug, allow_stale=self.offline)
+            if cached:
+                count("cache_hits")
+                return cached
+        if self.catalog is not None:
+            cached = self.catalog.get_by_slug(question_slug)
+            if cached:
+                count("catalog_hits")
+                return cached
+        count("cache_misses")
+        return None
+
+    async def fetch_many(
+        self,
+        question_slugs: Sequence[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int = DEFAULT_CHUNK_CONCURRENCY,
+        session: Optional["aiohttp.ClientSession"] = None,
+    ) -> Tuple[Dict[str, Dict], Dict[str, LeetCodeError]]:
+        results: Dict[str, Dict] = {}
+        errors: Dict[str, LeetCodeError] = {}
+        async for slug, outcome in self.iter_many(question_slugs, chunk_size, concurrency, session):
+            if isinstance(outcome, LeetCodeError):
+                errors[slug] = outcome
+            else:
+                results[slug] = outcome
+        return results, errors
+
+    async def iter_many(
+        self,
+        question_slugs: Sequence[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int = DEFAULT_CHUNK_CONCURRENCY,
+        session: Optional["aiohttp.ClientSession"] = None,
+    ) -> AsyncIterator[Tuple[str, Union[Dict, LeetCodeError]]]:
+        pending = []
+        for slug in dict.fromkeys(question_slugs):
+            cached = self.cached_problem(slug)
+            if cached:
+                yield slug, cached
+            elif self.offline:
+                yield slug, NotCachedError(slug)
+            else:
+                pending.append(slug)
+
+        async for slug, outcome in self._iter_chunks(pending, chunk_size, concurrency, session):
+            if self.cache is not None and not isinstance(outcome, LeetCodeError):
+                self.cache.set(slug, outcome)
+            yield slug, outcome
+
+    async def iter_statements(
+        self,
+        question_slugs: Sequence[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int = DEFAULT_CHUNK_CONCURRENCY,
+        session: Optional["aiohttp.ClientSession"] = None,
+    ) -> AsyncIterator[Tuple[str, Union[Dict, LeetCodeError]]]:
+        slugs = list(dict.fromkeys(question_slugs))
+        if self.offline:
+            for slug in slugs:
+                yield slug, NotCachedError(slug)
+            return
+
+        async for slug, outcome in self._iter_chunks(
+            slugs, chunk_size, concurrency, session, STATEMENT_FIELDS, self.normalize_statement
+        ):
+            if self.cache is not None and not isinstance(outcome, LeetCodeError):
+                self.cache.set(slug, outcome["problem"])
+            yield slug, outcome
+
+    async def _iter_chunks(
+        self,
+        slugs: List[str],
+        chunk_size: int,
+        concurrency: int,
+        session: Optional["aiohttp.ClientSession"],
+        fields: str = QUESTION_FIELDS,
+        normalize: Optional[Callable[[Dict, str], Dict]] = None,
+    ) -> AsyncIterator[Tuple[str, Union[Dict, LeetCodeError]]]:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run_chunk(chunk: List[str]) -> Dict[str, Union[Dict, LeetCodeError]]:
+            outcomes: Dict[str, Union[Dict, LeetCodeError]] = {}
+            async with semaphore:
+                await self._fetch_chunk(chunk, outcomes, session, fields, normalize)
+            return outcomes
+
+        chunks = [slugs[i:i + chunk_size] for i in range(0, len(slugs), chunk_size)]
+        for next_chunk in asyncio.as_completed([run_chunk(chunk) for chunk in chunks]):
+            for slug, outcome in (await next_chunk).items():
+                yield slug, outcome
+
+    @traced(category="http")
+    async def _fetch_chunk(
+        self,
+        slugs: List[str],
+        outcomes: Dict[str, Union[Dict, LeetCodeError]],
+        session: Optional["aiohttp.ClientSession"] = None,
+        fields: str = QUESTION_FIELDS,
+        normalize: Optional[Callable[[Dict, str], Dict]] = None,
+    ) -> None:
+        normalize = normalize or self.normalize_question
+        payload = {
+            "query": build_batch_query(len(slugs), fields),
+            "variables": {f"s{i}": slug for i, slug in enumerate(slugs)},
         }
+        try:
+            data = await self.post_graphql(payload, session)
+            questions = data.get("data")
+            if not questions:
+                raise LeetCodeResponseError(f"Batch query failed: {data.get('errors')}")
+        except (LeetCodeTransportError, LeetCodeHTTPError) as e:
+            for slug in slugs:
+                outcomes[slug] = e
+            return
+        except LeetCodeError as e:
+            if len(slugs) == 1:
+                outcomes[slugs[0]] = e
+                return
+            middle = len(slugs) // 2
+            await self._fetch_chunk(slugs[:middle], outcomes, session, fields, normalize)
+            await self._fetch_chunk(slugs[middle:], outcomes, session, fields, normalize)
+            return
+
+        for i, slug in enumerate(slugs):
+            question = questions.get(f"q{i}")
+            if not question:
+                outcomes[slug] = ProblemNotFoundError(slug)
+                continue
+            try:
+                outcomes[slug] = normalize(question, slug)
+            except LeetCodeResponseError as e:
+                outcomes[slug] = e
 
+    async def _fetch_remote(
+        self, question_slug: str, session: Optional["aiohttp.ClientSession"] = None
+    ) -> Dict:
+        data = await self.post_graphql(
+            {"query": QUESTION_QUERY, "variables": {"titleSlug": question_slug}}, session
+        )
+        question = (data.get("data") or {}).get("question")
+        if not question:
+            raise ProblemNotFoundError(question_slug)
+
+        return self.normalize_question(question, question_slug)
+
+    def normalize_question(self, question: Dict, question_slug: str) -> Dict:
         try:
-            async with session.post(
-                graphql_url, json=query, headers=self.headers
-            ) as response:
-                if response.status != 200:
-                    return None
-
-                data = await response.json()
-                if "data" not in data or not data["data"].get("question"):
-                    return None
-
-                question = data["data"]["question"]
-                return {
-                    "question_id": question["questionFrontendId"],
-                    "question_title": question["title"],
-                    "question_slug": question_slug,
-                    "difficulty": question["difficulty"],
-                    "topic_tags": ", ".join(
-                        tag["name"] for tag in question["topicTags"]
-                    ),
-                }
-        except Exception:
-            return None
+            return {
+                "question_id": question["questionFrontendId"],
+                "question_title": question["title"],
+                "question_slug": question_slug,
+                "difficulty": question["difficulty"],
+                "topic_tags": ", ".join(
+                    tag["name"] for tag in question["topicTags"]
+                ),
+            }
+        except (KeyError, TypeError) as e:
+            raise LeetCodeResponseError(f"Unexpected question payload: {e!r}") from e
+
+    def normalize_statement(self, question: Dict, question_slug: str) -> Dict:
+        problem = self.normalize_question(question, question_slug)
+        if not question.get("content"):
+            raise LeetCodeResponseError(f"No statement available for '{question_slug}'")
+        return {
+            "problem": problem,
+            "statement": {
+                "content": question["content"],
+                "hints": list(question.get("hints") or []),
+                "examples": question.get("exampleTestcases") or "",
+            },
+        }
+
+    async def fetch_problemset_page(
+        self, skip: int, limit: int, session: Optional["aiohttp.ClientSession"] = None
+    ) -> Tuple[int, List[Dict]]:
+        data = await self.post_graphql(
+            {
+                "query": PROBLEMSET_QUERY,
+                "variables": {
+                    "categorySlug": "",
+                    "skip": skip,
+                    "limit": limit,
+                    "filters": {},
+                },
+            },
+            session,
+        )
+        question_list = (data.get("data") or {}).get("problemsetQuestionList")
+        if not question_list:
+            raise LeetCodeResponseError("Response is missing problemsetQuestionList")
 
+        questions = []
+        for question in question_list["questions"]:
+            problem = self.normalize_question(question, question["titleSlug"])
+            problem["paid_only"] = bool(question.get("isPaidOnly"))
+            questions.append(problem)
+        return question_list["total"], questions
@@ -0,0 +1,191 @@
+import asyncio
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional
+
+DEFAULT_RATE = 10.0
+DEFAULT_BURST = 10
+DEFAULT_MIN_RATE = 0.5
+DEFAULT_INITIAL_LIMIT = 2
+DEFAULT_MIN_LIMIT = 1
+DEFAULT_MAX_LIMIT = 16
+DEFAULT_LATENCY_TOLERANCE = 2.0
+DEFAULT_BACKOFF_FACTOR = 0.5
+RETRY_AFTER_MAX = 120.0
+LATENCY_SMOOTHING = 0.3
+BASELINE_DRIFT = 1.02
+MIN_DECREASE_INTERVAL = 0.5
+RATE_RECOVERY = 0.05
+
+_SHARED: Dict[str, "AdaptiveLimiter"] = {}
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    from email.utils import parsedate_to_datetime
+
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            moment = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        seconds = moment.timestamp() - (time.time() if now is None else now)
+    return min(RETRY_AFTER_MAX, max(0.0, seconds))
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.tokens = float(burst)
+        self.updated = clock()
+        self.paused_until = 0.0
+
+    def _refill(self, now: float):
+        if now > self.updated:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def delay(self) -> float:
+        now = self.clock()
+        self._refill(now)
+        if now < self.paused_until:
+            return self.paused_until - now
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def try_acquire(self) -> bool:
+        if self.delay() > 0:
+            return False
+        self.tokens -= 1
+        return True
+
+    async def acquire(self):
+        while not self.try_acquire():
+            await asyncio.sleep(self.delay())
+
+    def pause(self, seconds: float):
+        now = self.clock()
+        self._refill(now)
+        self.paused_until = max(self.paused_until, now + seconds)
+        self.tokens = 0.0
+        self.updated = self.paused_until
+
+
+class AdaptiveLimiter:
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        min_rate: float = DEFAULT_MIN_RATE,
+        initial_limit: int = DEFAULT_INITIAL_LIMIT,
+        min_limit: int = DEFAULT_MIN_LIMIT,
+        max_limit: int = DEFAULT_MAX_LIMIT,
+        latency_tolerance: float = DEFAULT_LATENCY_TOLERANCE,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.bucket = TokenBucket(rate, burst, clock)
+        self.max_rate = rate
+        self.min_rate = min_rate
+        self.limit = float(max(min_limit, min(max_limit, initial_limit)))
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.backoff_factor = backoff_factor
+        self.clock = clock
+        self.in_flight = 0
+        self.slow_start = True
+        self.latency: Optional[float] = None
+        self.baseline: Optional[float] = None
+        self.last_decrease = float("-inf")
+        self.throttled = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    async def acquire(self):
+        while self.in_flight >= int(self.limit):
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self._wake()
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+        self.in_flight += 1
+        try:
+            await self.bucket.acquire()
+        except BaseException:
+            self.release()
+            raise
+
+    def release(self):
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self):
+        free = int(self.limit) - self.in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if waiter.done() or waiter.get_loop().is_closed():
+                continue
+            waiter.set_result(None)
+            free -= 1
+
+    def _decrease(self) -> bool:
+        now = self.clock()
+        window = self.latency if self.latency is not None else MIN_DECREASE_INTERVAL
+        if now - self.last_decrease < window:
+            return False
+        self.last_decrease = now
+        self.slow_start = False
+        self.limit = max(float(self.min_limit), self.limit * self.backoff_factor)
+        return True
+
+    def on_success(self, latency: float):
+        self.latency = latency if self.latency is None else (
+            LATENCY_SMOOTHING * latency + (1 - LATENCY_SMOOTHING) * self.latency
+        )
+        self.baseline = latency if self.baseline is None else min(latency, self.baseline * BASELINE_DRIFT)
+
+        if self.latency > self.baseline * self.latency_tolerance:
+            self._decrease()
+            return
+
+        step = 1.0 if self.slow_start else 1.0 / self.limit
+        self.limit = min(float(self.max_limit), self.limit + step)
+        self.bucket.rate = min(self.max_rate, self.bucket.rate + self.max_rate * RATE_RECOVERY)
+        self._wake()
+
+    def on_throttle(self, retry_after: Optional[float] = None):
+        self.throttled += 1
+        if retry_after:
+            self.bucket.pause(retry_after)
+        if self._decrease():
+            self.bucket.rate = max(self.min_rate, self.bucket.rate * self.backoff_factor)
+
+
+def shared_limiter(key: str) -> AdaptiveLimiter:
+    limiter = _SHARED.get(key)
+    if limiter is None:
+        limiter = _SHARED[key] = AdaptiveLimiter()
+    return limiter
+
+
+def reset_shared_limiters():
+    _SHARED.clear()
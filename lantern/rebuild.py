@@ -0,0 +1,210 @@
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from lantern.filesystem import FileSystemManager
+
+FOLDER_RE = re.compile(r"^(\d+)-(.+)$")
+SOLUTION_RE = re.compile(r"^solution\.(\w+)$")
+README_TITLE_RE = re.compile(r"^#\s*\d+\.\s*(.+)$", re.MULTILINE)
+README_DIFFICULTY_RE = re.compile(r"^\*\*Difficulty:\*\*\s*(.*)$", re.MULTILINE)
+README_TAGS_RE = re.compile(r"^\*\*Tags:\*\*\s*(.*)$", re.MULTILINE)
+
+
+@dataclass
+class ScannedProblem:
+    question_id: int
+    slug: str
+    folder: str
+    languages: List[str]
+
+
+@dataclass
+class DriftReport:
+    rows: List[Dict] = field(default_factory=list)
+    missing: List[int] = field(default_factory=list)
+    orphaned: List[int] = field(default_factory=list)
+    mismatched: List[int] = field(default_factory=list)
+
+    @property
+    def clean(self) -> bool:
+        return not (self.missing or self.orphaned or self.mismatched)
+
+
+def scan_problem_folder(name: str, path: str) -> Optional[ScannedProblem]:
+    from lantern.utils import get_extension_language
+
+    match = FOLDER_RE.match(name)
+    if not match:
+        return None
+
+    languages = []
+    with os.scandir(path) as children:
+        for child in children:
+            solution_match = SOLUTION_RE.match(child.name)
+            if not solution_match or not child.is_file():
+                continue
+            language = get_extension_language(solution_match.group(1))
+            if language:
+                languages.append(language)
+
+    return ScannedProblem(
+        question_id=int(match.group(1)),
+        slug=match.group(2),
+        folder=name,
+        languages=sorted(languages),
+    )
+
+
+def scan_problemset(folder: Path, workers: Optional[int] = None) -> Dict[int, ScannedProblem]:
+    if not folder.is_dir():
+        return {}
+
+    with os.scandir(folder) as entries:
+        directories = [entry for entry in entries if entry.is_dir() and FOLDER_RE.match(entry.name)]
+
+    workers = workers or min(32, (os.cpu_count() or 1) * 4)
+    chunk_size = max(1, -(-len(directories) // workers))
+    chunks = [directories[i:i + chunk_size] for i in range(0, len(directories), chunk_size)]
+
+    def scan_chunk(chunk: List[os.DirEntry]) -> List[ScannedProblem]:
+        problems = (scan_problem_folder(entry.name, entry.path) for entry in chunk)
+        return [problem for problem in problems if problem]
+
+    scanned: Dict[int, ScannedProblem] = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for problems in pool.map(scan_chunk, chunks):
+            for problem in problems:
+                scanned.setdefault(problem.question_id, problem)
+    return scanned
+
+
+def read_question_readme(folder: Path) -> Optional[Dict]:
+    readme = folder / "README.md"
+    try:
+        content = readme.read_text()
+    except OSError:
+        return None
+
+    title = README_TITLE_RE.search(content)
+    difficulty = README_DIFFICULTY_RE.search(content)
+    tags = README_TAGS_RE.search(content)
+    if not title:
+        return None
+    return {
+        "question_title": title.group(1).strip(),
+        "difficulty": difficulty.group(1).strip() if difficulty else "-",
+        "topic_tags": tags.group(1).strip() if tags else "-",
+    }
+
+
+def build_row(
+    fs_manager: FileSystemManager,
+    problem: ScannedProblem,
+    existing_row: Optional[Dict],
+    lookup: Optional[Callable[[str], Optional[Dict]]] = None,
+) -> Dict:
+    from lantern.utils import get_language_extension, get_language_name
+
+    solutions_dir = fs_manager.solutions_folder.relative_to(fs_manager.root).as_posix()
+    paths = {
+        get_language_name(language): f"./{solutions_dir}/{problem.folder}/solution.{get_language_extension(language)}"
+        for language in problem.languages
+    }
+
+    if existing_row:
+        solutions = [(lang, paths[lang]) for lang, _ in existing_row["solutions"] if lang in paths]
+        known = {lang for lang, _ in solutions}
+        solutions.extend((lang, path) for lang, path in paths.items() if lang not in known)
+        return dict(existing_row, solutions=solutions, raw_line=None)
+
+    metadata = (lookup(problem.slug) if lookup else None) or read_question_readme(
+        fs_manager.solutions_folder / problem.folder
+    ) or {}
+    return {
+        "question_id": problem.question_id,
+        "title": metadata.get("question_title") or problem.slug.replace("-", " ").title(),
+        "url": f"https://leetcode.com/problems/{problem.slug}/",
+        "solutions": list(paths.items()),
+        "tags": metadata.get("topic_tags") or "-",
+        "difficulty": metadata.get("difficulty") or "-",
+        "raw_line": None,
+    }
+
+
+def reconcile(
+    fs_manager: FileSystemManager,
+    lookup: Optional[Callable[[str], Optional[Dict]]] = None,
+    workers: Optional[int] = None,
+) -> DriftReport:
+    scanned = scan_problemset(fs_manager.solutions_folder, workers)
+    existing = {row["question_id"]: row for row in fs_manager.list_rows()}
+    report = DriftReport()
+
+    report.missing = sorted(set(existing) - set(scanned))
+    report.orphaned = sorted(set(scanned) - set(existing))
+
+    for question_id in sorted(scanned):
+        row = existing.get(question_id)
+        new_row = build_row(fs_manager, scanned[question_id], row, lookup)
+        if row and list(row["solutions"]) != new_row["solutions"]:
+            report.mismatched.append(question_id)
+        report.rows.append(new_row)
+
+    return report
+
+
+def reconcile_folders(
+    fs_manager: FileSystemManager,
+    folder_names: Iterable[str],
+    lookup: Optional[Callable[[str], Optional[Dict]]] = None,
+) -> DriftReport:
+    report = DriftReport()
+    present: Dict[int, ScannedProblem] = {}
+    gone = set()
+
+    for name in folder_names:
+        match = FOLDER_RE.match(name)
+        if not match:
+            continue
+        try:
+            problem = scan_problem_folder(name, str(fs_manager.solutions_folder / name))
+        except (FileNotFoundError, NotADirectoryError):
+            problem = None
+        if problem:
+            present[problem.question_id] = problem
+        else:
+            gone.add(int(match.group(1)))
+
+    report.missing = sorted(
+        question_id
+        for question_id in gone - set(present)
+        if fs_manager.get_row(question_id) is not None
+    )
+    for question_id in sorted(present):
+        existing_row = fs_manager.get_row(question_id)
+        new_row = build_row(fs_manager, present[question_id], existing_row, lookup)
+        if existing_row is None:
+            report.orphaned.append(question_id)
+        elif list(existing_row["solutions"]) != new_row["solutions"]:
+            report.mismatched.append(question_id)
+        report.rows.append(new_row)
+
+    return report
+
+
+def apply_report(fs_manager: FileSystemManager, report: DriftReport):
+    table = fs_manager.load_table()
+    table.ensure_table()
+    for question_id in report.missing:
+        fs_manager.remove_row(table, question_id)
+        if fs_manager.index is not None:
+            fs_manager.index.remove(question_id)
+    for row in report.rows:
+        fs_manager.upsert_row(table, row)
+    if fs_manager.index is not None:
+        fs_manager.index.upsert_rows(report.rows)
+    fs_manager.save_table(table)
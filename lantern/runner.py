@@ -0,0 +1,216 @@
+import json
+import os
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from lantern.build import BuildCache, CompileError, ToolchainMissingError, compile_solution
+
+TESTS_FILENAME = "tests.json"
+RESULTS_FILENAME = "test-results.json"
+DEFAULT_TIMEOUT = 5.0
+DEFAULT_MEMORY_MB = 512
+UNCACHED_STATUSES = frozenset({"no-tests", "timeout", "compile-error", "missing-toolchain"})
+
+
+def discover_solutions(solutions_folder: Path, question_ids: Sequence[int] = ()) -> List[Dict]:
+    from lantern.rebuild import scan_problemset
+    from lantern.utils import get_language_extension
+
+    wanted = set(question_ids)
+    jobs = []
+    for question_id, problem in sorted(scan_problemset(solutions_folder).items()):
+        if wanted and question_id not in wanted:
+            continue
+        folder = solutions_folder / problem.folder
+        for language in problem.languages:
+            jobs.append({
+                "question_id": question_id,
+                "folder": str(folder),
+                "language": language,
+                "solution": str(folder / f"solution.{get_language_extension(language)}"),
+                "tests": str(folder / TESTS_FILENAME),
+            })
+    return jobs
+
+
+def job_key(job: Dict, timeout: float, memory_mb: int) -> str:
+    from lantern.utils import content_digest
+
+    parts = [job["language"].encode(), f"{timeout}:{memory_mb}".encode()]
+    for path in (job["solution"], job["tests"]):
+        try:
+            parts.append(Path(path).read_bytes())
+        except FileNotFoundError:
+            parts.append(b"")
+    return content_digest(b"\0".join(parts))
+
+
+def limit_memory(memory_mb: int) -> Optional[Callable[[], None]]:
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    def apply_limit() -> None:
+        limit = memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    return apply_limit
+
+
+def normalize_output(output: str) -> str:
+    return "\n".join(line.rstrip() for line in output.strip().splitlines())
+
+
+def run_cases(
+    command: List[str], cases: List[Dict], cwd: str, language: str, timeout: float, memory_mb: int
+) -> Dict:
+    if language == "java":
+        command = command[:1] + [f"-Xmx{memory_mb}m"] + command[1:]
+        preexec_fn = None
+    else:
+        preexec_fn = limit_memory(memory_mb)
+
+    passed = 0
+    for number, case in enumerate(cases, start=1):
+        try:
+            completed = subprocess.run(
+                command,
+                input=case.get("input", ""),
+                capture_output=True,
+                text=True,
+                cwd=cwd,
+                timeout=timeout,
+                preexec_fn=preexec_fn,
+            )
+        except subprocess.TimeoutExpired:
+            return {"status": "timeout", "passed": passed, "message": f"case {number} exceeded {timeout}s"}
+        except FileNotFoundError:
+            return {"status": "missing-toolchain", "passed": passed, "message": f"{command[0]} is not installed"}
+
+        if completed.returncode != 0:
+            message = completed.stderr.strip().splitlines()[-1:] or [f"exit code {completed.returncode}"]
+            return {"status": "error", "passed": passed, "message": f"case {number}: {message[0]}"}
+        if normalize_output(completed.stdout) != normalize_output(case.get("output", "")):
+            return {"status": "failed", "passed": passed, "message": f"case {number}: wrong answer"}
+        passed += 1
+
+    return {"status": "passed", "passed": passed, "message": ""}
+
+
+def run_job(
+    job: Dict,
+    timeout: float = DEFAULT_TIMEOUT,
+    memory_mb: int = DEFAULT_MEMORY_MB,
+    build_dir: Optional[str] = None,
+) -> Dict:
+    result = {key: job[key] for key in ("question_id", "language", "solution")}
+
+    try:
+        cases = json.loads(Path(job["tests"]).read_text())
+    except FileNotFoundError:
+        return dict(result, status="no-tests", cases=0, passed=0, message="")
+    except ValueError as e:
+        return dict(result, status="error", cases=0, passed=0, message=f"invalid {TESTS_FILENAME}: {e}")
+
+    if build_dir:
+        try:
+            command, _ = BuildCache(Path(build_dir)).build(job["language"], Path(job["solution"]))
+        except ToolchainMissingError as e:
+            return dict(result, status="missing-toolchain", cases=len(cases), passed=0, message=str(e))
+        except (CompileError, subprocess.TimeoutExpired) as e:
+            return dict(result, status="compile-error", cases=len(cases), passed=0, message=str(e))
+        outcome = run_cases(command, cases, job["folder"], job["language"], timeout, memory_mb)
+        return dict(result, cases=len(cases), **outcome)
+
+    with tempfile.TemporaryDirectory(prefix="lantern-test-") as workdir:
+        try:
+            command = compile_solution(job["language"], Path(job["solution"]), Path(workdir))
+        except ToolchainMissingError as e:
+            return dict(result, status="missing-toolchain", cases=len(cases), passed=0, message=str(e))
+        except (CompileError, subprocess.TimeoutExpired) as e:
+            return dict(result, status="compile-error", cases=len(cases), passed=0, message=str(e))
+
+        outcome = run_cases(command, cases, job["folder"], job["language"], timeout, memory_mb)
+
+    return dict(result, cases=len(cases), **outcome)
+
+
+class ResultCache:
+    def __init__(self, path: Path):
+        self.path = path
+        try:
+            self.entries: Dict[str, Dict] = json.loads(path.read_text())
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def get(self, solution: str, key: str) -> Optional[Dict]:
+        entry = self.entries.get(solution)
+        if entry and entry.get("key") == key:
+            return entry["result"]
+        return None
+
+    def set(self, solution: str, key: str, result: Dict):
+        self.entries[solution] = {"key": key, "result": result}
+
+    def save(self):
+        from lantern.utils import atomic_write_text
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(self.path, json.dumps(self.entries, indent=1, sort_keys=True))
+
+
+def run_tests(
+    jobs: Iterable[Dict],
+    cache: Optional[ResultCache] = None,
+    workers: Optional[int] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    memory_mb: int = DEFAULT_MEMORY_MB,
+    on_result: Optional[Callable[[Dict], None]] = None,
+    build_cache: Optional[BuildCache] = None,
+) -> List[Dict]:
+    results = []
+    pending = []
+    for job in jobs:
+        key = job_key(job, timeout, memory_mb)
+        cached = cache.get(job["solution"], key) if cache else None
+        if cached:
+            result = dict(cached, cached=True)
+            results.append(result)
+            if on_result:
+                on_result(result)
+        else:
+            pending.append((job, key))
+
+    build_dir = str(build_cache.path) if build_cache else None
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            futures = {
+                pool.submit(run_job, job, timeout, memory_mb, build_dir): (job, key)
+                for job, key in pending
+            }
+            for future in as_completed(futures):
+                job, key = futures[future]
+                try:
+                    result = dict(future.result(), cached=False)
+                except BrokenProcessPool as e:
+                    result = {field: job[field] for field in ("question_id", "language", "solution")}
+                    result.update(
+                        status="error", cases=0, passed=0, message=f"test worker died: {e}", cached=False
+                    )
+                else:
+                    if cache and result["status"] not in UNCACHED_STATUSES:
+                        cache.set(result["solution"], key, result)
+                results.append(result)
+                if on_result:
+                    on_result(result)
+
+    if cache:
+        cache.save()
+    if build_cache:
+        build_cache.prune()
+    return sorted(results, key=lambda result: (result["question_id"], result["language"]))
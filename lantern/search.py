@@ -0,0 +1,253 @@
+import math
+import re
+import sqlite3
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+SEARCH_FILENAME = "search.db"
+DEFAULT_LIMIT = 20
+MIN_COVERAGE = 0.4
+CANDIDATE_FACTOR = 5
+TAG_SIMILARITY = 0.5
+TAG_PREFIX = "#"
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def normalize(text: str) -> List[str]:
+    return WORD_RE.findall(text.lower())
+
+
+def trigrams(text: str) -> Set[str]:
+    grams = set()
+    for word in normalize(text):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def row_slug(row: Dict) -> str:
+    from lantern.utils import extract_question_slug
+
+    return row.get("slug") or extract_question_slug(row.get("url", "")) or ""
+
+
+def tag_key(tag: str) -> str:
+    return TAG_PREFIX + " ".join(normalize(tag))
+
+
+def title_grams(title: str, slug: str) -> Set[str]:
+    return trigrams(f"{title} {slug.replace('-', ' ')}")
+
+
+def document_grams(title: str, slug: str, tags: str) -> Set[str]:
+    from lantern.stats import split_tags
+
+    return title_grams(title, slug) | {tag_key(tag) for tag in split_tags(tags)}
+
+
+class SearchIndex:
+    def __init__(self, path: Path):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pending: Dict[int, Optional[Dict]] = {}
+
+    @classmethod
+    def default_path(cls, root: Path) -> Path:
+        from lantern.utils import get_state_dir
+
+        return get_state_dir(root) / SEARCH_FILENAME
+
+    @classmethod
+    def open_existing(cls, root: Path) -> Optional["SearchIndex"]:
+        path = cls.default_path(root)
+        return cls(path) if path.exists() else None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            with self._conn:
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS documents ("
+                    "question_id INTEGER PRIMARY KEY, slug TEXT NOT NULL, title TEXT NOT NULL, "
+                    "tags TEXT NOT NULL, difficulty TEXT NOT NULL, gram_count INTEGER NOT NULL)"
+                )
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS grams (gram TEXT PRIMARY KEY, ids BLOB NOT NULL) WITHOUT ROWID"
+                )
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+                )
+        return self._conn
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def get_meta(self, key: str) -> Optional[str]:
+        record = self._connect().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return record[0] if record else None
+
+    def set_meta(self, key: str, value: Optional[str]):
+        with self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def stage_upsert(self, row: Dict):
+        self._pending[int(row["question_id"])] = row
+
+    def stage_remove(self, question_id: int):
+        self._pending[int(question_id)] = None
+
+    def upsert_rows(self, rows: Iterable[Dict]):
+        for row in rows:
+            self.stage_upsert(row)
+        self.flush()
+
+    def remove(self, question_id: int):
+        self.stage_remove(question_id)
+        self.flush()
+
+    def flush(self):
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+        conn = self._connect()
+        added: Dict[str, Set[int]] = {}
+        removed: Dict[str, Set[int]] = {}
+
+        with conn:
+            for question_id, row in pending.items():
+                record = conn.execute(
+                    "SELECT title, slug, tags FROM documents WHERE question_id = ?", (question_id,)
+                ).fetchone()
+                old_grams = document_grams(*record) if record else set()
+
+                if row is None:
+                    new_grams: Set[str] = set()
+                    conn.execute("DELETE FROM documents WHERE question_id = ?", (question_id,))
+                else:
+                    slug = row_slug(row)
+                    new_grams = document_grams(row["title"], slug, row["tags"])
+                    conn.execute(
+                        "INSERT OR REPLACE INTO documents "
+                        "(question_id, slug, title, tags, difficulty, gram_count) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (question_id, slug, row["title"], row["tags"], row["difficulty"],
+                         len(title_grams(row["title"], slug))),
+                    )
+
+                for gram in old_grams - new_grams:
+                    removed.setdefault(gram, set()).add(question_id)
+                for gram in new_grams - old_grams:
+                    added.setdefault(gram, set()).add(question_id)
+
+            for gram in added.keys() | removed.keys():
+                record = conn.execute("SELECT ids FROM grams WHERE gram = ?", (gram,)).fetchone()
+                ids = array("I", record[0]) if record else array("I")
+                for question_id in removed.get(gram, ()):
+                    position = bisect_left(ids, question_id)
+                    if position < len(ids) and ids[position] == question_id:
+                        del ids[position]
+                for question_id in sorted(added.get(gram, ())):
+                    position = bisect_left(ids, question_id)
+                    if position == len(ids) or ids[position] != question_id:
+                        ids.insert(position, question_id)
+                if ids:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO grams (gram, ids) VALUES (?, ?)", (gram, ids.tobytes())
+                    )
+                else:
+                    conn.execute("DELETE FROM grams WHERE gram = ?", (gram,))
+
+    def rebuild(self, rows: Iterable[Dict]):
+        self._pending.clear()
+        with self._connect() as conn:
+            conn.execute("DELETE FROM documents")
+            conn.execute("DELETE FROM grams")
+        self.upsert_rows(rows)
+
+    def search(self, query: str, limit: int = DEFAULT_LIMIT) -> List[Dict]:
+        conn = self._connect()
+        terms = normalize(query)
+        query_grams = trigrams(query)
+        scores: Dict[int, float] = {}
+
+        if len(terms) == 1 and terms[0].isdigit():
+            scores[int(terms[0])] = 3.0
+
+        if query_grams:
+            placeholders = ", ".join("?" * len(query_grams))
+            counts: Counter = Counter()
+            for (ids,) in conn.execute(
+                f"SELECT ids FROM grams WHERE gram IN ({placeholders})", tuple(query_grams)
+            ):
+                counts.update(array("I", ids))
+
+            required = max(1, math.ceil(MIN_COVERAGE * len(query_grams)))
+            matched = {
+                question_id: count
+                for question_id, count in counts.most_common(limit * CANDIDATE_FACTOR)
+                if count >= required
+            }
+            if matched:
+                phrase = " ".join(terms)
+                placeholders = ", ".join("?" * len(matched))
+                for question_id, title, gram_count in conn.execute(
+                    f"SELECT question_id, title, gram_count FROM documents WHERE question_id IN ({placeholders})",
+                    tuple(matched),
+                ):
+                    count = matched[question_id]
+                    score = count / len(query_grams) + 0.25 * count / (len(query_grams) + gram_count - count)
+                    if phrase in " ".join(normalize(title)):
+                        score += 0.5
+                    scores[question_id] = max(scores.get(question_id, 0.0), score)
+
+            for tag, ids in conn.execute(
+                "SELECT gram, ids FROM grams WHERE gram >= ? AND gram < ?",
+                (TAG_PREFIX, chr(ord(TAG_PREFIX) + 1)),
+            ):
+                tag_grams = trigrams(tag[len(TAG_PREFIX):])
+                similarity = len(query_grams & tag_grams) / len(query_grams | tag_grams)
+                if similarity < TAG_SIMILARITY:
+                    continue
+                for question_id in array("I", ids)[:limit * CANDIDATE_FACTOR]:
+                    scores[question_id] = max(scores.get(question_id, 0.0), 0.9 * similarity)
+
+        if not scores:
+            return []
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit * CANDIDATE_FACTOR]
+        placeholders = ", ".join("?" * len(ranked))
+        records = {
+            record[0]: record
+            for record in conn.execute(
+                "SELECT question_id, slug, title, tags, difficulty FROM documents "
+                f"WHERE question_id IN ({placeholders})",
+                tuple(question_id for question_id, _ in ranked),
+            )
+        }
+        return [
+            self._result(records[question_id], score)
+            for question_id, score in ranked
+            if question_id in records
+        ][:limit]
+
+    @staticmethod
+    def _result(record: tuple, score: float) -> Dict:
+        return {
+            "question_id": record[0],
+            "slug": record[1],
+            "title": record[2],
+            "tags": record[3],
+            "difficulty": record[4],
+            "score": round(score, 4),
+        }
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,299 @@
+import heapq
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from lantern.table import TABLE_DIVIDER, TABLE_HEADER, ReadmeTable
+from lantern.trace import count
+
+SHARD_DIRNAME = "tables"
+DEFAULT_SHARD_SIZE = 500
+SHARD_LAYOUTS = ("range", "difficulty")
+DIFFICULTIES = ("Easy", "Medium", "Hard")
+SHARD_LINK_BASE = "../"
+
+TOC_MARKER = "<!-- lantern:shards"
+TOC_START_RE = re.compile(r"^<!-- lantern:shards by=(\w+)(?: size=(\d+))? -->$")
+TOC_END = "<!-- /lantern:shards -->"
+RANGE_NAME_RE = re.compile(r"^\d+-\d+$")
+
+
+@dataclass(frozen=True)
+class ShardLayout:
+    by: str
+    size: int = DEFAULT_SHARD_SIZE
+
+    def shard_name(self, question_id: int, difficulty: str) -> str:
+        if self.by == "range":
+            start = (question_id - 1) // self.size * self.size + 1
+            return f"{start:04d}-{start + self.size - 1:04d}"
+        return difficulty.lower() if difficulty in DIFFICULTIES else "other"
+
+    def is_shard(self, name: str) -> bool:
+        if self.by == "range":
+            return RANGE_NAME_RE.match(name) is not None
+        return name in {difficulty.lower() for difficulty in DIFFICULTIES} | {"other"}
+
+    def sort_key(self, name: str) -> Tuple[int, str]:
+        if self.by == "range":
+            return int(name.split("-")[0]), name
+        names = [difficulty.lower() for difficulty in DIFFICULTIES]
+        return (names.index(name) if name in names else len(names)), name
+
+    def title(self, name: str) -> str:
+        if self.by == "range":
+            start, end = name.split("-")
+            return f"Problems {int(start)}-{int(end)}"
+        return f"{name.title()} Problems"
+
+    def marker(self) -> str:
+        size = f" size={self.size}" if self.by == "range" else ""
+        return f"<!-- lantern:shards by={self.by}{size} -->"
+
+
+def find_toc(lines: List[str]) -> Tuple[Optional[ShardLayout], int, int]:
+    for start, line in enumerate(lines):
+        match = TOC_START_RE.match(line.strip())
+        if not match:
+            continue
+        layout = ShardLayout(match.group(1), int(match.group(2) or DEFAULT_SHARD_SIZE))
+        for end in range(start + 1, len(lines)):
+            if lines[end].strip() == TOC_END:
+                return layout, start, end + 1
+        return layout, start, len(lines)
+    return None, -1, -1
+
+
+def render_toc(layout: ShardLayout, names: Iterable[str]) -> List[str]:
+    lines = [layout.marker(), "| Problems | Table |", "|:--------:|:-----:|"]
+    for name in sorted(names, key=layout.sort_key):
+        lines.append(f"| {layout.title(name)} | [{name}.md](./{SHARD_DIRNAME}/{name}.md) |")
+    lines.append(TOC_END)
+    return lines
+
+
+def new_shard(layout: ShardLayout, name: str) -> ReadmeTable:
+    lines = [f"# {layout.title(name)}", "", "[Back to index](../README.md)", ""]
+    table = ReadmeTable(lines, SHARD_LINK_BASE)
+    table.ensure_table()
+    return table
+
+
+class ShardedTable:
+    def __init__(self, root: Path, layout: ShardLayout, readme_content: str):
+        self.root = root
+        self.layout = layout
+        self.folder = root / SHARD_DIRNAME
+        self.readme_lines = readme_content.split("\n")
+        self.readme_digest: Optional[str] = None
+        self.toc_dirty = False
+        self._shards: Dict[str, ReadmeTable] = {}
+        self._digests: Dict[str, str] = {}
+        self.names: Set[str] = set()
+        self._emptied: Set[str] = set()
+        if self.folder.is_dir():
+            self.names = {path.stem for path in self.folder.glob("*.md") if layout.is_shard(path.stem)}
+        self.start, self.end = -1, -1
+
+    @property
+    def has_table(self) -> bool:
+        return True
+
+    @property
+    def dirty(self) -> bool:
+        return self.toc_dirty or any(shard.dirty for shard in self._shards.values())
+
+    def shard_path(self, name: str) -> Path:
+        return self.folder / f"{name}.md"
+
+    def shard(self, name: str) -> ReadmeTable:
+        from lantern.utils import content_digest
+
+        table = self._shards.get(name)
+        if table is not None:
+            return table
+
+        try:
+            data = self.shard_path(name).read_bytes()
+        except FileNotFoundError:
+            table = new_shard(self.layout, name)
+        else:
+            count("bytes_read", len(data))
+            table = ReadmeTable.parse(data.decode("utf-8"), SHARD_LINK_BASE)
+            table.ensure_table()
+            self._digests[name] = content_digest(data)
+        self._shards[name] = table
+        return table
+
+    def _candidate_names(self, question_id: int) -> List[str]:
+        if self.layout.by == "range":
+            return [self.layout.shard_name(question_id, "")]
+        return sorted(self.names, key=self.layout.sort_key)
+
+    def _locate(self, question_id: int) -> Optional[str]:
+        for name in self._candidate_names(question_id):
+            if name in self.names and question_id in self.shard(name):
+                return name
+        return None
+
+    def __len__(self) -> int:
+        return sum(len(self.shard(name)) for name in self.names)
+
+    def __contains__(self, question_id: int) -> bool:
+        return self._locate(question_id) is not None
+
+    def __iter__(self) -> Iterator[Dict]:
+        shards = [self.shard(name) for name in sorted(self.names, key=self.layout.sort_key)]
+        if self.layout.by == "range":
+            for shard in shards:
+                yield from shard
+        else:
+            yield from heapq.merge(*shards, key=lambda row: row["question_id"])
+
+    def get(self, question_id: int) -> Optional[Dict]:
+        name = self._locate(question_id)
+        return self.shard(name).get(question_id) if name else None
+
+    def ensure_table(self):
+        pass
+
+    def upsert(self, row: Dict) -> bool:
+        name = self.layout.shard_name(row["question_id"], row["difficulty"])
+        current = self._locate(row["question_id"])
+        if current is not None and current != name:
+            self.shard(current).remove(row["question_id"])
+            self._drop_if_empty(current)
+        if name not in self.names:
+            self.names.add(name)
+            self._emptied.discard(name)
+            self.toc_dirty = True
+        changed = self.shard(name).upsert(row)
+        return changed or (current is not None and current != name)
+
+    def remove(self, question_id: int) -> bool:
+        name = self._locate(question_id)
+        if name is None or not self.shard(name).remove(question_id):
+            return False
+        self._drop_if_empty(name)
+        return True
+
+    def _drop_if_empty(self, name: str):
+        if len(self.shard(name)):
+            return
+        self.names.discard(name)
+        self._emptied.add(name)
+        self.toc_dirty = True
+
+    def render_readme(self) -> str:
+        layout, start, end = find_toc(self.readme_lines)
+        toc = render_toc(self.layout, self.names)
+        if layout is None:
+            self.readme_lines[-1:] = ["", *toc, ""]
+        else:
+            self.readme_lines[start:end] = toc
+        return "\n".join(self.readme_lines)
+
+    def signature(self) -> Tuple:
+        entries = []
+        if self.folder.is_dir():
+            with os.scandir(self.folder) as children:
+                for child in children:
+                    if child.name.endswith(".md"):
+                        stat = child.stat()
+                        entries.append((child.name, stat.st_mtime_ns, stat.st_size))
+        return tuple(sorted(entries))
+
+    def digest(self) -> str:
+        from lantern.utils import content_digest
+
+        return content_digest(f"{self.readme_digest}{self.signature()!r}".encode())
+
+    def save(self, readme_path: Path) -> List[Path]:
+        from lantern.utils import atomic_write_text, content_digest
+
+        written = []
+        for name in self._emptied:
+            self._shards.pop(name, None)
+            self._digests.pop(name, None)
+            try:
+                self.shard_path(name).unlink()
+            except FileNotFoundError:
+                pass
+        self._emptied.clear()
+        if self.folder.is_dir() and not any(self.folder.iterdir()):
+            self.folder.rmdir()
+
+        for name, shard in self._shards.items():
+            if not shard.dirty:
+                continue
+            self.folder.mkdir(exist_ok=True)
+            content = shard.render()
+            path = self.shard_path(name)
+            atomic_write_text(path, content, self._digests.get(name))
+            self._digests[name] = content_digest(content.encode("utf-8"))
+            shard.dirty = False
+            written.append(path)
+
+        if self.toc_dirty:
+            content = self.render_readme()
+            atomic_write_text(readme_path, content, self.readme_digest)
+            self.readme_digest = content_digest(content.encode("utf-8"))
+            self.toc_dirty = False
+            written.append(readme_path)
+        return written
+
+
+def remove_table(lines: List[str]) -> Tuple[List[str], int]:
+    table = ReadmeTable(list(lines))
+    if not table.has_table:
+        return lines, len(lines)
+    return lines[:table.start] + lines[table.end:], table.start
+
+
+def write_layout(root: Path, readme_path: Path, rows: List[Dict], layout: Optional[ShardLayout]):
+    from lantern.utils import atomic_write_text
+
+    lines = readme_path.read_text().split("\n")
+    _, toc_start, toc_end = find_toc(lines)
+    if toc_start != -1:
+        lines = lines[:toc_start] + lines[toc_end:]
+        position = toc_start
+    else:
+        lines, position = remove_table(lines)
+
+    folder = root / SHARD_DIRNAME
+    stale = set()
+    if folder.is_dir():
+        stale = {
+            path.stem
+            for path in folder.glob("*.md")
+            if any(ShardLayout(by).is_shard(path.stem) for by in SHARD_LAYOUTS)
+        }
+
+    if layout is None:
+        table = ReadmeTable(lines[:position] + [TABLE_HEADER, TABLE_DIVIDER] + lines[position:])
+        for row in rows:
+            table.upsert(row)
+        atomic_write_text(readme_path, table.render())
+    else:
+        shards: Dict[str, ReadmeTable] = {}
+        for row in rows:
+            name = layout.shard_name(row["question_id"], row["difficulty"])
+            if name not in shards:
+                shards[name] = new_shard(layout, name)
+            shards[name].upsert(row)
+
+        if shards:
+            folder.mkdir(exist_ok=True)
+        for name, shard in shards.items():
+            atomic_write_text(folder / f"{name}.md", shard.render())
+            stale.discard(name)
+        lines[position:position] = render_toc(layout, shards)
+        atomic_write_text(readme_path, "\n".join(lines))
+
+    for name in stale:
+        (folder / f"{name}.md").unlink()
+    if folder.is_dir() and not any(folder.iterdir()):
+        folder.rmdir()
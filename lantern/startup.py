@@ -0,0 +1,48 @@
+import re
+import subprocess
+import sys
+from typing import List, Sequence, Tuple
+
+HEADLESS_MODULES = ("lantern.cli",)
+HEAVY_MODULES = ("textual", "rich", "aiohttp")
+HEADLESS_IMPORT_BUDGET_MS = 300
+
+IMPORT_TIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def profile_imports(modules: Sequence[str] = HEADLESS_MODULES) -> List[Tuple[str, int, int, int]]:
+    statement = "; ".join(f"import {module}" for module in modules)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    entries = []
+    for line in completed.stderr.splitlines():
+        match = IMPORT_TIME_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return entries
+
+
+def loaded_modules(modules: Sequence[str] = HEADLESS_MODULES) -> List[str]:
+    statement = "; ".join(f"import {module}" for module in modules)
+    completed = subprocess.run(
+        [sys.executable, "-c", f"{statement}; import sys; print('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return completed.stdout.split()
+
+
+def format_profile(entries: List[Tuple[str, int, int, int]], top: int = 20) -> str:
+    total_us = sum(cumulative for _, _, cumulative, depth in entries if depth == 0)
+    lines = [f"{'module':<40} {'self ms':>10} {'cumulative ms':>14}"]
+    for name, self_us, cumulative_us, _ in sorted(entries, key=lambda e: e[2], reverse=True)[:top]:
+        lines.append(f"{name:<40} {self_us / 1000:>10.2f} {cumulative_us / 1000:>14.2f}")
+    lines.append(f"{'total':<40} {'':>10} {total_us / 1000:>14.2f}")
+    return "\n".join(lines)
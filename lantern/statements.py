@@ -0,0 +1,232 @@
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+STATEMENTS_FILENAME = "statements.db"
+CODECS = ("zdict1", "zlib", "lzma")
+DEFAULT_CODEC = "zdict1"
+
+# Boilerplate shared by most statement bodies, used as a zlib preset
+# dictionary. Blobs record the codec, so changing this text needs a new codec
+# name rather than an edit.
+STATEMENT_DICTIONARY = (
+    "<p>&nbsp;</p>\n<p><strong>Follow-up:</strong>&nbsp;"
+    "<p>&nbsp;</p>\n<p><strong>Constraints:</strong></p>\n\n<ul>\n\t<li><code>"
+    "</code></li>\n\t<li><code>-10<sup>4</sup> &lt;= nums[i] &lt;= 10<sup>4</sup></code></li>\n</ul>\n"
+    "<p>Return <em>the</em> <code>true</code> <code>false</code> array of integers <code>nums</code> "
+    "string <code>s</code> an integer <code>target</code> <code>n</code> <code>k</code>\n"
+    "<p>&nbsp;</p>\n<p><strong class=\"example\">Example 1:</strong></p>\n\n"
+    "<pre>\n<strong>Input:</strong> nums = [\n<strong>Output:</strong> \n"
+    "<strong>Explanation:</strong> \n</pre>\n\n"
+    "<p><strong class=\"example\">Example 2:</strong></p>\n\n"
+    "<p><strong class=\"example\">Example 3:</strong></p>\n\n"
+).encode("utf-8")
+
+
+def compress(data: bytes, codec: str) -> bytes:
+    if codec == "zdict1":
+        import zlib
+
+        compressor = zlib.compressobj(9, zdict=STATEMENT_DICTIONARY)
+        return compressor.compress(data) + compressor.flush()
+    if codec == "zlib":
+        import zlib
+
+        return zlib.compress(data, 9)
+    if codec == "lzma":
+        import lzma
+
+        return lzma.compress(data, format=lzma.FORMAT_ALONE, preset=9)
+    raise ValueError(f"Unknown statement codec: {codec}")
+
+
+def decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zdict1":
+        import zlib
+
+        decompressor = zlib.decompressobj(zdict=STATEMENT_DICTIONARY)
+        return decompressor.decompress(data) + decompressor.flush()
+    if codec == "zlib":
+        import zlib
+
+        return zlib.decompress(data)
+    if codec == "lzma":
+        import lzma
+
+        return lzma.decompress(data, format=lzma.FORMAT_ALONE)
+    raise ValueError(f"Unknown statement codec: {codec}")
+
+
+def render_question_readme(problem_data: Dict, statement: Optional[Dict] = None) -> str:
+    content = f"# {problem_data['question_id']}. {problem_data['question_title']}\n\n"
+    content += f"**Difficulty:** {problem_data['difficulty']}\n\n"
+    content += f"**Tags:** {problem_data['topic_tags']}\n\n"
+    content += f"**Link:** https://leetcode.com/problems/{problem_data['question_slug']}/\n"
+    if statement is None:
+        return content
+
+    content += f"\n## Description\n\n{statement['content'].strip()}\n"
+    if statement["examples"].strip():
+        content += f"\n## Example Testcases\n\n```\n{statement['examples'].strip()}\n```\n"
+    if statement["hints"]:
+        content += "\n## Hints\n"
+        for number, hint in enumerate(statement["hints"], start=1):
+            content += f"\n<details>\n<summary>Hint {number}</summary>\n\n{hint.strip()}\n\n</details>\n"
+    return content
+
+
+class StatementStore:
+    def __init__(self, path: Path, codec: str = DEFAULT_CODEC):
+        if codec not in CODECS:
+            raise ValueError(f"Unknown statement codec: {codec}")
+        self.path = path
+        self.codec = codec
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @classmethod
+    def default_path(cls, root: Path) -> Path:
+        from lantern.utils import get_state_dir
+
+        return get_state_dir(root) / STATEMENTS_FILENAME
+
+    @classmethod
+    def open_existing(cls, root: Path) -> Optional["StatementStore"]:
+        path = cls.default_path(root)
+        return cls(path) if path.exists() else None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            with self._conn:
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS blobs ("
+                    "digest TEXT PRIMARY KEY, codec TEXT NOT NULL, size INTEGER NOT NULL, "
+                    "data BLOB NOT NULL)"
+                )
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS statements ("
+                    "slug TEXT PRIMARY KEY, problem TEXT NOT NULL, content TEXT NOT NULL, "
+                    "hints TEXT NOT NULL, examples TEXT NOT NULL, fetched_at REAL NOT NULL)"
+                )
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS renders (slug TEXT PRIMARY KEY, digest TEXT NOT NULL)"
+                )
+        return self._conn
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM statements").fetchone()[0]
+
+    def __contains__(self, slug: str) -> bool:
+        row = self._connect().execute(
+            "SELECT 1 FROM statements WHERE slug = ?", (slug,)
+        ).fetchone()
+        return row is not None
+
+    def _put_blob(self, conn: sqlite3.Connection, text: str) -> str:
+        from lantern.utils import content_digest
+
+        data = text.encode("utf-8")
+        digest = content_digest(data)
+        exists = conn.execute("SELECT 1 FROM blobs WHERE digest = ?", (digest,)).fetchone()
+        if exists is None:
+            conn.execute(
+                "INSERT INTO blobs (digest, codec, size, data) VALUES (?, ?, ?, ?)",
+                (digest, self.codec, len(data), compress(data, self.codec)),
+            )
+        return digest
+
+    def _get_blob(self, digest: str) -> str:
+        row = self._connect().execute(
+            "SELECT codec, data FROM blobs WHERE digest = ?", (digest,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"Missing statement blob {digest}")
+        codec, data = row
+        return decompress(data, codec).decode("utf-8")
+
+    def set(self, slug: str, problem_data: Dict, statement: Dict):
+        self.set_many([(slug, problem_data, statement)])
+
+    def set_many(self, entries: Iterable[Tuple[str, Dict, Dict]]):
+        conn = self._connect()
+        replaced = set()
+        with conn:
+            for slug, problem_data, statement in entries:
+                previous = conn.execute(
+                    "SELECT content, hints, examples FROM statements WHERE slug = ?", (slug,)
+                ).fetchone()
+                if previous is not None:
+                    replaced.update(previous)
+                conn.execute(
+                    "INSERT OR REPLACE INTO statements "
+                    "(slug, problem, content, hints, examples, fetched_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        slug,
+                        json.dumps(problem_data),
+                        self._put_blob(conn, statement["content"]),
+                        self._put_blob(conn, json.dumps(statement["hints"])),
+                        self._put_blob(conn, statement["examples"]),
+                        time.time(),
+                    ),
+                )
+            for digest in replaced:
+                conn.execute(
+                    "DELETE FROM blobs WHERE digest = ? AND NOT EXISTS ("
+                    "SELECT 1 FROM statements WHERE content = ? OR hints = ? OR examples = ?)",
+                    (digest, digest, digest, digest),
+                )
+
+    def get(self, slug: str) -> Optional[Dict]:
+        row = self._connect().execute(
+            "SELECT content, hints, examples FROM statements WHERE slug = ?", (slug,)
+        ).fetchone()
+        if row is None:
+            return None
+        content, hints, examples = row
+        return {
+            "content": self._get_blob(content),
+            "hints": json.loads(self._get_blob(hints)),
+            "examples": self._get_blob(examples),
+        }
+
+    def get_problem(self, slug: str) -> Optional[Dict]:
+        row = self._connect().execute(
+            "SELECT problem FROM statements WHERE slug = ?", (slug,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def rendered_digest(self, slug: str) -> Optional[str]:
+        row = self._connect().execute(
+            "SELECT digest FROM renders WHERE slug = ?", (slug,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_rendered(self, slug: str, digest: str):
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO renders (slug, digest) VALUES (?, ?)", (slug, digest)
+            )
+
+    def missing(self, slugs: Iterable[str]) -> List[str]:
+        return [slug for slug in dict.fromkeys(slugs) if slug not in self]
+
+    def usage(self) -> Dict[str, int]:
+        conn = self._connect()
+        blobs, raw_bytes, stored_bytes = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(LENGTH(data)), 0) FROM blobs"
+        ).fetchone()
+        return {
+            "statements": len(self),
+            "blobs": blobs,
+            "raw_bytes": raw_bytes,
+            "stored_bytes": stored_bytes,
+        }
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,166 @@
+import datetime
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+STATS_FILENAME = "stats.json"
+STATS_VERSION = 1
+
+
+def split_tags(tags: str) -> List[str]:
+    return [tag.strip() for tag in tags.split(",") if tag.strip() and tag.strip() != "-"]
+
+
+def adjust(counter: Dict[str, int], key: str, delta: int):
+    counter[key] = counter.get(key, 0) + delta
+    if counter[key] <= 0:
+        del counter[key]
+
+
+class StatsStore:
+    def __init__(self, path: Path):
+        self.path = path
+        self.data = self.empty()
+        self.dirty = False
+
+    @classmethod
+    def default_path(cls, root: Path) -> Path:
+        from lantern.utils import get_state_dir
+
+        return get_state_dir(root) / STATS_FILENAME
+
+    @classmethod
+    def open_existing(cls, root: Path) -> Optional["StatsStore"]:
+        path = cls.default_path(root)
+        if not path.exists():
+            return None
+        store = cls(path)
+        store.load()
+        return store
+
+    @staticmethod
+    def empty() -> Dict:
+        return {
+            "version": STATS_VERSION,
+            "readme_digest": None,
+            "rows": {},
+            "difficulty": {},
+            "language": {},
+            "tags": {},
+            "solved_on": {},
+        }
+
+    def load(self):
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            data = None
+        if not data or data.get("version") != STATS_VERSION:
+            data = self.empty()
+        self.data = data
+
+    def save(self):
+        from lantern.utils import atomic_write_text
+
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(self.path, json.dumps(self.data, sort_keys=True))
+        self.dirty = False
+
+    def _apply(self, contribution: Dict, delta: int):
+        adjust(self.data["difficulty"], contribution["difficulty"], delta)
+        for language in contribution["languages"]:
+            adjust(self.data["language"], language, delta)
+        for tag in contribution["tags"]:
+            adjust(self.data["tags"], tag, delta)
+        if contribution.get("solved_on"):
+            adjust(self.data["solved_on"], contribution["solved_on"], delta)
+
+    def remove_row(self, question_id: int):
+        previous = self.data["rows"].pop(str(question_id), None)
+        if previous is not None:
+            self._apply(previous, -1)
+            self.dirty = True
+
+    def update_row(self, row: Dict, solved_on: Optional[str] = None):
+        key = str(row["question_id"])
+        previous = self.data["rows"].get(key)
+        contribution = {
+            "difficulty": row["difficulty"],
+            "languages": sorted({lang for lang, _ in row["solutions"]}),
+            "tags": split_tags(row["tags"]),
+            "solved_on": previous["solved_on"] if previous else (
+                solved_on or datetime.date.today().isoformat()
+            ),
+        }
+        if previous == contribution:
+            return
+
+        if previous is not None:
+            self._apply(previous, -1)
+        self._apply(contribution, 1)
+        self.data["rows"][key] = contribution
+        self.dirty = True
+
+    def rebuild(self, rows: Iterable[Dict], root: Optional[Path] = None):
+        self.data = dict(self.empty(), readme_digest=self.data.get("readme_digest"))
+        for row in rows:
+            self.update_row(row, solved_on=solution_date(root, row) if root else None)
+        self.dirty = True
+
+    def summary(self, tag_totals: Optional[Dict[str, int]] = None) -> Dict:
+        solved_over_time = []
+        running_total = 0
+        for day in sorted(self.data["solved_on"]):
+            running_total += self.data["solved_on"][day]
+            solved_over_time.append({"date": day, "solved": self.data["solved_on"][day], "total": running_total})
+
+        summary = {
+            "total": len(self.data["rows"]),
+            "difficulty": dict(sorted(self.data["difficulty"].items())),
+            "language": dict(sorted(self.data["language"].items(), key=lambda item: -item[1])),
+            "tags": dict(sorted(self.data["tags"].items(), key=lambda item: -item[1])),
+            "solved_over_time": solved_over_time,
+        }
+        if tag_totals:
+            summary["tag_coverage"] = {
+                tag: {"solved": solved, "total": tag_totals[tag], "ratio": solved / tag_totals[tag]}
+                for tag, solved in summary["tags"].items()
+                if tag_totals.get(tag)
+            }
+        return summary
+
+
+def solution_date(root: Path, row: Dict) -> Optional[str]:
+    timestamps = []
+    for _, path in row["solutions"]:
+        try:
+            timestamps.append((root / path).stat().st_mtime)
+        except OSError:
+            continue
+    if not timestamps:
+        return None
+    return datetime.date.fromtimestamp(min(timestamps)).isoformat()
+
+
+def format_summary(summary: Dict) -> str:
+    lines = [f"Total solved: {summary['total']}", ""]
+    for title, key in (("Difficulty", "difficulty"), ("Languages", "language"), ("Top tags", "tags")):
+        lines.append(f"{title}:")
+        for name, count in list(summary[key].items())[:10]:
+            lines.append(f"  {name:<24} {count:>6}")
+        lines.append("")
+
+    coverage = summary.get("tag_coverage")
+    if coverage:
+        lines.append("Tag coverage:")
+        for tag, entry in list(coverage.items())[:10]:
+            lines.append(f"  {tag:<24} {entry['solved']:>6}/{entry['total']:<6} {entry['ratio']:>6.1%}")
+        lines.append("")
+
+    if summary["solved_over_time"]:
+        lines.append("Solved over time:")
+        for entry in summary["solved_over_time"][-10:]:
+            lines.append(f"  {entry['date']}  +{entry['solved']:<4} total {entry['total']}")
+    return "\n".join(lines).rstrip()
@@ -0,0 +1,176 @@
+import bisect
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+
+TABLE_HEADER = "| # | Title | Solution | Tags | Difficulty |"
+TABLE_DIVIDER = "|:----:|:--------:|:--------:|:-------:|:----------:|"
+
+TABLE_HEADER_RE = re.compile(r"#.*Title.*Solution.*Tags.*Difficulty", re.IGNORECASE)
+QUESTION_ID_RE = re.compile(r"(\d+)")
+LINK_RE = re.compile(r"\[([^\]]+)\]\(([^\)]+)\)")
+
+ROW_FIELDS = ("question_id", "title", "url", "solutions", "tags", "difficulty")
+
+
+def find_table(lines: List[str]) -> Tuple[int, int]:
+    table_start = -1
+    for i, line in enumerate(lines):
+        if TABLE_HEADER_RE.search(line):
+            table_start = i
+            break
+
+    if table_start == -1:
+        return -1, -1
+
+    for i in range(table_start + 1, len(lines)):
+        if not lines[i].strip().startswith("|") or lines[i].strip() == "":
+            return table_start, i
+
+    return table_start, len(lines)
+
+
+def parse_row(line: str) -> Optional[Dict]:
+    line = line.strip()
+    if not line.startswith("|"):
+        return None
+
+    parts = [p.strip() for p in line.split("|")[1:-1]]
+    if len(parts) < 5:
+        return None
+
+    question_id_match = QUESTION_ID_RE.search(parts[0])
+    if not question_id_match:
+        return None
+
+    title_match = LINK_RE.search(parts[1])
+    return {
+        "question_id": int(question_id_match.group(1)),
+        "title": title_match.group(1) if title_match else parts[1],
+        "url": title_match.group(2) if title_match else "",
+        "solutions": LINK_RE.findall(parts[2]),
+        "tags": parts[3],
+        "difficulty": parts[4],
+        "raw_line": line,
+    }
+
+
+def render_row(row: Dict) -> str:
+    from lantern.utils import format_question_id
+
+    formatted_id = format_question_id(str(row["question_id"]))
+    title_link = f"[{row['title']}]({row['url']})"
+    solution_links = [f"[{lang}]({path})" for lang, path in row["solutions"]]
+    solution_str = ", ".join(solution_links) if solution_links else "-"
+    return f"| {formatted_id} | {title_link} | {solution_str} | {row['tags']} | {row['difficulty']} |"
+
+
+def rebase_links(solutions: List[Tuple[str, str]], old: str, new: str) -> List[Tuple[str, str]]:
+    return [
+        (lang, new + path[len(old):] if path.startswith(old) else path)
+        for lang, path in solutions
+    ]
+
+
+def rows_equal(a: Dict, b: Dict) -> bool:
+    return all(a[field] == b[field] for field in ROW_FIELDS)
+
+
+class ReadmeTable:
+    def __init__(self, lines: List[str], link_base: str = "./"):
+        self.lines = lines
+        self.link_base = link_base
+        self.start, self.end = find_table(lines)
+        self.dirty = False
+        self._ids: List[int] = []
+        self._rows: Dict[int, Dict] = {}
+        self._passthrough: List[Tuple[int, str]] = []
+
+        if self.start == -1:
+            return
+
+        previous_id = -1
+        for i in range(self.start + 2, self.end):
+            row = parse_row(self.lines[i])
+            if row is None or row["question_id"] in self._rows:
+                self._passthrough.append((previous_id, self.lines[i]))
+                continue
+            if link_base != "./":
+                row["solutions"] = rebase_links(row["solutions"], link_base, "./")
+            bisect.insort(self._ids, row["question_id"])
+            self._rows[row["question_id"]] = row
+            previous_id = row["question_id"]
+
+    @classmethod
+    def parse(cls, content: str, link_base: str = "./") -> "ReadmeTable":
+        return cls(content.split("\n"), link_base)
+
+    @property
+    def has_table(self) -> bool:
+        return self.start != -1
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, question_id: int) -> bool:
+        return question_id in self._rows
+
+    def __iter__(self) -> Iterator[Dict]:
+        for question_id in self._ids:
+            yield self._rows[question_id]
+
+    def get(self, question_id: int) -> Optional[Dict]:
+        return self._rows.get(question_id)
+
+    def ensure_table(self):
+        if self.has_table:
+            return
+
+        if self.lines[-1] != "":
+            self.lines.append("")
+        self.lines[-1:] = ["", TABLE_HEADER, TABLE_DIVIDER, ""]
+        self.start, self.end = len(self.lines) - 3, len(self.lines) - 1
+        self.dirty = True
+
+    def upsert(self, row: Dict) -> bool:
+        question_id = row["question_id"]
+        existing = self._rows.get(question_id)
+        if existing is not None and rows_equal(existing, row):
+            return False
+
+        if existing is None:
+            bisect.insort(self._ids, question_id)
+        self._rows[question_id] = dict(row, raw_line=None)
+        self.dirty = True
+        return True
+
+    def remove(self, question_id: int) -> bool:
+        if question_id not in self._rows:
+            return False
+
+        del self._rows[question_id]
+        del self._ids[bisect.bisect_left(self._ids, question_id)]
+        self.dirty = True
+        return True
+
+    def render(self) -> str:
+        self.ensure_table()
+
+        passthrough = sorted(self._passthrough, key=lambda entry: entry[0])
+        row_lines = []
+        for question_id in self._ids:
+            while passthrough and passthrough[0][0] < question_id:
+                row_lines.append(passthrough.pop(0)[1])
+            row = self._rows[question_id]
+            if not row.get("raw_line"):
+                if self.link_base != "./":
+                    row["raw_line"] = render_row(
+                        dict(row, solutions=rebase_links(row["solutions"], "./", self.link_base))
+                    )
+                else:
+                    row["raw_line"] = render_row(row)
+            row_lines.append(row["raw_line"])
+        row_lines.extend(line for _, line in passthrough)
+
+        self.lines[self.start + 2:self.end] = row_lines
+        self.end = self.start + 2 + len(row_lines)
+        return "\n".join(self.lines)
@@ -0,0 +1,182 @@
+import functools
+import inspect
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+_tracer: Optional["Tracer"] = None
+
+
+class Tracer:
+    def __init__(self, started_ns: Optional[int] = None):
+        self.started_ns = started_ns if started_ns is not None else time.perf_counter_ns()
+        self.pid = os.getpid()
+        self.events: List[Dict] = []
+        self.counters: Dict[str, float] = {}
+        self.threads: Dict[int, str] = {}
+        self._task_ids: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def timestamp(self, ns: Optional[int] = None) -> float:
+        return ((ns if ns is not None else time.perf_counter_ns()) - self.started_ns) / 1000
+
+    def current_tid(self) -> int:
+        tid = threading.get_ident()
+        asyncio = sys.modules.get("asyncio")
+        task = None
+        if asyncio is not None:
+            try:
+                task = asyncio.current_task()
+            except RuntimeError:
+                pass
+        if task is None:
+            self.threads.setdefault(tid, threading.current_thread().name)
+            return tid
+
+        with self._lock:
+            task_tid = self._task_ids.get(id(task))
+            if task_tid is None:
+                task_tid = self._task_ids[id(task)] = len(self._task_ids) + 1
+                self.threads[task_tid] = f"task {task.get_name()}"
+        return task_tid
+
+    def add_span(self, name: str, category: str, start_ns: int, end_ns: int, tid: int, args: Dict):
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": self.timestamp(start_ns),
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": self.pid,
+            "tid": tid,
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def count(self, name: str, value: float):
+        with self._lock:
+            total = self.counters[name] = self.counters.get(name, 0) + value
+        self.events.append({
+            "name": name,
+            "ph": "C",
+            "ts": self.timestamp(),
+            "pid": self.pid,
+            "args": {"value": total},
+        })
+
+    def chrome_trace(self) -> Dict:
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": name}}
+            for tid, name in self.threads.items()
+        ]
+        return {
+            "traceEvents": metadata + sorted(self.events, key=lambda event: event["ts"]),
+            "displayTimeUnit": "ms",
+            "otherData": {"counters": dict(self.counters)},
+        }
+
+    def save(self, path: Path):
+        import json
+
+        from lantern.utils import atomic_write_text
+
+        atomic_write_text(Path(path), json.dumps(self.chrome_trace()))
+
+
+class Span:
+    __slots__ = ("tracer", "name", "category", "args", "tid", "start_ns")
+
+    def __init__(self, tracer: Tracer, name: str, category: str, args: Dict):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self) -> "Span":
+        self.tid = self.tracer.current_tid()
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer.add_span(self.name, self.category, self.start_ns, end_ns, self.tid, self.args)
+
+    def set(self, **args):
+        self.args.update(args)
+
+
+class NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+    def set(self, **args):
+        pass
+
+
+NULL_SPAN = NullSpan()
+
+
+def enable(started_ns: Optional[int] = None) -> Tracer:
+    global _tracer
+    _tracer = Tracer(started_ns)
+    return _tracer
+
+
+def disable() -> Optional[Tracer]:
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def active() -> Optional[Tracer]:
+    return _tracer
+
+
+def span(name: str, category: str = "lantern", **args):
+    if _tracer is None:
+        return NULL_SPAN
+    return Span(_tracer, name, category, args)
+
+
+def count(name: str, value: float = 1):
+    if _tracer is not None:
+        _tracer.count(name, value)
+
+
+def traced(name: Optional[str] = None, category: str = "lantern") -> Callable[[F], F]:
+    def decorate(func: F) -> F:
+        label = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _tracer is None:
+                    return await func(*args, **kwargs)
+                with Span(_tracer, label, category, {}):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with Span(_tracer, label, category, {}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
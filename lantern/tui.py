@@ -1,19 +1,23 @@
+import asyncio
 from pathlib import Path
 from typing import Optional
 
-import aiohttp
 from rich.text import Text
 from textual import on, work
+from textual.worker import get_current_worker
 from textual.app import App, ComposeResult
 from textual.containers import Center, Container, Horizontal, Vertical
 from textual.widgets import Input, Label, LoadingIndicator, Select, Static
 
+from lantern.api import Lantern
 from lantern.ascii_art import CAT_FRAMES, LANTERN_ASCII
-from lantern.filesystem import FileSystemManager
-from lantern.leetcode import LeetCodeClient
+from lantern.leetcode import LeetCodeError
 from lantern.theme import CatppuccinMocha
 from lantern.utils import extract_question_slug
 
+PROCESS_STEPS = 3
+PREFETCH_DEBOUNCE = 0.3
+
 
 class AnimatedCat(Static):
     def __init__(self, *args, **kwargs):
@@ -81,7 +85,7 @@ class WelcomeScreen(Container):
                     classes="url-input",
                 )
             with Center():
-                yield Label("q: quit, enter: continue", classes="footer")
+                yield Label("q: quit, enter: continue, ctrl+s: stats, ctrl+b: browse", classes="footer")
             with Center():
                 yield Label(
                     "Created by Abhinav Singh. (github/ab1nv)",
@@ -111,13 +115,39 @@ class LanguageSelectScreen(Container):
                 )
 
 
+class StatsScreen(Container):
+    def __init__(self, summary: dict, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.summary = summary
+
+    def compose(self) -> ComposeResult:
+        from lantern.stats import format_summary
+
+        with Vertical():
+            with Center():
+                yield Label("Stats", classes="select-title")
+            with Center():
+                yield Static(format_summary(self.summary), classes="stats-body")
+            with Center():
+                yield Label("esc: back, q: quit", classes="footer")
+
+
 class LoadingScreen(Container):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.message = "Loading..."
+
     def compose(self) -> ComposeResult:
         with Vertical():
             with Center():
                 yield LoadingIndicator(classes="loader")
             with Center():
-                yield Label("Loading...", classes="loading-text")
+                yield Label(self.message, classes="loading-text")
+
+    def set_progress(self, message: str, step: int, total: int) -> None:
+        self.message = f"{message}... ({step}/{total})"
+        for label in self.query(".loading-text").results(Label):
+            label.update(self.message)
 
 
 class LanternApp(App):
@@ -187,6 +217,26 @@ class LanternApp(App):
         width: 40;
     }
     
+    .stats-body {
+        color: #cdd6f4;
+        width: auto;
+    }
+    
+    .browse-vertical {
+        width: 100%;
+        height: 100%;
+        padding: 1 2;
+    }
+    
+    .browse-status {
+        color: #bac2de;
+        margin-bottom: 1;
+    }
+    
+    .browse-table {
+        height: 1fr;
+    }
+    
     .loader {
         margin-top: 10;
     }
@@ -199,24 +249,40 @@ class LanternApp(App):
 
     ENABLE_COMMAND_PALETTE = False
 
+    BINDINGS = [("ctrl+s", "show_stats", "Stats"), ("ctrl+b", "browse", "Browse")]
+
     def __init__(self, root_dir: Path):
         super().__init__()
         self.root_dir = root_dir
         self.url: Optional[str] = None
         self.language: Optional[str] = None
         self.problem_data: Optional[dict] = None
-        self.fs_manager = FileSystemManager(root_dir)
-        self.leetcode_client = LeetCodeClient()
+        self.lantern = Lantern(root_dir)
+        self.fs_manager = self.lantern.fs_manager
+        self.leetcode_client = self.lantern.client
+        self.prefetch_slug: Optional[str] = None
+        self.prefetch_task: Optional[asyncio.Task] = None
+        self.prefetch_timer = None
 
     def compose(self) -> ComposeResult:
         yield WelcomeScreen()
 
     def on_mount(self) -> None:
-        self.fs_manager.initialize()
+        self.lantern.initialize()
         welcome = self.query_one(WelcomeScreen)
         input_widget = welcome.query_one(Input)
         input_widget.focus()
 
+    @on(Input.Changed, ".url-input")
+    def handle_url_changed(self, event: Input.Changed) -> None:
+        if self.prefetch_timer is not None:
+            self.prefetch_timer.stop()
+            self.prefetch_timer = None
+
+        slug = extract_question_slug(event.value.strip())
+        if slug:
+            self.prefetch_timer = self.set_timer(PREFETCH_DEBOUNCE, lambda: self.start_prefetch(slug))
+
     @on(Input.Submitted, ".url-input")
     def handle_url_submit(self, event: Input.Submitted) -> None:
         url = event.value.strip()
@@ -229,8 +295,31 @@ class LanternApp(App):
             return
 
         self.url = url
+        self.start_prefetch(slug)
         self.switch_to_language_select()
 
+    def start_prefetch(self, slug: str) -> None:
+        if self.prefetch_slug == slug and self.prefetch_task is not None:
+            return
+
+        self.cancel_prefetch()
+        self.prefetch_slug = slug
+        self.prefetch_task = asyncio.create_task(self.leetcode_client.fetch_problem_data(slug))
+        self.prefetch_task.add_done_callback(self.prefetch_done)
+
+    def prefetch_done(self, task: asyncio.Task) -> None:
+        if task.cancelled():
+            return
+        if task.exception() is not None and self.prefetch_task is task:
+            self.prefetch_slug = None
+            self.prefetch_task = None
+
+    def cancel_prefetch(self) -> None:
+        if self.prefetch_task is not None:
+            self.prefetch_task.cancel()
+        self.prefetch_slug = None
+        self.prefetch_task = None
+
     @on(Select.Changed, ".language-select")
     def handle_language_change(self, event: Select.Changed) -> None:
         if event.value != Select.BLANK:
@@ -240,8 +329,7 @@ class LanternApp(App):
     def switch_to_language_select(self) -> None:
         self.mount(LanguageSelectScreen(), before=self.query_one(WelcomeScreen))
         self.query_one(WelcomeScreen).remove()
-        select_widget = self.query_one(Select)
-        select_widget.focus()
+        self.call_after_refresh(lambda: self.query_one(Select).focus())
 
     def switch_to_loading(self) -> None:
         self.mount(LoadingScreen(), before=self.query_one(LanguageSelectScreen))
@@ -258,33 +346,90 @@ class LanternApp(App):
             self.notify("Invalid URL", severity="error")
             return
 
-        async with aiohttp.ClientSession() as session:
-            self.problem_data = await self.leetcode_client.fetch_problem_data(
-                session, slug
-            )
-
-        if not self.problem_data:
-            self.notify("Failed to fetch problem data", severity="error")
+        self.report_progress("Fetching problem data", 1)
+        try:
+            self.start_prefetch(slug)
+            self.problem_data = await self.prefetch_task
+        except LeetCodeError as e:
+            self.notify(f"Failed to fetch problem data: {e}", severity="error")
             return
 
         self.process_problem()
 
+    def report_progress(self, message: str, step: int) -> None:
+        loading = self.query(LoadingScreen)
+        if loading:
+            loading.first().set_progress(message, step, PROCESS_STEPS)
+
+    @work(thread=True, exclusive=True, group="process")
     def process_problem(self) -> None:
-        if not self.problem_data or not self.language:
+        problem_data, language = self.problem_data, self.language
+        if not problem_data or not language:
+            return
+
+        worker = get_current_worker()
+        try:
+            self.call_from_thread(self.report_progress, "Creating problem folder", 2)
+            self.lantern.scaffold(problem_data, language)
+            if worker.is_cancelled:
+                return
+
+            self.call_from_thread(self.report_progress, "Updating README table", 3)
+            self.fs_manager.update_readme_table(problem_data, language)
+        except OSError as e:
+            self.call_from_thread(self.notify, f"Failed to write files: {e}", severity="error")
             return
 
-        question_folder = self.fs_manager.ensure_question_folder(
-            self.problem_data["question_id"], self.problem_data["question_slug"]
-        )
-        self.fs_manager.ensure_question_readme(question_folder, self.problem_data)
-        self.fs_manager.ensure_solution_file(question_folder, self.language)
-        self.fs_manager.update_readme_table(self.problem_data, self.language)
+        if not worker.is_cancelled:
+            self.call_from_thread(self.finish_processing)
 
+    def finish_processing(self) -> None:
         self.notify("Problem added successfully!", severity="success")
         self.exit()
 
+    def action_show_stats(self) -> None:
+        if self.query(WelcomeScreen):
+            self.load_stats_summary()
+
+    @work(thread=True, exclusive=True, group="stats")
+    def load_stats_summary(self) -> None:
+        summary = self.fs_manager.load_stats().summary()
+        if not get_current_worker().is_cancelled:
+            self.call_from_thread(self.show_stats, summary)
+
+    def show_stats(self, summary: dict) -> None:
+        welcome = self.query(WelcomeScreen)
+        if not welcome:
+            return
+
+        self.mount(StatsScreen(summary), before=welcome.first())
+        welcome.first().remove()
+
+    def action_browse(self) -> None:
+        from lantern.browse import BrowseScreen
+
+        welcome = self.query(WelcomeScreen)
+        if not welcome:
+            return
+
+        self.mount(BrowseScreen(self.root_dir), before=welcome.first())
+        welcome.first().remove()
+
+    def switch_to_welcome(self) -> None:
+        from lantern.browse import BrowseScreen
+
+        screens = self.query(StatsScreen) or self.query(BrowseScreen)
+        if not screens:
+            return
+
+        self.mount(WelcomeScreen(), before=screens.first())
+        screens.first().remove()
+        self.call_after_refresh(lambda: self.query_one(WelcomeScreen).query_one(Input).focus())
+
     def on_key(self, event) -> None:
-        if event.key == "q":
+        if event.key == "escape":
+            self.switch_to_welcome()
+        elif event.key == "q":
             self.exit()
         elif event.key == "ctrl+c":
             self.exit()
@@ -292,8 +437,9 @@ class LanternApp(App):
     def action_quit(self) -> None:
         self.exit()
 
-    def on_unmount(self) -> None:
-        pass
+    async def on_unmount(self) -> None:
+        self.cancel_prefetch()
+        await self.lantern.close()
 
 
 def run_tui(root_dir: Path) -> None:
@@ -1,4 +1,7 @@
+import hashlib
+import os
 import re
+import tempfile
 from pathlib import Path
 from typing import Optional
 
@@ -10,6 +13,18 @@ def extract_question_slug(url: str) -> Optional[str]:
     return None
 
 
+def parse_language(lang: str) -> str:
+    lang_map = {
+        "py": "python",
+        "python": "python",
+        "go": "go",
+        "java": "java",
+        "cpp": "cpp",
+        "c++": "cpp",
+    }
+    return lang_map.get(lang.lower(), "python")
+
+
 def get_language_extension(language: str) -> str:
     extensions = {
         "python": "py",
@@ -20,6 +35,26 @@ def get_language_extension(language: str) -> str:
     return extensions.get(language.lower(), "py")
 
 
+def get_extension_language(extension: str) -> Optional[str]:
+    languages = {
+        "py": "python",
+        "go": "go",
+        "java": "java",
+        "cpp": "cpp",
+    }
+    return languages.get(extension.lower())
+
+
+def get_language_name(language: str) -> str:
+    names = {
+        "python": "Python",
+        "go": "Go",
+        "java": "Java",
+        "cpp": "C++",
+    }
+    return names.get(language.lower(), language.capitalize())
+
+
 def format_question_id(question_id: str) -> str:
     num = int(question_id)
     return f"{num:04d}"
@@ -45,3 +80,56 @@ def ensure_readme(root: Path) -> Path:
         readme.write_text("# LeetCode Solutions\n\n")
     return readme
 
+
+
+def get_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME")
+    cache_home = Path(base) if base else Path.home() / ".cache"
+    return cache_home / "lantern"
+
+
+def get_state_dir(root: Path) -> Path:
+    return root / ".lantern"
+
+
+def content_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def atomic_write_text(path: Path, content: str, previous_digest: Optional[str] = None) -> bool:
+    data = content.encode("utf-8")
+    digest = content_digest(data)
+
+    from lantern.trace import count
+
+    if previous_digest is None and path.exists():
+        existing = path.read_bytes()
+        count("bytes_read", len(existing))
+        previous_digest = content_digest(existing)
+    if digest == previous_digest:
+        return False
+
+    mode = path.stat().st_mode & 0o777 if path.exists() else 0o644
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(data)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+        count("bytes_written", len(data))
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    return True
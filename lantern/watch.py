@@ -0,0 +1,186 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from lantern.filesystem import FileSystemManager
+from lantern.rebuild import DriftReport, apply_report, reconcile, reconcile_folders
+
+DEFAULT_DEBOUNCE = 0.3
+DEFAULT_POLL_INTERVAL = 1.0
+RESCAN_ALL = "*"
+
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF
+EVENT_HEADER = struct.Struct("iIII")
+
+
+class PollingWatcher:
+    def __init__(self, folder: Path, interval: float = DEFAULT_POLL_INTERVAL):
+        self.folder = folder
+        self.interval = interval
+        self.snapshot = self.take_snapshot()
+
+    def take_snapshot(self) -> Dict[str, Tuple[str, ...]]:
+        snapshot = {}
+        try:
+            with os.scandir(self.folder) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    try:
+                        with os.scandir(entry.path) as children:
+                            snapshot[entry.name] = tuple(sorted(child.name for child in children))
+                    except FileNotFoundError:
+                        continue
+        except FileNotFoundError:
+            pass
+        return snapshot
+
+    def wait(self, timeout: float) -> Set[str]:
+        time.sleep(min(timeout, self.interval))
+        snapshot = self.take_snapshot()
+        changed = {
+            name
+            for name in snapshot.keys() | self.snapshot.keys()
+            if snapshot.get(name) != self.snapshot.get(name)
+        }
+        self.snapshot = snapshot
+        return changed
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    def __init__(self, folder: Path):
+        self.folder = folder
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.folders_by_wd: Dict[int, Optional[str]] = {}
+        self.root_wd = self._add_watch(folder, None)
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    self._add_watch(Path(entry.path), entry.name)
+
+    @classmethod
+    def available(cls) -> bool:
+        return sys.platform.startswith("linux")
+
+    def _add_watch(self, path: Path, name: Optional[str]) -> int:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path}")
+        self.folders_by_wd[wd] = name
+        return wd
+
+    def wait(self, timeout: float) -> Set[str]:
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, name_length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + name_length].rstrip(b"\0").decode(errors="replace")
+            offset += name_length
+
+            if mask & IN_Q_OVERFLOW:
+                changed.add(RESCAN_ALL)
+                continue
+            if mask & IN_IGNORED:
+                self.folders_by_wd.pop(wd, None)
+                continue
+
+            folder_name = self.folders_by_wd.get(wd)
+            if wd == self.root_wd:
+                changed.add(name)
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                    try:
+                        self._add_watch(self.folder / name, name)
+                    except OSError:
+                        pass
+            elif folder_name:
+                changed.add(folder_name)
+        return changed
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def create_watcher(folder: Path, poll: bool = False, interval: float = DEFAULT_POLL_INTERVAL):
+    if not poll and InotifyWatcher.available():
+        try:
+            return InotifyWatcher(folder)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(folder, interval)
+
+
+def apply_changes(
+    fs_manager: FileSystemManager,
+    folder_names: Set[str],
+    lookup: Optional[Callable[[str], Optional[Dict]]] = None,
+) -> DriftReport:
+    if RESCAN_ALL in folder_names:
+        report = reconcile(fs_manager, lookup)
+    else:
+        report = reconcile_folders(fs_manager, folder_names, lookup)
+    apply_report(fs_manager, report)
+    return report
+
+
+def watch(
+    fs_manager: FileSystemManager,
+    lookup: Optional[Callable[[str], Optional[Dict]]] = None,
+    debounce: float = DEFAULT_DEBOUNCE,
+    poll: bool = False,
+    interval: float = DEFAULT_POLL_INTERVAL,
+    on_update: Optional[Callable[[DriftReport], None]] = None,
+    stop_event: Optional[threading.Event] = None,
+):
+    watcher = create_watcher(fs_manager.solutions_folder, poll, interval)
+    pending: Set[str] = set()
+    deadline = 0.0
+
+    try:
+        while stop_event is None or not stop_event.is_set():
+            timeout = max(0.0, deadline - time.monotonic()) if pending else interval
+            changed = watcher.wait(timeout)
+            if changed:
+                pending |= changed
+                deadline = time.monotonic() + debounce
+                continue
+
+            if pending and time.monotonic() >= deadline:
+                report = apply_changes(fs_manager, pending, lookup)
+                pending = set()
+                if on_update:
+                    on_update(report)
+    finally:
+        watcher.close()
@@ -0,0 +1,28 @@
+from typing import Optional, Union
+
+import pytest
+
+from lantern.ratelimit import reset_shared_limiters
+
+
+def make_problem(
+    question_id: Union[int, str],
+    title: Optional[str] = None,
+    difficulty: str = "Easy",
+    tags: str = "Array",
+) -> dict:
+    title = title or f"Problem {question_id}"
+    return {
+        "question_id": str(question_id),
+        "question_title": title,
+        "question_slug": title.lower().replace(" ", "-"),
+        "difficulty": difficulty,
+        "topic_tags": tags,
+    }
+
+
+@pytest.fixture(autouse=True)
+def shared_limiters():
+    reset_shared_limiters()
+    yield
+    reset_shared_limiters()
@@ -0,0 +1,117 @@
+import tempfile
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import lantern
+from lantern.api import AddResult, InvalidTargetError, Lantern
+from lantern.cache import ProblemCache
+from lantern.catalog import Catalog
+from lantern.filesystem import FileSystemManager
+from lantern.index import ProblemIndex
+from lantern.leetcode import LeetCodeClient, ProblemNotFoundError
+from tests.conftest import make_problem
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+PROBLEMS = {
+    "two-sum": make_problem("1", "Two Sum"),
+    "add-two-numbers": make_problem("2", "Add Two Numbers"),
+}
+
+
+def make_client(cache: ProblemCache = None) -> LeetCodeClient:
+    client = LeetCodeClient(cache=cache)
+    calls = []
+
+    async def iter_many(slugs, chunk_size, concurrency, session=None):
+        calls.append((list(slugs), session))
+        for slug in slugs:
+            yield slug, PROBLEMS[slug] if slug in PROBLEMS else ProblemNotFoundError(slug)
+
+    client.iter_many = iter_many
+    client.fetch_problem_data = AsyncMock(side_effect=lambda slug, session=None: PROBLEMS[slug])
+    client.calls = calls
+    return client
+
+
+def test_package_exports_facade():
+    assert lantern.Lantern is Lantern
+    assert lantern.AddResult is AddResult
+
+
+@pytest.mark.asyncio
+async def test_add_many_returns_results_in_order_with_errors(temp_dir):
+    client = make_client()
+    session = MagicMock()
+    seen = []
+
+    results = await Lantern(temp_dir, client, session=session).add_many(
+        [
+            ("https://leetcode.com/problems/two-sum/", "py"),
+            ("not a url", "py"),
+            ("add-two-numbers", "go"),
+            ("missing", "cpp"),
+            ("two-sum", "cpp"),
+        ],
+        on_result=seen.append,
+    )
+
+    assert [result.ok for result in results] == [True, False, True, False, True]
+    assert isinstance(results[1].error, InvalidTargetError)
+    assert isinstance(results[3].error, ProblemNotFoundError)
+    assert results[2].language == "go"
+    assert results[2].folder == temp_dir / "problemset" / "0002-add-two-numbers"
+    assert sorted(map(id, seen)) == sorted(map(id, results))
+    assert client.calls == [(["two-sum", "add-two-numbers", "missing"], session)]
+
+    manager = FileSystemManager(temp_dir)
+    manager.initialize()
+    rows = manager.parse_table_rows()
+    assert [row["question_id"] for row in rows] == [1, 2]
+    assert [lang for lang, _ in rows[0]["solutions"]] == ["Python", "C++"]
+
+
+def test_sync_add_shares_index_and_closes_owned_session(temp_dir):
+    index = ProblemIndex(temp_dir / "index.db")
+    api = Lantern(temp_dir, cache=ProblemCache(temp_dir / "cache.db"), index=index)
+    api.client.fetch_problem_data = AsyncMock(return_value=PROBLEMS["two-sum"])
+
+    result = api.add_sync("https://leetcode.com/problems/two-sum/", "python")
+
+    assert result.ok
+    assert result.problem["question_title"] == "Two Sum"
+    assert index.get(1)["title"] == "Two Sum"
+    assert api.client._session is None
+    api.close_sync()
+    index.close()
+
+
+@pytest.mark.asyncio
+async def test_add_reports_unknown_catalog_id(temp_dir):
+    result = await Lantern(temp_dir, make_client()).add(9999, "python")
+
+    assert not result.ok
+    assert isinstance(result.error, InvalidTargetError)
+    assert not (temp_dir / "README.md").exists()
+
+
+def test_numeric_ids_resolve_through_the_default_catalog(temp_dir, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(temp_dir / "cache"))
+    catalog = Catalog()
+    catalog.store_page([PROBLEMS["two-sum"]], next_skip=1, total=1)
+    catalog.close()
+
+    api = Lantern(temp_dir, offline=True)
+    result = api.add_sync(1, "python")
+    api.close_sync()
+
+    assert result.ok
+    assert result.slug == "two-sum"
+    assert result.folder == temp_dir / "problemset" / "0001-two-sum"
@@ -0,0 +1,58 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from lantern.bench import (
+    bench_size,
+    find_regressions,
+    generate_repository,
+    load_baseline,
+    save_baseline,
+)
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+def test_generate_repository(temp_dir):
+    manager = generate_repository(temp_dir, 50)
+
+    rows = manager.parse_table_rows()
+    assert len(rows) == 50
+    assert rows[-1]["question_id"] == 50
+
+
+def test_bench_size(temp_dir):
+    results = bench_size(temp_dir, 100, repeat=1)
+
+    names = [result["name"] for result in results]
+    assert names == [
+        "find_table_in_readme",
+        "parse_table_rows",
+        "update_readme_table",
+        "scaffold_folders",
+    ]
+    assert all(result["ops_per_sec"] > 0 for result in results)
+    assert all(result["peak_kib"] >= 0 for result in results)
+    assert not any((temp_dir / "problemset").iterdir())
+
+
+def test_baseline_roundtrip_and_regressions(temp_dir):
+    baseline = [
+        {"name": "parse_table_rows", "size": 1000, "median_ms": 10.0},
+        {"name": "update_readme_table", "size": 1000, "median_ms": 10.0},
+    ]
+    save_baseline(baseline, temp_dir / "baseline.json")
+    assert load_baseline(temp_dir / "baseline.json") == baseline
+
+    results = [
+        {"name": "parse_table_rows", "size": 1000, "median_ms": 11.0},
+        {"name": "update_readme_table", "size": 1000, "median_ms": 20.0},
+        {"name": "scaffold_folders", "size": 1000, "median_ms": 50.0},
+    ]
+    regressions = find_regressions(results, baseline, threshold=0.25)
+    assert [regression["name"] for regression in regressions] == ["update_readme_table"]
@@ -0,0 +1,83 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from lantern.bench import generate_repository
+from lantern.browse import BrowseScreen, ProblemTable
+from lantern.tui import LanternApp
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+async def open_browse(app: LanternApp, pilot, count: int) -> ProblemTable:
+    await pilot.press("ctrl+b")
+    table = app.query_one(BrowseScreen).query_one(ProblemTable)
+    for _ in range(200):
+        if len(table.rows) == count:
+            break
+        await pilot.pause(0.01)
+    return table
+
+
+@pytest.mark.asyncio
+async def test_browse_loads_and_sorts_rows(temp_dir):
+    generate_repository(temp_dir, 50)
+    app = LanternApp(temp_dir)
+
+    async with app.run_test(size=(120, 30)) as pilot:
+        table = await open_browse(app, pilot, 50)
+        assert [row["question_id"] for row in table.rows[:3]] == [1, 2, 3]
+        assert table.render_line(1).text.startswith("1 ")
+
+        await pilot.press("r")
+        assert table.rows[0]["question_id"] == 50
+        assert table.current_row()["question_id"] == 1
+
+        await pilot.press("s", "s")
+        assert [row["difficulty"] for row in (table.rows[0], table.rows[-1])] == ["Easy", "Hard"]
+
+        await pilot.press("escape")
+        assert not app.query(BrowseScreen)
+
+
+@pytest.mark.asyncio
+async def test_browse_renders_only_visible_rows(temp_dir):
+    generate_repository(temp_dir, 10_000)
+    app = LanternApp(temp_dir)
+
+    async with app.run_test(size=(120, 30)) as pilot:
+        table = await open_browse(app, pilot, 10_000)
+        assert table.virtual_size.height == 10_001
+
+        await pilot.press("end")
+        assert table.current_row()["question_id"] == 10_000
+        assert table.scroll_y > 0
+        assert "10000" in "".join(
+            table.render_line(y).text for y in range(table.size.height)
+        )
+
+
+@pytest.mark.asyncio
+async def test_browse_live_search_filters_rows(temp_dir):
+    generate_repository(temp_dir, 200)
+    app = LanternApp(temp_dir)
+
+    async with app.run_test(size=(120, 30)) as pilot:
+        table = await open_browse(app, pilot, 200)
+        screen = app.query_one(BrowseScreen)
+        for _ in range(100):
+            if screen.search_index is not None:
+                break
+            await pilot.pause(0.01)
+
+        await pilot.press("slash", *"problm 137")
+        assert table.rows[0]["question_id"] == 137
+        assert "match 'problm 137'" in str(screen.query_one(".browse-status").render())
+
+        await pilot.press(*["backspace"] * 10)
+        assert len(table.rows) == 200
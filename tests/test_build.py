@@ -0,0 +1,62 @@
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from lantern.build import BuildCache, CompileError
+
+CPP_SOLUTION = """#include <iostream>
+int main() { std::cout << 42 << std::endl; }
+"""
+
+needs_gxx = pytest.mark.skipif(shutil.which("g++") is None, reason="g++ is not installed")
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@needs_gxx
+def test_build_reuses_cached_artifact(temp_dir):
+    source = temp_dir / "solution.cpp"
+    source.write_text(CPP_SOLUTION)
+    cache = BuildCache(temp_dir / ".lantern" / "build")
+
+    command, cached = cache.build("cpp", source)
+    assert not cached
+    assert os.access(command[0], os.X_OK)
+
+    assert cache.build("cpp", source) == (command, True)
+
+    source.write_text(CPP_SOLUTION.replace("42", "43"))
+    new_command, cached = cache.build("cpp", source)
+    assert not cached
+    assert new_command != command
+    assert len(cache.entries()) == 2
+
+
+@needs_gxx
+def test_build_failure_leaves_no_entry(temp_dir):
+    source = temp_dir / "solution.cpp"
+    source.write_text("int main( {")
+    cache = BuildCache(temp_dir / "build")
+
+    with pytest.raises(CompileError):
+        cache.build("cpp", source)
+    assert list((temp_dir / "build").iterdir()) == []
+
+
+def test_prune_evicts_least_recently_used(temp_dir):
+    cache = BuildCache(temp_dir / "build", max_bytes=2500)
+    for age, name in enumerate(("old", "middle", "new")):
+        entry = cache.path / name
+        entry.mkdir(parents=True)
+        (entry / "solution").write_bytes(b"x" * 1000)
+        os.utime(entry, (1_000_000 + age, 1_000_000 + age))
+
+    assert cache.prune() == 1
+    assert sorted(path.name for _, _, path in cache.entries()) == ["middle", "new"]
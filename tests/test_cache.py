@@ -0,0 +1,62 @@
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from lantern.cache import ProblemCache
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+PROBLEM = {
+    "question_id": "1",
+    "question_title": "Two Sum",
+    "question_slug": "two-sum",
+    "difficulty": "Easy",
+    "topic_tags": "Array, Hash Table",
+}
+
+
+def test_set_and_get(temp_dir):
+    cache = ProblemCache(temp_dir / "problems.db")
+    cache.set("two-sum", PROBLEM)
+
+    assert cache.get("two-sum") == PROBLEM
+    assert cache.get("add-two-numbers") is None
+    cache.close()
+
+
+def test_persists_across_instances(temp_dir):
+    cache = ProblemCache(temp_dir / "problems.db")
+    cache.set("two-sum", PROBLEM)
+    cache.close()
+
+    reopened = ProblemCache(temp_dir / "problems.db")
+    assert reopened.get("two-sum") == PROBLEM
+    reopened.close()
+
+
+def test_expired_entries(temp_dir):
+    cache = ProblemCache(temp_dir / "problems.db", ttl=60)
+    cache.set("two-sum", PROBLEM)
+    cache._connect().execute(
+        "UPDATE problems SET fetched_at = ?", (time.time() - 120,)
+    )
+
+    assert cache.get("two-sum") is None
+    assert cache.get("two-sum", allow_stale=True) == PROBLEM
+    cache.close()
+
+
+def test_delete(temp_dir):
+    cache = ProblemCache(temp_dir / "problems.db")
+    cache.set("two-sum", PROBLEM)
+    cache.delete("two-sum")
+
+    assert cache.get("two-sum") is None
+    cache.close()
@@ -0,0 +1,112 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from lantern.catalog import Catalog
+from lantern.leetcode import LeetCodeClient, LeetCodeHTTPError
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+QUESTIONS = [
+    {
+        "questionFrontendId": str(i),
+        "title": f"Problem {i}",
+        "titleSlug": f"problem-{i}",
+        "difficulty": "Easy",
+        "isPaidOnly": False,
+        "topicTags": [{"name": "Array"}],
+    }
+    for i in range(1, 12)
+]
+
+
+def make_graphql_app(requested_skips, fail_at_skip=None):
+    async def graphql(request):
+        body = await request.json()
+        variables = body["variables"]
+        skip, limit = variables["skip"], variables["limit"]
+        requested_skips.append(skip)
+        if skip == fail_at_skip:
+            return web.Response(status=502)
+        return web.json_response({
+            "data": {
+                "problemsetQuestionList": {
+                    "total": len(QUESTIONS),
+                    "questions": QUESTIONS[skip:skip + limit],
+                }
+            }
+        })
+
+    app = web.Application()
+    app.router.add_post("/graphql", graphql)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_sync_and_lookup(temp_dir):
+    requested_skips = []
+    async with TestServer(make_graphql_app(requested_skips)) as server:
+        catalog = Catalog(temp_dir / "catalog.db")
+        async with LeetCodeClient(graphql_url=str(server.make_url("/graphql"))) as client:
+            await catalog.sync(client, page_size=5)
+
+    assert requested_skips == [0, 5, 10]
+    assert len(catalog) == len(QUESTIONS)
+    assert catalog.get_by_slug("problem-3")["question_id"] == "3"
+    assert catalog.get_by_id(7)["question_slug"] == "problem-7"
+    assert catalog.get_by_id(99) is None
+    assert catalog.sync_progress() == (0, None)
+    catalog.close()
+
+
+@pytest.mark.asyncio
+async def test_sync_resumes_after_failure(temp_dir):
+    requested_skips = []
+    catalog = Catalog(temp_dir / "catalog.db")
+
+    async with TestServer(make_graphql_app(requested_skips, fail_at_skip=5)) as server:
+        async with LeetCodeClient(
+            graphql_url=str(server.make_url("/graphql")), max_retries=1, backoff_base=0
+        ) as client:
+            with pytest.raises(LeetCodeHTTPError):
+                await catalog.sync(client, page_size=5)
+
+    assert len(catalog) == 5
+    assert catalog.sync_progress() == (5, len(QUESTIONS))
+
+    requested_skips.clear()
+    async with TestServer(make_graphql_app(requested_skips)) as server:
+        async with LeetCodeClient(graphql_url=str(server.make_url("/graphql"))) as client:
+            await catalog.sync(client, page_size=5)
+
+    assert requested_skips == [5, 10]
+    assert len(catalog) == len(QUESTIONS)
+    catalog.close()
+
+
+@pytest.mark.asyncio
+async def test_fetch_problem_data_from_catalog(temp_dir):
+    catalog = Catalog(temp_dir / "catalog.db")
+    catalog.store_page([
+        {
+            "question_id": "1",
+            "question_title": "Two Sum",
+            "question_slug": "two-sum",
+            "difficulty": "Easy",
+            "topic_tags": "Array, Hash Table",
+        }
+    ], next_skip=1, total=1)
+
+    client = LeetCodeClient(catalog=catalog, offline=True)
+    result = await client.fetch_problem_data("two-sum")
+
+    assert result["question_title"] == "Two Sum"
+    catalog.close()
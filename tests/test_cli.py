@@ -0,0 +1,94 @@
+import io
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from lantern.cli import parse_batch_entries, parse_language, process_batch
+from lantern.filesystem import FileSystemManager
+from lantern.leetcode import LeetCodeClient
+from tests.conftest import make_problem
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+def test_parse_language():
+    assert parse_language("py") == "python"
+    assert parse_language("C++") == "cpp"
+    assert parse_language("unknown") == "python"
+
+
+def test_parse_batch_entries():
+    stream = io.StringIO(
+        "# comment\n"
+        "https://leetcode.com/problems/two-sum/ py\n"
+        "\n"
+        "https://leetcode.com/problems/add-two-numbers/,go\n"
+    )
+
+    entries = parse_batch_entries(stream)
+    assert entries == [
+        ("https://leetcode.com/problems/two-sum/", "python"),
+        ("https://leetcode.com/problems/add-two-numbers/", "go"),
+    ]
+
+
+def test_parse_batch_entries_rejects_malformed_line():
+    with pytest.raises(ValueError):
+        parse_batch_entries(io.StringIO("https://leetcode.com/problems/two-sum/\n"))
+
+
+@pytest.mark.asyncio
+async def test_process_batch_writes_table_once(temp_dir):
+    problems = {
+        "two-sum": make_problem("1", "Two Sum"),
+        "add-two-numbers": make_problem("2", "Add Two Numbers"),
+    }
+
+    async def fake_post_graphql(self, payload, session=None):
+        return {
+            "data": {
+                alias.replace("s", "q"): {
+                    "questionFrontendId": problems[slug]["question_id"],
+                    "title": problems[slug]["question_title"],
+                    "difficulty": problems[slug]["difficulty"],
+                    "topicTags": [{"name": "Array"}],
+                } if slug in problems else None
+                for alias, slug in payload["variables"].items()
+            }
+        }
+
+    entries = [
+        ("https://leetcode.com/problems/add-two-numbers/", "go"),
+        ("https://leetcode.com/problems/two-sum/", "python"),
+        ("https://leetcode.com/problems/missing/", "python"),
+        ("https://leetcode.com/problems/two-sum/", "go"),
+    ]
+
+    original_update_many = FileSystemManager.update_readme_table_many
+
+    with patch("lantern.cli.LeetCodeClient.post_graphql", fake_post_graphql), patch.object(
+        FileSystemManager,
+        "update_readme_table_many",
+        autospec=True,
+        side_effect=original_update_many,
+    ) as update_many:
+        failures = await process_batch(
+            entries, temp_dir, concurrency=2, leetcode_client=LeetCodeClient(), chunk_size=2
+        )
+
+    assert failures == 1
+    assert update_many.call_count == 1
+    assert (temp_dir / "problemset" / "0001-two-sum" / "solution.py").exists()
+    assert (temp_dir / "problemset" / "0001-two-sum" / "solution.go").exists()
+    assert (temp_dir / "problemset" / "0002-add-two-numbers" / "solution.go").exists()
+
+    manager = FileSystemManager(temp_dir)
+    manager.initialize()
+    rows = manager.parse_table_rows()
+    assert [row["question_id"] for row in rows] == [1, 2]
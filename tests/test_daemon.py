@@ -0,0 +1,123 @@
+import asyncio
+import tempfile
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from lantern.cli import forward_to_daemon
+from lantern.daemon import (
+    DaemonError,
+    DaemonUnavailable,
+    LanternDaemon,
+    send_request,
+    socket_path,
+    try_request,
+)
+from lantern.leetcode import LeetCodeClient, ProblemNotFoundError
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+PROBLEM = {
+    "question_id": "1",
+    "question_title": "Two Sum",
+    "question_slug": "two-sum",
+    "difficulty": "Easy",
+    "topic_tags": "Array, Hash Table",
+}
+
+
+async def start_daemon(root: Path, client: LeetCodeClient):
+    daemon = LanternDaemon(root, leetcode_client=client)
+    ready = asyncio.Event()
+    task = asyncio.create_task(daemon.serve(ready))
+    await asyncio.wait_for(ready.wait(), 5)
+    return daemon, task
+
+
+def request(root: Path, payload: dict):
+    return asyncio.to_thread(send_request, root, payload)
+
+
+def add_request(slug: str, language: str) -> dict:
+    return {"command": "add", "url": f"https://leetcode.com/problems/{slug}/", "language": language}
+
+
+@pytest.mark.asyncio
+async def test_daemon_adds_problems_with_warm_state(temp_dir):
+    client = LeetCodeClient()
+    client.fetch_problem_data = AsyncMock(return_value=PROBLEM)
+    _, task = await start_daemon(temp_dir, client)
+
+    response = await request(temp_dir, add_request("two-sum", "py"))
+    assert response == {"status": "ok", "message": "Successfully added problem: Two Sum"}
+    response = await request(temp_dir, add_request("two-sum", "go"))
+    assert response["status"] == "ok"
+
+    readme = (temp_dir / "README.md").read_text()
+    assert "[Python](./problemset/0001-two-sum/solution.py), [Go](./problemset/0001-two-sum/solution.go)" in readme
+    assert (temp_dir / "problemset" / "0001-two-sum" / "solution.go").exists()
+    assert client.fetch_problem_data.await_count == 2
+
+    client.fetch_problem_data = AsyncMock(side_effect=ProblemNotFoundError("nope"))
+    response = await request(temp_dir, add_request("nope", "py"))
+    assert response["status"] == "error"
+    assert "not found" in response["message"]
+
+    assert (await request(temp_dir, {"command": "stop"}))["status"] == "ok"
+    await asyncio.wait_for(task, 5)
+    assert not socket_path(temp_dir).exists()
+
+
+@pytest.mark.asyncio
+async def test_daemon_refuses_second_instance(temp_dir):
+    _, task = await start_daemon(temp_dir, LeetCodeClient())
+
+    with pytest.raises(DaemonError):
+        await LanternDaemon(temp_dir, leetcode_client=LeetCodeClient()).serve()
+
+    await request(temp_dir, {"command": "stop"})
+    await asyncio.wait_for(task, 5)
+
+
+def test_try_request_falls_back_without_daemon(temp_dir):
+    assert try_request(temp_dir, {"command": "ping"}) is None
+
+    path = socket_path(temp_dir)
+    path.parent.mkdir(parents=True)
+    path.write_text("")
+    assert try_request(temp_dir, {"command": "ping"}) is None
+
+
+@pytest.mark.asyncio
+async def test_lost_reply_is_an_error_not_a_fallback(temp_dir):
+    received = []
+
+    async def drop_connection(reader, writer):
+        received.append(await reader.readline())
+        writer.close()
+
+    path = socket_path(temp_dir)
+    path.parent.mkdir(parents=True)
+    server = await asyncio.start_unix_server(drop_connection, path=str(path))
+    async with server:
+        with pytest.raises(DaemonError) as excinfo:
+            await request(temp_dir, add_request("two-sum", "py"))
+        assert not isinstance(excinfo.value, DaemonUnavailable)
+
+        with pytest.raises(SystemExit):
+            await asyncio.to_thread(forward_to_daemon, temp_dir, add_request("two-sum", "py"))
+
+    assert len(received) == 2
+
+
+def test_socket_path_stays_short_for_deep_roots(temp_dir):
+    deep = temp_dir / ("nested-" * 20)
+    path = socket_path(deep)
+    assert len(str(path)) < 108
+    assert path == socket_path(deep)
@@ -1,5 +1,7 @@
+import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -172,3 +174,79 @@ def test_update_readme_table_sorts_by_id(temp_dir):
     assert rows[0]["question_id"] == 3
     assert rows[1]["question_id"] == 233
 
+
+
+def test_update_readme_table_many(temp_dir):
+    manager = FileSystemManager(temp_dir)
+    manager.initialize()
+    
+    problem_data1 = {
+        "question_id": "20",
+        "question_title": "Valid Parentheses",
+        "question_slug": "valid-parentheses",
+        "difficulty": "Easy",
+        "topic_tags": "String, Stack",
+    }
+    
+    problem_data2 = {
+        "question_id": "1",
+        "question_title": "Two Sum",
+        "question_slug": "two-sum",
+        "difficulty": "Easy",
+        "topic_tags": "Array, Hash Table",
+    }
+    
+    manager.update_readme_table_many([
+        (problem_data1, "python"),
+        (problem_data2, "cpp"),
+        (problem_data2, "python"),
+    ])
+    
+    rows = manager.parse_table_rows()
+    assert [row["question_id"] for row in rows] == [1, 20]
+    assert [lang for lang, _ in rows[0]["solutions"]] == ["C++", "Python"]
+
+
+def test_update_readme_table_skips_unchanged_write(temp_dir):
+    manager = FileSystemManager(temp_dir)
+    manager.initialize()
+    
+    problem_data = {
+        "question_id": "1",
+        "question_title": "Two Sum",
+        "question_slug": "two-sum",
+        "difficulty": "Easy",
+        "topic_tags": "Array, Hash Table",
+    }
+    
+    manager.update_readme_table(problem_data, "python")
+    before = manager.readme_path.stat().st_mtime_ns
+    
+    fresh_manager = FileSystemManager(temp_dir)
+    fresh_manager.initialize()
+    fresh_manager.update_readme_table(problem_data, "python")
+    
+    assert manager.readme_path.stat().st_mtime_ns == before
+
+
+def test_update_many_coalesces_table_writes(temp_dir):
+    manager = FileSystemManager(temp_dir)
+    manager.initialize()
+    
+    problems = [
+        {
+            "question_id": str(i),
+            "question_title": f"Problem {i}",
+            "question_slug": f"problem-{i}",
+            "difficulty": "Easy",
+            "topic_tags": "Array",
+        }
+        for i in (3, 1, 2)
+    ]
+    
+    with patch("lantern.utils.os.replace", wraps=os.replace) as replace:
+        manager.update_readme_table_many([(problem_data, "python") for problem_data in problems])
+    
+    assert replace.call_count == 1
+    rows = manager.parse_table_rows()
+    assert [row["question_id"] for row in rows] == [1, 2, 3]
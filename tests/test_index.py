@@ -0,0 +1,65 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from lantern.filesystem import FileSystemManager
+from lantern.index import ProblemIndex
+from tests.conftest import make_problem
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+def test_upsert_and_get(temp_dir):
+    index = ProblemIndex(temp_dir / "index.db")
+    index.upsert_rows([{
+        "question_id": 1,
+        "title": "Two Sum",
+        "url": "https://leetcode.com/problems/two-sum/",
+        "solutions": [("Python", "./problemset/0001-two-sum/solution.py")],
+        "tags": "Array",
+        "difficulty": "Easy",
+    }])
+
+    row = index.get(1)
+    assert row["slug"] == "two-sum"
+    assert row["solutions"] == [("Python", "./problemset/0001-two-sum/solution.py")]
+    assert index.get_by_slug("two-sum")["question_id"] == 1
+    assert index.remove(1)
+    assert index.get(1) is None
+    index.close()
+
+
+def test_import_from_readme(temp_dir):
+    manager = FileSystemManager(temp_dir)
+    manager.initialize()
+    manager.update_readme_table(make_problem("2", "Add Two Numbers"), "go")
+    manager.update_readme_table(make_problem("1", "Two Sum"), "python")
+
+    index = manager.create_index()
+
+    assert len(index) == 2
+    assert [row["question_id"] for row in index.rows()] == [1, 2]
+    assert ProblemIndex.open_existing(temp_dir) is not None
+
+
+def test_readme_is_rendered_from_index(temp_dir):
+    manager = FileSystemManager(temp_dir)
+    manager.initialize()
+    manager.update_readme_table(make_problem("1", "Two Sum"), "python")
+    manager.create_index()
+
+    manager.readme_path.write_text("# LeetCode Solutions\n\n")
+    manager.update_readme_table(make_problem("2", "Add Two Numbers"), "go")
+
+    rows = manager.parse_table_rows()
+    assert [row["question_id"] for row in rows] == [2]
+
+    manager.render_readme_from_index()
+    rows = manager.parse_table_rows()
+    assert [row["question_id"] for row in rows] == [1, 2]
+    assert manager.get_row(2)["solutions"][0][0] == "Go"
@@ -1,7 +1,17 @@
+import aiohttp
 import pytest
 
 from unittest.mock import AsyncMock, MagicMock
-from lantern.leetcode import LeetCodeClient
+from lantern.cache import ProblemCache
+from lantern.ratelimit import AdaptiveLimiter
+from lantern.leetcode import (
+    LeetCodeClient,
+    LeetCodeResponseError,
+    LeetCodeHTTPError,
+    LeetCodeTransportError,
+    NotCachedError,
+    ProblemNotFoundError,
+)
 
 
 @pytest.mark.asyncio
@@ -28,7 +38,7 @@ async def test_fetch_problem_data_success():
     mock_session = MagicMock()
     mock_session.post = MagicMock(return_value=mock_response)
 
-    result = await client.fetch_problem_data(mock_session, "two-sum")
+    result = await client.fetch_problem_data("two-sum", mock_session)
 
     assert result is not None
     assert result["question_id"] == "1"
@@ -49,9 +59,11 @@ async def test_fetch_problem_data_failure():
     mock_session = MagicMock()
     mock_session.post = MagicMock(return_value=mock_response)
 
-    result = await client.fetch_problem_data(mock_session, "invalid-slug")
+    with pytest.raises(LeetCodeHTTPError) as exc_info:
+        await client.fetch_problem_data("invalid-slug", mock_session)
 
-    assert result is None
+    assert exc_info.value.status == 404
+    assert mock_session.post.call_count == 1
 
 
 @pytest.mark.asyncio
@@ -69,6 +81,240 @@ async def test_fetch_problem_data_invalid_response():
     mock_session = MagicMock()
     mock_session.post = MagicMock(return_value=mock_response)
 
-    result = await client.fetch_problem_data(mock_session, "two-sum")
+    with pytest.raises(ProblemNotFoundError):
+        await client.fetch_problem_data("two-sum", mock_session)
 
-    assert result is None
+
+@pytest.mark.asyncio
+async def test_fetch_problem_data_uses_cache(tmp_path):
+    cache = ProblemCache(tmp_path / "problems.db")
+    client = LeetCodeClient(cache=cache)
+
+    mock_response_data = {
+        "data": {
+            "question": {
+                "questionFrontendId": "1",
+                "title": "Two Sum",
+                "difficulty": "Easy",
+                "topicTags": [{"name": "Array"}],
+            }
+        }
+    }
+
+    mock_response = AsyncMock()
+    mock_response.status = 200
+    mock_response.json = AsyncMock(return_value=mock_response_data)
+    mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+    mock_response.__aexit__ = AsyncMock(return_value=None)
+
+    mock_session = MagicMock()
+    mock_session.post = MagicMock(return_value=mock_response)
+
+    first = await client.fetch_problem_data("two-sum", mock_session)
+    second = await client.fetch_problem_data("two-sum", mock_session)
+
+    assert first == second
+    assert mock_session.post.call_count == 1
+
+    client.refresh = True
+    await client.fetch_problem_data("two-sum", mock_session)
+    assert mock_session.post.call_count == 2
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_fetch_problem_data_offline(tmp_path):
+    cache = ProblemCache(tmp_path / "problems.db")
+    client = LeetCodeClient(cache=cache, offline=True)
+
+    mock_session = MagicMock()
+
+    with pytest.raises(NotCachedError):
+        await client.fetch_problem_data("two-sum", mock_session)
+    mock_session.post.assert_not_called()
+
+    cache.set("two-sum", {"question_id": "1", "question_slug": "two-sum"})
+    result = await client.fetch_problem_data("two-sum", mock_session)
+    assert result["question_id"] == "1"
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_fetch_problem_data_retries_server_errors():
+    client = LeetCodeClient(backoff_base=0, limiter=AdaptiveLimiter())
+
+    mock_response_data = {
+        "data": {
+            "question": {
+                "questionFrontendId": "1",
+                "title": "Two Sum",
+                "difficulty": "Easy",
+                "topicTags": [],
+            }
+        }
+    }
+
+    def make_response(status):
+        response = AsyncMock()
+        response.status = status
+        response.headers = {}
+        response.json = AsyncMock(return_value=mock_response_data)
+        response.__aenter__ = AsyncMock(return_value=response)
+        response.__aexit__ = AsyncMock(return_value=None)
+        return response
+
+    mock_session = MagicMock()
+    mock_session.post = MagicMock(side_effect=[
+        make_response(503),
+        make_response(429),
+        make_response(200),
+    ])
+
+    result = await client.fetch_problem_data("two-sum", mock_session)
+
+    assert result["question_title"] == "Two Sum"
+    assert mock_session.post.call_count == 3
+    assert client.retries == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_problem_data_gives_up_on_connection_errors():
+    client = LeetCodeClient(max_retries=2, backoff_base=0)
+
+    mock_session = MagicMock()
+    mock_session.post = MagicMock(side_effect=aiohttp.ClientConnectionError("reset"))
+
+    with pytest.raises(LeetCodeTransportError):
+        await client.fetch_problem_data("two-sum", mock_session)
+
+    assert mock_session.post.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_fetch_problem_data_retries_truncated_payloads():
+    client = LeetCodeClient(max_retries=1, backoff_base=0)
+
+    def make_response(json):
+        response = AsyncMock()
+        response.status = 200
+        response.headers = {}
+        response.json = json
+        response.__aenter__ = AsyncMock(return_value=response)
+        response.__aexit__ = AsyncMock(return_value=None)
+        return response
+
+    truncated = AsyncMock(side_effect=aiohttp.ClientPayloadError("Response payload is not completed"))
+    complete = AsyncMock(return_value={
+        "data": {"question": {"questionFrontendId": "1", "title": "Two Sum", "difficulty": "Easy", "topicTags": []}}
+    })
+    mock_session = MagicMock()
+    mock_session.post = MagicMock(side_effect=[make_response(truncated), make_response(complete)])
+
+    result = await client.fetch_problem_data("two-sum", mock_session)
+
+    assert result["question_title"] == "Two Sum"
+    assert client.retries == 1
+
+    mock_session.post = MagicMock(side_effect=lambda *args, **kwargs: make_response(truncated))
+    with pytest.raises(LeetCodeTransportError):
+        await client.fetch_problem_data("two-sum", mock_session)
+    assert mock_session.post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_client_owns_pooled_session():
+    async with LeetCodeClient() as client:
+        session = client.get_session()
+        assert client.get_session() is session
+        assert session.connector.limit == client.connection_limit
+
+    assert session.closed
+
+
+def make_batch_responder(known_slugs, failing_chunk_size=None):
+    calls = []
+
+    async def post_graphql(payload, session=None):
+        variables = payload["variables"]
+        calls.append(list(variables.values()))
+        if failing_chunk_size and len(variables) >= failing_chunk_size:
+            raise LeetCodeResponseError("query too complex")
+        return {
+            "data": {
+                alias.replace("s", "q"): {
+                    "questionFrontendId": str(known_slugs.index(slug) + 1),
+                    "title": slug.replace("-", " ").title(),
+                    "difficulty": "Easy",
+                    "topicTags": [],
+                } if slug in known_slugs else None
+                for alias, slug in variables.items()
+            }
+        }
+
+    return post_graphql, calls
+
+
+@pytest.mark.asyncio
+async def test_fetch_many_packs_slugs_into_chunks():
+    slugs = [f"problem-{i}" for i in range(5)]
+    client = LeetCodeClient()
+    client.post_graphql, calls = make_batch_responder(slugs)
+
+    results, errors = await client.fetch_many(slugs + ["missing"], chunk_size=3)
+
+    assert sorted(len(chunk) for chunk in calls) == [3, 3]
+    assert set(results) == set(slugs)
+    assert results["problem-2"]["question_id"] == "3"
+    assert isinstance(errors["missing"], ProblemNotFoundError)
+
+
+@pytest.mark.asyncio
+async def test_fetch_many_splits_failing_chunks():
+    slugs = [f"problem-{i}" for i in range(4)]
+    client = LeetCodeClient()
+    client.post_graphql, calls = make_batch_responder(slugs, failing_chunk_size=3)
+
+    results, errors = await client.fetch_many(slugs, chunk_size=4)
+
+    assert not errors
+    assert set(results) == set(slugs)
+    assert [len(chunk) for chunk in calls] == [4, 2, 2]
+
+
+@pytest.mark.asyncio
+async def test_fetch_many_does_not_split_chunks_on_http_errors():
+    client = LeetCodeClient(max_retries=3, backoff_base=0, limiter=AdaptiveLimiter())
+
+    def make_response(status):
+        response = AsyncMock()
+        response.status = status
+        response.headers = {}
+        response.__aenter__ = AsyncMock(return_value=response)
+        response.__aexit__ = AsyncMock(return_value=None)
+        return response
+
+    mock_session = MagicMock()
+    mock_session.post = MagicMock(side_effect=lambda *args, **kwargs: make_response(429))
+    slugs = [f"problem-{i}" for i in range(8)]
+
+    results, errors = await client.fetch_many(slugs, chunk_size=8, session=mock_session)
+
+    assert not results
+    assert set(errors) == set(slugs)
+    assert all(isinstance(error, LeetCodeHTTPError) for error in errors.values())
+    assert mock_session.post.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_fetch_many_uses_cache(tmp_path):
+    cache = ProblemCache(tmp_path / "problems.db")
+    cache.set("problem-0", {"question_id": "1", "question_slug": "problem-0"})
+    client = LeetCodeClient(cache=cache)
+    client.post_graphql, calls = make_batch_responder(["problem-0", "problem-1"])
+
+    results, errors = await client.fetch_many(["problem-0", "problem-1"])
+
+    assert calls == [["problem-1"]]
+    assert set(results) == {"problem-0", "problem-1"}
+    assert cache.get("problem-1") is not None
+    cache.close()
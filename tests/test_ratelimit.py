@@ -0,0 +1,169 @@
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from lantern.leetcode import LeetCodeClient
+from lantern.ratelimit import AdaptiveLimiter, TokenBucket, parse_retry_after, shared_limiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_question(slug: str) -> dict:
+    return {
+        "questionFrontendId": slug.split("-")[-1],
+        "title": slug,
+        "difficulty": "Easy",
+        "topicTags": [],
+    }
+
+
+class MockLeetCode:
+    def __init__(self, max_concurrent: int = 100, retry_after: str = "", throttle_first: int = 0):
+        self.max_concurrent = max_concurrent
+        self.retry_after = retry_after
+        self.throttle_first = throttle_first
+        self.active = 0
+        self.peak = 0
+        self.requests = 0
+        self.throttled = 0
+        self.served_at = []
+
+    async def handle(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        self.requests += 1
+        if self.requests <= self.throttle_first or self.active >= self.max_concurrent:
+            self.throttled += 1
+            headers = {"Retry-After": self.retry_after} if self.retry_after else {}
+            return web.Response(status=429, headers=headers)
+
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.active -= 1
+        self.served_at.append(time.monotonic())
+        variables = payload["variables"]
+        if "titleSlug" in variables:
+            return web.json_response({"data": {"question": make_question(variables["titleSlug"])}})
+        return web.json_response({
+            "data": {alias.replace("s", "q"): make_question(slug) for alias, slug in variables.items()}
+        })
+
+    async def start(self) -> TestServer:
+        app = web.Application()
+        app.router.add_post("/graphql", self.handle)
+        server = TestServer(app)
+        await server.start_server()
+        return server
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:05 GMT", now=1445412480.0) == 5.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_token_bucket_spends_burst_then_refills():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, burst=2, clock=clock)
+
+    assert bucket.try_acquire() and bucket.try_acquire()
+    assert not bucket.try_acquire()
+    assert bucket.delay() == pytest.approx(0.5)
+
+    clock.now += 0.5
+    assert bucket.try_acquire()
+
+    bucket.pause(3.0)
+    clock.now += 2.0
+    assert bucket.delay() == pytest.approx(1.0)
+
+
+def test_limiter_ramps_up_and_backs_off():
+    clock = FakeClock()
+    limiter = AdaptiveLimiter(initial_limit=2, max_limit=16, clock=clock)
+
+    for _ in range(4):
+        limiter.on_success(0.1)
+    assert limiter.limit == 6
+
+    limiter.on_throttle()
+    assert limiter.limit == 3
+    assert limiter.bucket.rate == limiter.max_rate / 2
+
+    limiter.on_throttle()
+    assert limiter.limit == 3
+
+    limiter.on_success(0.1)
+    assert limiter.limit == pytest.approx(3 + 1 / 3)
+
+    clock.now += 1.0
+    for _ in range(3):
+        limiter.on_success(1.0)
+    assert limiter.limit < 3
+
+
+def test_clients_share_limiter_per_endpoint():
+    assert LeetCodeClient().limiter is LeetCodeClient().limiter
+    assert LeetCodeClient().limiter is shared_limiter("https://leetcode.com/graphql")
+    assert LeetCodeClient(graphql_url="http://localhost/graphql").limiter is not LeetCodeClient().limiter
+
+
+@pytest.mark.asyncio
+async def test_limiter_adapts_to_server_throttling():
+    mock = MockLeetCode(max_concurrent=3)
+    server = await mock.start()
+    limiter = AdaptiveLimiter(rate=1000, burst=1000, initial_limit=8)
+    slugs = [f"problem-{i}" for i in range(40)]
+
+    try:
+        async with LeetCodeClient(
+            graphql_url=str(server.make_url("/graphql")),
+            max_retries=20,
+            backoff_base=0.01,
+            backoff_max=0.1,
+            limiter=limiter,
+        ) as client:
+            results, errors = await client.fetch_many(slugs, chunk_size=1, concurrency=16)
+    finally:
+        await server.close()
+
+    assert not errors
+    assert set(results) == set(slugs)
+    assert mock.throttled > 0
+    assert limiter.throttled == mock.throttled
+    assert mock.peak <= 3
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_retry_after_pauses_every_fetch():
+    mock = MockLeetCode(retry_after="1", throttle_first=1)
+    server = await mock.start()
+    limiter = AdaptiveLimiter(rate=1000, burst=1000, initial_limit=1)
+    url = str(server.make_url("/graphql"))
+
+    try:
+        async with LeetCodeClient(graphql_url=url, limiter=limiter) as first, \
+                LeetCodeClient(graphql_url=url, limiter=limiter) as second:
+            started = time.monotonic()
+            await asyncio.gather(
+                first.fetch_problem_data("problem-1"),
+                second.fetch_problem_data("problem-2"),
+            )
+    finally:
+        await server.close()
+
+    assert mock.throttled == 1
+    assert min(mock.served_at) - started >= 0.9
@@ -0,0 +1,79 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from lantern.filesystem import FileSystemManager
+from lantern.rebuild import apply_report, reconcile, scan_problemset
+from tests.conftest import make_problem
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+def add_problem(manager: FileSystemManager, problem_data: dict, language: str):
+    folder = manager.ensure_question_folder(
+        problem_data["question_id"], problem_data["question_slug"]
+    )
+    manager.ensure_question_readme(folder, problem_data)
+    manager.ensure_solution_file(folder, language)
+    manager.update_readme_table(problem_data, language)
+    return folder
+
+
+def test_scan_problemset(temp_dir):
+    manager = FileSystemManager(temp_dir)
+    manager.initialize()
+    folder = add_problem(manager, make_problem("1", "Two Sum"), "python")
+    manager.ensure_solution_file(folder, "cpp")
+    (manager.solutions_folder / "notes").mkdir()
+
+    scanned = scan_problemset(manager.solutions_folder, workers=2)
+
+    assert list(scanned) == [1]
+    assert scanned[1].slug == "two-sum"
+    assert scanned[1].languages == ["cpp", "python"]
+
+
+def test_reconcile_clean(temp_dir):
+    manager = FileSystemManager(temp_dir)
+    manager.initialize()
+    add_problem(manager, make_problem("1", "Two Sum"), "python")
+
+    report = reconcile(manager)
+
+    assert report.clean
+    assert len(report.rows) == 1
+
+
+def test_reconcile_reports_and_repairs_drift(temp_dir):
+    manager = FileSystemManager(temp_dir)
+    manager.initialize()
+    two_sum = add_problem(manager, make_problem("1", "Two Sum"), "python")
+    add_problem(manager, make_problem("2", "Add Two Numbers"), "go")
+
+    (manager.solutions_folder / "0002-add-two-numbers" / "solution.go").unlink()
+    (manager.solutions_folder / "0002-add-two-numbers" / "README.md").unlink()
+    (manager.solutions_folder / "0002-add-two-numbers").rmdir()
+    manager.ensure_solution_file(two_sum, "java")
+    orphan = make_problem("3", "Longest Substring")
+    orphan_folder = manager.ensure_question_folder("3", orphan["question_slug"])
+    manager.ensure_question_readme(orphan_folder, dict(orphan, difficulty="Medium"))
+    manager.ensure_solution_file(orphan_folder, "python")
+
+    report = reconcile(manager)
+
+    assert report.missing == [2]
+    assert report.orphaned == [3]
+    assert report.mismatched == [1]
+
+    apply_report(manager, report)
+    rows = manager.parse_table_rows()
+    assert [row["question_id"] for row in rows] == [1, 3]
+    assert [lang for lang, _ in rows[0]["solutions"]] == ["Python", "Java"]
+    assert rows[1]["title"] == "Longest Substring"
+    assert rows[1]["difficulty"] == "Medium"
+    assert reconcile(manager).clean
@@ -0,0 +1,154 @@
+import json
+import shutil
+import tempfile
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+
+from lantern.filesystem import FileSystemManager
+from lantern.runner import ResultCache, discover_solutions, run_job, run_tests
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+CASES = [
+    {"input": "1 2\n", "output": "3\n"},
+    {"input": "5 7\n", "output": "12\n"},
+]
+
+PYTHON_SOLUTION = "a, b = map(int, input().split())\nprint(a + b)\n"
+
+CPP_SOLUTION = """#include <iostream>
+int main() { long a, b; std::cin >> a >> b; std::cout << a + b << std::endl; }
+"""
+
+
+def make_solution_folder(manager: FileSystemManager, question_id: str, files: dict) -> Path:
+    folder = manager.ensure_question_folder(question_id, f"problem-{question_id}")
+    (folder / "tests.json").write_text(json.dumps(CASES))
+    for name, content in files.items():
+        (folder / name).write_text(content)
+    return folder
+
+
+def make_manager(root: Path) -> FileSystemManager:
+    manager = FileSystemManager(root)
+    manager.initialize()
+    return manager
+
+
+def test_discover_solutions(temp_dir):
+    manager = make_manager(temp_dir)
+    make_solution_folder(manager, "1", {"solution.py": PYTHON_SOLUTION, "solution.go": ""})
+    make_solution_folder(manager, "2", {"solution.py": PYTHON_SOLUTION})
+
+    jobs = discover_solutions(manager.solutions_folder)
+    assert [(job["question_id"], job["language"]) for job in jobs] == [
+        (1, "go"),
+        (1, "python"),
+        (2, "python"),
+    ]
+    assert len(discover_solutions(manager.solutions_folder, [2])) == 1
+
+
+def test_run_job_statuses(temp_dir):
+    manager = make_manager(temp_dir)
+    make_solution_folder(manager, "1", {"solution.py": PYTHON_SOLUTION})
+    make_solution_folder(manager, "2", {"solution.py": "print(0)\n"})
+    make_solution_folder(manager, "3", {"solution.py": "while True:\n    pass\n"})
+
+    results = {
+        job["question_id"]: run_job(job, timeout=0.5)
+        for job in discover_solutions(manager.solutions_folder)
+    }
+
+    assert results[1]["status"] == "passed"
+    assert results[1]["passed"] == 2
+    assert results[2]["status"] == "failed"
+    assert results[3]["status"] == "timeout"
+
+
+@pytest.mark.skipif(shutil.which("g++") is None, reason="g++ is not installed")
+def test_run_job_compiles_cpp(temp_dir):
+    manager = make_manager(temp_dir)
+    make_solution_folder(manager, "1", {"solution.cpp": CPP_SOLUTION})
+
+    [job] = discover_solutions(manager.solutions_folder)
+    assert run_job(job)["status"] == "passed"
+
+
+def test_run_tests_skips_unchanged_solutions(temp_dir):
+    manager = make_manager(temp_dir)
+    folder = make_solution_folder(manager, "1", {"solution.py": PYTHON_SOLUTION})
+    make_solution_folder(manager, "2", {"solution.py": PYTHON_SOLUTION})
+    cache = ResultCache(temp_dir / ".lantern" / "test-results.json")
+
+    first = run_tests(discover_solutions(manager.solutions_folder), cache, workers=2)
+    assert [result["cached"] for result in first] == [False, False]
+
+    (folder / "solution.py").write_text(PYTHON_SOLUTION + "\n")
+    cache = ResultCache(temp_dir / ".lantern" / "test-results.json")
+    second = run_tests(discover_solutions(manager.solutions_folder), cache, workers=2)
+
+    assert [result["cached"] for result in second] == [False, True]
+    assert all(result["status"] == "passed" for result in second)
+
+
+class InlinePool:
+    def __init__(self, outcomes):
+        self.outcomes = outcomes
+
+    def __call__(self, max_workers=None):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+    def submit(self, fn, job, *args):
+        future = Future()
+        outcome = self.outcomes[job["question_id"]]
+        if isinstance(outcome, Exception):
+            future.set_exception(outcome)
+        else:
+            fields = {key: job[key] for key in ("question_id", "language", "solution")}
+            future.set_result(dict(outcome, **fields))
+        return future
+
+
+def test_run_tests_does_not_cache_environment_failures(temp_dir, monkeypatch):
+    manager = make_manager(temp_dir)
+    for question_id in ("1", "2", "3"):
+        make_solution_folder(manager, question_id, {"solution.py": PYTHON_SOLUTION})
+    monkeypatch.setattr("lantern.runner.ProcessPoolExecutor", InlinePool({
+        1: {"status": "missing-toolchain", "cases": 2, "passed": 0, "message": "g++ is not installed"},
+        2: {"status": "compile-error", "cases": 2, "passed": 0, "message": "syntax error"},
+        3: BrokenProcessPool("worker killed"),
+    }))
+    cache = ResultCache(temp_dir / ".lantern" / "test-results.json")
+
+    results = run_tests(discover_solutions(manager.solutions_folder), cache)
+
+    assert [result["status"] for result in results] == ["missing-toolchain", "compile-error", "error"]
+    assert "worker killed" in results[2]["message"]
+    assert cache.entries == {}
+
+
+def test_run_job_reports_missing_compiler(temp_dir, monkeypatch):
+    manager = make_manager(temp_dir)
+    make_solution_folder(manager, "1", {"solution.cpp": CPP_SOLUTION})
+    monkeypatch.setattr("lantern.build.shutil.which", lambda name: None)
+
+    [job] = discover_solutions(manager.solutions_folder)
+    result = run_job(job)
+
+    assert result["status"] == "missing-toolchain"
+    assert result["message"] == "g++ is not installed"
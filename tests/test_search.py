@@ -0,0 +1,83 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from lantern.filesystem import FileSystemManager
+from lantern.search import SearchIndex, trigrams
+from tests.conftest import make_problem
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+PROBLEMS = [
+    make_problem("1", "Two Sum", tags="Array, Hash Table"),
+    make_problem("3", "Longest Substring Without Repeating Characters", tags="String, Sliding Window"),
+    make_problem("5", "Longest Palindromic Substring", tags="String, Dynamic Programming"),
+    make_problem("70", "Climbing Stairs", tags="Math, Dynamic Programming"),
+    make_problem("167", "Two Sum II Input Array Is Sorted", tags="Array, Two Pointers"),
+]
+
+
+def make_manager(root: Path) -> FileSystemManager:
+    manager = FileSystemManager(root)
+    manager.initialize()
+    manager.update_readme_table_many([(problem, "python") for problem in PROBLEMS])
+    manager.create_search_index()
+    return manager
+
+
+def search_ids(index: SearchIndex, query: str) -> list:
+    return [result["question_id"] for result in index.search(query)]
+
+
+def test_trigrams_pad_each_word():
+    assert trigrams("Two Sum") == {"  t", " tw", "two", "wo ", "  s", " su", "sum", "um "}
+
+
+def test_search_tolerates_typos_and_ranks_closest_title(temp_dir):
+    index = make_manager(temp_dir).search
+
+    assert search_ids(index, "two sum")[:2] == [1, 167]
+    assert set(search_ids(index, "longest substrng")[:2]) == {3, 5}
+    assert search_ids(index, "climbing-stairs")[0] == 70
+
+
+def test_search_by_number_and_tag(temp_dir):
+    index = make_manager(temp_dir).search
+
+    assert search_ids(index, "167")[0] == 167
+    assert set(search_ids(index, "dynamic programing")) == {5, 70}
+
+
+def test_search_index_updates_incrementally(temp_dir):
+    make_manager(temp_dir)
+
+    manager = FileSystemManager(temp_dir)
+    manager.initialize()
+    manager.search.rebuild = None
+    manager.update_readme_table(make_problem("121", "Best Time to Buy and Sell Stock", tags="Array"), "go")
+    table = manager.load_table()
+    manager.remove_row(table, 1)
+    manager.save_table(table)
+
+    index = SearchIndex.open_existing(temp_dir)
+    assert search_ids(index, "buy sell stock")[0] == 121
+    assert 1 not in search_ids(index, "two sum")
+    assert len(index) == len(PROBLEMS)
+
+
+def test_search_index_rebuilds_after_hand_edit(temp_dir):
+    make_manager(temp_dir)
+    readme = temp_dir / "README.md"
+    readme.write_text(readme.read_text().replace("Climbing Stairs", "Staircase Climb"))
+
+    manager = FileSystemManager(temp_dir)
+    manager.initialize()
+    manager.load_table()
+
+    assert search_ids(manager.search, "staircase")[0] == 70
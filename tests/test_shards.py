@@ -0,0 +1,127 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from lantern.filesystem import FileSystemManager
+from lantern.shards import SHARD_DIRNAME, ShardLayout, ShardedTable
+from tests.conftest import make_problem
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+def make_manager(root: Path, ids, difficulty: str = "Easy") -> FileSystemManager:
+    manager = FileSystemManager(root)
+    manager.initialize()
+    manager.update_readme_table_many([(make_problem(i, difficulty=difficulty), "python") for i in ids])
+    return manager
+
+
+def test_shard_by_range_writes_toc_and_pages(temp_dir):
+    manager = make_manager(temp_dir, [1, 2, 11, 25])
+    manager.set_shard_layout(ShardLayout("range", 10))
+
+    readme = (temp_dir / "README.md").read_text()
+    assert "<!-- lantern:shards by=range size=10 -->" in readme
+    assert "[0011-0020.md](./tables/0011-0020.md)" in readme
+    assert "| # | Title |" not in readme
+    assert sorted(path.name for path in (temp_dir / SHARD_DIRNAME).iterdir()) == [
+        "0001-0010.md", "0011-0020.md", "0021-0030.md",
+    ]
+
+    page = (temp_dir / SHARD_DIRNAME / "0011-0020.md").read_text()
+    assert "[Python](../problemset/0011-problem-11/solution.py)" in page
+
+    table = manager.load_table()
+    assert isinstance(table, ShardedTable)
+    assert [row["question_id"] for row in table] == [1, 2, 11, 25]
+    assert table.get(11)["solutions"] == [("Python", "./problemset/0011-problem-11/solution.py")]
+
+
+def test_sharded_add_touches_only_one_page(temp_dir):
+    manager = make_manager(temp_dir, [1, 11])
+    manager.set_shard_layout(ShardLayout("range", 10))
+    folder = temp_dir / SHARD_DIRNAME
+    readme_before = (temp_dir / "README.md").read_text()
+    first_before = (folder / "0001-0010.md").read_text()
+
+    manager = FileSystemManager(temp_dir)
+    manager.initialize()
+    manager.update_readme_table(make_problem(12), "python")
+
+    assert (temp_dir / "README.md").read_text() == readme_before
+    assert (folder / "0001-0010.md").read_text() == first_before
+    assert "| 0012 |" in (folder / "0011-0020.md").read_text()
+
+    manager.update_readme_table(make_problem(35), "python")
+    assert "[0031-0040.md](./tables/0031-0040.md)" in (temp_dir / "README.md").read_text()
+
+
+def test_shard_by_difficulty_moves_rows_between_pages(temp_dir):
+    manager = make_manager(temp_dir, [1, 2])
+    manager.update_readme_table(make_problem(3, difficulty="Hard"), "python")
+    manager.set_shard_layout(ShardLayout("difficulty"))
+    folder = temp_dir / SHARD_DIRNAME
+    assert sorted(path.name for path in folder.iterdir()) == ["easy.md", "hard.md"]
+
+    manager.update_readme_table(make_problem(2, difficulty="Hard"), "cpp")
+
+    assert "| 0002 |" not in (folder / "easy.md").read_text()
+    assert "| 0002 |" in (folder / "hard.md").read_text()
+    assert [row["question_id"] for row in manager.load_table()] == [1, 2, 3]
+
+    manager.update_readme_table(make_problem(3, difficulty="Easy"), "python")
+    manager.update_readme_table(make_problem(2, difficulty="Easy"), "python")
+
+    assert sorted(path.name for path in folder.iterdir()) == ["easy.md"]
+    readme = (temp_dir / "README.md").read_text()
+    assert "Hard Problems" not in readme
+    assert "[easy.md](./tables/easy.md)" in readme
+    assert [row["question_id"] for row in manager.load_table()] == [1, 2, 3]
+
+
+def test_removing_the_last_row_of_a_shard_deletes_the_page(temp_dir):
+    manager = make_manager(temp_dir, [1, 11])
+    manager.set_shard_layout(ShardLayout("range", 10))
+    table = manager.load_table()
+
+    assert table.remove(11)
+    manager.save_table(table)
+
+    folder = temp_dir / SHARD_DIRNAME
+    assert sorted(path.name for path in folder.iterdir()) == ["0001-0010.md"]
+    assert "0011-0020" not in (temp_dir / "README.md").read_text()
+    fresh = FileSystemManager(temp_dir)
+    fresh.initialize()
+    assert [row["question_id"] for row in fresh.load_table()] == [1]
+
+
+def test_unshard_restores_single_table(temp_dir):
+    manager = make_manager(temp_dir, [1, 11])
+    original = (temp_dir / "README.md").read_text()
+
+    manager.set_shard_layout(ShardLayout("range", 10))
+    manager.set_shard_layout(None)
+
+    assert (temp_dir / "README.md").read_text() == original
+    assert not (temp_dir / SHARD_DIRNAME).exists()
+
+
+def test_stats_and_search_follow_sharded_table(temp_dir):
+    manager = make_manager(temp_dir, [1, 11])
+    manager.set_shard_layout(ShardLayout("range", 10))
+    manager.load_stats()
+    manager.create_search_index()
+
+    manager.update_readme_table(make_problem(21, difficulty="Medium"), "python")
+
+    assert manager.stats.data["difficulty"] == {"Easy": 2, "Medium": 1}
+    assert [result["question_id"] for result in manager.search.search("21")][:1] == [21]
+
+    reopened = FileSystemManager(temp_dir)
+    reopened.initialize()
+    assert reopened.load_stats().data["difficulty"] == {"Easy": 2, "Medium": 1}
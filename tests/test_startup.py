@@ -0,0 +1,25 @@
+import os
+
+from lantern.startup import (
+    HEADLESS_IMPORT_BUDGET_MS,
+    HEAVY_MODULES,
+    format_profile,
+    loaded_modules,
+    profile_imports,
+)
+
+
+def test_headless_import_skips_heavy_modules():
+    modules = loaded_modules()
+
+    assert "lantern.cli" in modules
+    for heavy in HEAVY_MODULES:
+        assert heavy not in modules
+
+
+def test_headless_import_within_budget():
+    budget_ms = float(os.environ.get("LANTERN_IMPORT_BUDGET_MS", HEADLESS_IMPORT_BUDGET_MS))
+    entries = profile_imports()
+
+    cli_ms = next(cumulative for name, _, cumulative, _ in entries if name == "lantern.cli") / 1000
+    assert cli_ms < budget_ms, format_profile(entries)
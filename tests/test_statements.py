@@ -0,0 +1,170 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from lantern.api import Lantern
+from lantern.filesystem import FileSystemManager
+from lantern.leetcode import LeetCodeClient
+from lantern.statements import CODECS, StatementStore, render_question_readme
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+CONSTRAINTS = "<p><strong>Constraints:</strong></p>\n<ul>\n\t<li><code>1 &lt;= n &lt;= 10<sup>4</sup></code></li>\n</ul>\n"
+
+QUESTIONS = {
+    "two-sum": {
+        "questionFrontendId": "1",
+        "title": "Two Sum",
+        "difficulty": "Easy",
+        "topicTags": [{"name": "Array"}, {"name": "Hash Table"}],
+        "content": "<p>Given an array of integers <code>nums</code>, return indices.</p>\n" + CONSTRAINTS,
+        "hints": ["Try a hash map.", "Look up the complement."],
+        "exampleTestcases": "[2,7,11,15]\n9",
+    },
+    "add-two-numbers": {
+        "questionFrontendId": "2",
+        "title": "Add Two Numbers",
+        "difficulty": "Medium",
+        "topicTags": [{"name": "Linked List"}],
+        "content": "<p>Add the two numbers.</p>\n" + CONSTRAINTS,
+        "hints": ["Try a hash map.", "Look up the complement."],
+        "exampleTestcases": "",
+    },
+    "premium-only": {
+        "questionFrontendId": "3",
+        "title": "Premium Only",
+        "difficulty": "Hard",
+        "topicTags": [],
+        "content": None,
+        "hints": [],
+        "exampleTestcases": "",
+    },
+}
+
+
+def make_client() -> LeetCodeClient:
+    client = LeetCodeClient()
+    client.queries = []
+
+    async def post_graphql(payload, session=None):
+        client.queries.append(payload)
+        variables = payload["variables"]
+        if "titleSlug" in variables:
+            return {"data": {"question": QUESTIONS.get(variables["titleSlug"])}}
+        return {"data": {name.replace("s", "q"): QUESTIONS.get(slug) for name, slug in variables.items()}}
+
+    client.post_graphql = post_graphql
+    return client
+
+
+def statement_for(slug: str) -> dict:
+    question = QUESTIONS[slug]
+    return {
+        "content": question["content"],
+        "hints": question["hints"],
+        "examples": question["exampleTestcases"],
+    }
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_store_round_trips_and_deduplicates_blobs(temp_dir, codec):
+    store = StatementStore(temp_dir / "statements.db", codec)
+    store.set_many([
+        ("two-sum", {"question_id": "1"}, statement_for("two-sum")),
+        ("add-two-numbers", {"question_id": "2"}, statement_for("add-two-numbers")),
+    ])
+
+    assert store.get("two-sum") == statement_for("two-sum")
+    assert store.get_problem("add-two-numbers") == {"question_id": "2"}
+    assert store.get("missing") is None
+    assert store.missing(["two-sum", "missing", "missing"]) == ["missing"]
+
+    usage = store.usage()
+    assert usage["statements"] == 2
+    assert usage["blobs"] == 5
+    store.close()
+
+
+def test_replacing_a_statement_prunes_unreferenced_blobs(temp_dir):
+    store = StatementStore(temp_dir / "statements.db")
+    store.set("two-sum", {}, statement_for("two-sum"))
+    store.set("add-two-numbers", {}, statement_for("add-two-numbers"))
+    store.set("two-sum", {}, dict(statement_for("two-sum"), content="<p>Reworded.</p>"))
+
+    assert store.get("two-sum")["content"] == "<p>Reworded.</p>"
+    assert store.get("add-two-numbers") == statement_for("add-two-numbers")
+    assert store.usage()["blobs"] == 5
+    store.close()
+
+
+def test_store_compresses_statements(temp_dir):
+    store = StatementStore(temp_dir / "statements.db")
+    statement = statement_for("two-sum")
+    store.set_many(
+        (f"problem-{i}", {}, dict(statement, content=statement["content"] * 3 + f"<p>{i}</p>"))
+        for i in range(50)
+    )
+
+    usage = store.usage()
+    assert usage["stored_bytes"] < usage["raw_bytes"] / 3
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_add_renders_readme_from_store_and_render_works_offline(temp_dir):
+    store = StatementStore(StatementStore.default_path(temp_dir))
+    assert len(store) == 0
+    store.close()
+    client = make_client()
+    api = Lantern(temp_dir, client)
+
+    results = await api.add_many([("two-sum", "py"), ("premium-only", "py")])
+    result = await api.add("add-two-numbers", "go")
+
+    assert all(result.ok for result in results) and result.ok
+    assert len(client.queries) == 3
+    assert "content" not in client.queries[1]["query"]
+    readme = (results[0].folder / "README.md").read_text()
+    assert readme.startswith("# 1. Two Sum\n\n**Difficulty:** Easy")
+    assert "## Description\n\n<p>Given an array" in readme
+    assert "<summary>Hint 2</summary>\n\nLook up the complement." in readme
+    assert "```\n[2,7,11,15]\n9\n```" in readme
+    assert "## Description" not in (results[1].folder / "README.md").read_text()
+    assert "## Example Testcases" not in (result.folder / "README.md").read_text()
+
+    (results[0].folder / "README.md").write_text(render_question_readme(results[0].problem))
+    (result.folder / "README.md").write_text("My own notes\n")
+    await api.close()
+
+    manager = FileSystemManager(temp_dir)
+    manager.initialize()
+    assert manager.render_question_readmes() == {"written": 1, "unchanged": 0, "edited": 1, "missing": 1}
+    assert "## Description" in (results[0].folder / "README.md").read_text()
+    assert (result.folder / "README.md").read_text() == "My own notes\n"
+
+    manager.statements.set("two-sum", results[0].problem, dict(statement_for("two-sum"), hints=[]))
+    assert manager.render_question_readmes() == {"written": 1, "unchanged": 0, "edited": 1, "missing": 1}
+    assert "## Hints" not in (results[0].folder / "README.md").read_text()
+    assert manager.render_question_readmes()["unchanged"] == 1
+
+    assert manager.render_question_readmes(force=True)["written"] == 1
+    assert "## Hints" in (result.folder / "README.md").read_text()
+    manager.statements.close()
+
+
+@pytest.mark.asyncio
+async def test_statements_are_not_fetched_without_a_store(temp_dir):
+    client = make_client()
+
+    result = await Lantern(temp_dir, client).add("two-sum", "py")
+
+    assert result.ok
+    assert "content" not in client.queries[0]["query"]
+    assert not StatementStore.default_path(temp_dir).exists()
+    assert "## Description" not in (result.folder / "README.md").read_text()
@@ -0,0 +1,62 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from lantern.filesystem import FileSystemManager
+from lantern.stats import StatsStore
+from tests.conftest import make_problem
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+def test_load_stats_builds_from_table(temp_dir):
+    manager = FileSystemManager(temp_dir)
+    manager.initialize()
+    manager.update_readme_table(make_problem("1", "Two Sum", "Easy", "Array, Hash Table"), "python")
+    manager.update_readme_table(make_problem("2", "Add Two Numbers", "Medium", "Linked List"), "go")
+
+    summary = manager.load_stats().summary({"Array": 4})
+
+    assert summary["total"] == 2
+    assert summary["difficulty"] == {"Easy": 1, "Medium": 1}
+    assert summary["language"] == {"Go": 1, "Python": 1}
+    assert summary["tag_coverage"]["Array"]["ratio"] == 0.25
+    assert StatsStore.default_path(temp_dir).exists()
+
+
+def test_stats_are_updated_incrementally(temp_dir):
+    manager = FileSystemManager(temp_dir)
+    manager.initialize()
+    manager.update_readme_table(make_problem("1", "Two Sum", "Easy", "Array"), "python")
+    manager.load_stats()
+
+    fresh_manager = FileSystemManager(temp_dir)
+    fresh_manager.initialize()
+    fresh_manager.stats.rebuild = None
+    fresh_manager.update_readme_table(make_problem("1", "Two Sum", "Easy", "Array"), "cpp")
+    fresh_manager.update_readme_table(make_problem("3", "Longest Substring", "Medium", "String"), "python")
+
+    summary = StatsStore.open_existing(temp_dir).summary()
+    assert summary["total"] == 2
+    assert summary["language"] == {"Python": 2, "C++": 1}
+    assert summary["solved_over_time"][-1]["total"] == 2
+
+
+def test_stats_rebuild_after_hand_edit(temp_dir):
+    manager = FileSystemManager(temp_dir)
+    manager.initialize()
+    manager.update_readme_table(make_problem("1", "Two Sum", "Easy", "Array"), "python")
+    manager.update_readme_table(make_problem("2", "Add Two Numbers", "Medium", "Linked List"), "go")
+    manager.load_stats()
+
+    lines = manager.readme_path.read_text().split("\n")
+    manager.readme_path.write_text("\n".join(line for line in lines if "Add Two Numbers" not in line))
+
+    fresh_manager = FileSystemManager(temp_dir)
+    fresh_manager.initialize()
+    assert fresh_manager.load_stats().summary()["total"] == 1
@@ -0,0 +1,100 @@
+from lantern.table import TABLE_DIVIDER, TABLE_HEADER, ReadmeTable, parse_row, render_row
+
+README = "\n".join([
+    "# LeetCode Solutions",
+    "",
+    TABLE_HEADER,
+    TABLE_DIVIDER,
+    "| 0020 | [Valid Parentheses](https://leetcode.com/problems/valid-parentheses/) | [Go](./problemset/0020-valid-parentheses/solution.go) | String, Stack | Easy |",
+    "| 0001 | [Two Sum](https://leetcode.com/problems/two-sum/) | [Python](./problemset/0001-two-sum/solution.py) | Array | Easy |",
+    "",
+    "Footer text",
+])
+
+
+def make_row(question_id: int, title: str) -> dict:
+    slug = title.lower().replace(" ", "-")
+    return {
+        "question_id": question_id,
+        "title": title,
+        "url": f"https://leetcode.com/problems/{slug}/",
+        "solutions": [("Python", f"./problemset/{question_id:04d}-{slug}/solution.py")],
+        "tags": "Array",
+        "difficulty": "Medium",
+        "raw_line": None,
+    }
+
+
+def test_parse_row_roundtrip():
+    row = make_row(15, "3Sum")
+    parsed = parse_row(render_row(row))
+
+    assert parsed["question_id"] == 15
+    assert parsed["title"] == "3Sum"
+    assert parsed["solutions"] == row["solutions"]
+
+
+def test_parse_orders_rows_by_id():
+    table = ReadmeTable.parse(README)
+
+    assert len(table) == 2
+    assert [row["question_id"] for row in table] == [1, 20]
+    assert 20 in table
+    assert not table.dirty
+
+
+def test_upsert_unchanged_row_is_not_dirty():
+    table = ReadmeTable.parse(README)
+    row = dict(table.get(1))
+
+    assert not table.upsert(row)
+    assert not table.dirty
+
+
+def test_upsert_and_render_keeps_surrounding_content():
+    table = ReadmeTable.parse(README)
+    table.upsert(make_row(3, "Longest Substring"))
+
+    lines = table.render().split("\n")
+    assert lines[0] == "# LeetCode Solutions"
+    assert lines[-1] == "Footer text"
+    assert [parse_row(line)["question_id"] for line in lines[4:7]] == [1, 3, 20]
+
+
+def test_remove():
+    table = ReadmeTable.parse(README)
+
+    assert table.remove(20)
+    assert not table.remove(20)
+    assert [row["question_id"] for row in ReadmeTable.parse(table.render())] == [1]
+
+
+def test_ensure_table_on_empty_readme():
+    table = ReadmeTable.parse("# LeetCode Solutions\n\n")
+    assert not table.has_table
+
+    table.upsert(make_row(1, "Two Sum"))
+    reparsed = ReadmeTable.parse(table.render())
+
+    assert reparsed.has_table
+    assert [row["question_id"] for row in reparsed] == [1]
+
+
+def test_duplicate_and_unrecognised_rows_pass_through():
+    duplicate = "| 0001 | [Two Sum](https://leetcode.com/problems/two-sum/) | [C++](./problemset/0001-two-sum/solution.cpp) | Array | Easy |"
+    note = "| -- | todo: revisit these | | | |"
+    table = ReadmeTable.parse(README.replace("| Array | Easy |", "| Array | Easy |\n" + duplicate + "\n" + note))
+
+    assert [row["question_id"] for row in table] == [1, 20]
+    assert table.get(1)["solutions"] == [("Python", "./problemset/0001-two-sum/solution.py")]
+
+    table.upsert(make_row(3, "Longest Substring"))
+    table.remove(20)
+    lines = table.render().split("\n")
+    assert lines[4:8] == [
+        "| 0001 | [Two Sum](https://leetcode.com/problems/two-sum/) | [Python](./problemset/0001-two-sum/solution.py) | Array | Easy |",
+        duplicate,
+        note,
+        render_row(make_row(3, "Longest Substring")),
+    ]
+    assert lines[8:] == ["", "Footer text"]
@@ -0,0 +1,114 @@
+import asyncio
+import json
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from lantern import trace
+from lantern.cli import main
+from lantern.leetcode import LeetCodeClient
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture
+def tracer():
+    tracer = trace.enable()
+    yield tracer
+    trace.disable()
+
+
+@trace.traced()
+def double(value: int) -> int:
+    return value * 2
+
+
+@trace.traced(name="sleepy", category="test")
+async def sleepy() -> str:
+    await asyncio.sleep(0)
+    return "done"
+
+
+def spans(tracer: trace.Tracer) -> list:
+    return [event for event in tracer.chrome_trace()["traceEvents"] if event["ph"] == "X"]
+
+
+def test_disabled_tracing_records_nothing():
+    assert trace.active() is None
+    assert trace.span("anything") is trace.NULL_SPAN
+    trace.count("bytes_written", 10)
+    assert double(2) == 4
+
+
+def test_spans_nest_and_counters_accumulate(tracer):
+    with trace.span("outer", size=3) as outer:
+        assert double(4) == 8
+        trace.count("bytes_read", 10)
+        trace.count("bytes_read", 5)
+        outer.set(rows=2)
+
+    with pytest.raises(ValueError):
+        with trace.span("failing"):
+            raise ValueError("boom")
+
+    events = {event["name"]: event for event in spans(tracer)}
+    assert events["outer"]["args"] == {"size": 3, "rows": 2}
+    assert events["double"]["ts"] >= events["outer"]["ts"]
+    assert events["double"]["ts"] + events["double"]["dur"] <= events["outer"]["ts"] + events["outer"]["dur"]
+    assert events["failing"]["args"] == {"error": "ValueError"}
+
+    counters = [event for event in tracer.chrome_trace()["traceEvents"] if event["ph"] == "C"]
+    assert [event["args"]["value"] for event in counters] == [10, 15]
+    assert tracer.counters == {"bytes_read": 15}
+
+
+@pytest.mark.asyncio
+async def test_async_spans_get_a_lane_per_task(tracer):
+    assert await asyncio.gather(sleepy(), sleepy()) == ["done", "done"]
+
+    lanes = {event["tid"] for event in spans(tracer) if event["name"] == "sleepy"}
+    assert len(lanes) == 2
+    assert all(event["cat"] == "test" for event in spans(tracer))
+
+
+def test_cli_trace_flag_writes_chrome_trace(temp_dir, monkeypatch):
+    async def fake_post_graphql(self, payload, session=None):
+        return {
+            "data": {
+                "question": {
+                    "questionFrontendId": "1",
+                    "title": "Two Sum",
+                    "difficulty": "Easy",
+                    "topicTags": [{"name": "Array"}],
+                }
+            }
+        }
+
+    output = temp_dir / "trace.json"
+    monkeypatch.chdir(temp_dir)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(temp_dir / "cache"))
+    monkeypatch.setattr(sys, "argv", [
+        "lantern", "--url", "https://leetcode.com/problems/two-sum/", "-l", "py",
+        "--refresh", "--no-daemon", "--trace", str(output),
+    ])
+    with patch.object(LeetCodeClient, "post_graphql", fake_post_graphql):
+        main()
+
+    assert trace.active() is None
+    data = json.loads(output.read_text())
+    names = {event["name"] for event in data["traceEvents"] if event["ph"] == "X"}
+    assert {
+        "import lantern",
+        "process_cli",
+        "LeetCodeClient.fetch_problem_data",
+        "FileSystemManager.ensure_question_folder",
+        "FileSystemManager.save_table",
+    } <= names
+    assert data["otherData"]["counters"]["bytes_written"] > 0
@@ -0,0 +1,115 @@
+import asyncio
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from textual.worker import WorkerCancelled
+
+from lantern.tui import LanternApp, LoadingScreen
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+PROBLEM = {
+    "question_id": "1",
+    "question_title": "Two Sum",
+    "question_slug": "two-sum",
+    "difficulty": "Easy",
+    "topic_tags": "Array, Hash Table",
+}
+
+
+@pytest.mark.asyncio
+async def test_process_problem_runs_off_the_event_loop(temp_dir):
+    app = LanternApp(temp_dir)
+    app.leetcode_client.fetch_problem_data = AsyncMock(return_value=PROBLEM)
+    threads = []
+    update = app.fs_manager.update_readme_table
+
+    def record_thread(*args):
+        threads.append(threading.current_thread())
+        update(*args)
+
+    app.fs_manager.update_readme_table = record_thread
+
+    async with app.run_test() as pilot:
+        app.url = "https://leetcode.com/problems/two-sum/"
+        app.language = "python"
+        app.mount(LoadingScreen())
+        app.fetch_and_process()
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+    assert threads and threads[0] is not threading.main_thread()
+    assert "[Two Sum]" in (temp_dir / "README.md").read_text()
+    assert (temp_dir / "problemset" / "0001-two-sum" / "solution.py").exists()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_processing_skips_table_update(temp_dir):
+    app = LanternApp(temp_dir)
+    app.problem_data = PROBLEM
+    app.language = "python"
+    started = threading.Event()
+    release = threading.Event()
+    ensure_readme = app.fs_manager.ensure_question_readme
+
+    def blocking_readme(*args):
+        started.set()
+        release.wait(5)
+        ensure_readme(*args)
+
+    app.fs_manager.ensure_question_readme = blocking_readme
+    app.fs_manager.update_readme_table = Mock()
+
+    async with app.run_test() as pilot:
+        worker = app.process_problem()
+        while not started.is_set():
+            await pilot.pause(0.01)
+        worker.cancel()
+        release.set()
+        with pytest.raises(WorkerCancelled):
+            await worker.wait()
+        await asyncio.to_thread(time.sleep, 0.2)
+
+    assert (temp_dir / "problemset" / "0001-two-sum" / "README.md").exists()
+    app.fs_manager.update_readme_table.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_url_input_prefetches_and_cancels_stale_fetches(temp_dir):
+    app = LanternApp(temp_dir)
+    requested = []
+    release = asyncio.Event()
+
+    async def fetch(slug):
+        requested.append(slug)
+        await release.wait()
+        return dict(PROBLEM, question_slug=slug)
+
+    app.leetcode_client.fetch_problem_data = fetch
+
+    async with app.run_test() as pilot:
+        await pilot.press(*"https://leetcode.com/problems/two-sum/")
+        await pilot.pause(0.5)
+        first = app.prefetch_task
+        assert requested == ["two-sum"]
+
+        await pilot.press("backspace", *"s/")
+        await pilot.pause(0.5)
+        assert first.cancelled()
+        assert requested == ["two-sum", "two-sums"]
+
+        await pilot.press("enter")
+        assert requested == ["two-sum", "two-sums"]
+        release.set()
+        app.start_prefetch("two-sums")
+        assert (await app.prefetch_task)["question_slug"] == "two-sums"
+        assert requested == ["two-sum", "two-sums"]
@@ -1,5 +1,10 @@
 
+from unittest.mock import patch
+
+import pytest
+
 from lantern.utils import (
+    atomic_write_text,
     extract_question_slug,
     format_question_id,
     get_language_extension,
@@ -35,3 +40,26 @@ def test_get_language_extension():
     assert get_language_extension("cpp") == "cpp"
     assert get_language_extension("unknown") == "py"
 
+
+
+def test_atomic_write_text(tmp_path):
+    path = tmp_path / "README.md"
+    
+    assert atomic_write_text(path, "hello\n")
+    assert path.read_text() == "hello\n"
+    assert not atomic_write_text(path, "hello\n")
+    assert atomic_write_text(path, "world\n")
+    assert path.read_text() == "world\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["README.md"]
+
+
+def test_atomic_write_text_keeps_original_on_failure(tmp_path):
+    path = tmp_path / "README.md"
+    path.write_text("original\n")
+    
+    with patch("lantern.utils.os.replace", side_effect=KeyboardInterrupt):
+        with pytest.raises(KeyboardInterrupt):
+            atomic_write_text(path, "partial")
+    
+    assert path.read_text() == "original\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["README.md"]
@@ -0,0 +1,110 @@
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from lantern.filesystem import FileSystemManager
+from lantern.watch import InotifyWatcher, PollingWatcher, apply_changes, watch
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+PROBLEM = {
+    "question_id": "1",
+    "question_title": "Two Sum",
+    "question_slug": "two-sum",
+    "difficulty": "Easy",
+    "topic_tags": "Array",
+}
+
+
+def make_manager(root: Path) -> FileSystemManager:
+    manager = FileSystemManager(root)
+    manager.initialize()
+    return manager
+
+
+def test_polling_watcher_reports_changed_folders(temp_dir):
+    manager = make_manager(temp_dir)
+    folder = manager.ensure_question_folder("1", "two-sum")
+    watcher = PollingWatcher(manager.solutions_folder, interval=0)
+
+    manager.ensure_solution_file(folder, "python")
+    assert watcher.wait(0) == {"0001-two-sum"}
+    assert watcher.wait(0) == set()
+
+
+@pytest.mark.skipif(not InotifyWatcher.available(), reason="inotify is Linux only")
+def test_inotify_watcher_reports_changed_folders(temp_dir):
+    manager = make_manager(temp_dir)
+    watcher = InotifyWatcher(manager.solutions_folder)
+    try:
+        folder = manager.ensure_question_folder("1", "two-sum")
+        assert watcher.wait(1) == {"0001-two-sum"}
+
+        manager.ensure_solution_file(folder, "go")
+        assert watcher.wait(1) == {"0001-two-sum"}
+    finally:
+        watcher.close()
+
+
+def test_apply_changes_updates_only_changed_rows(temp_dir):
+    manager = make_manager(temp_dir)
+    folder = manager.ensure_question_folder("1", "two-sum")
+    manager.ensure_question_readme(folder, PROBLEM)
+    manager.ensure_solution_file(folder, "python")
+
+    report = apply_changes(manager, {"0001-two-sum"})
+    assert report.orphaned == [1]
+    assert manager.parse_table_rows()[0]["title"] == "Two Sum"
+
+    (folder / "solution.py").unlink()
+    manager.ensure_solution_file(folder, "java")
+    report = apply_changes(manager, {"0001-two-sum"})
+    assert report.mismatched == [1]
+    assert manager.parse_table_rows()[0]["solutions"][0][0] == "Java"
+
+    for child in folder.iterdir():
+        child.unlink()
+    folder.rmdir()
+    report = apply_changes(manager, {"0001-two-sum"})
+    assert report.missing == [1]
+    assert manager.parse_table_rows() == []
+
+
+def test_watch_loop_debounces_and_applies(temp_dir):
+    manager = make_manager(temp_dir)
+    stop_event = threading.Event()
+    reports = []
+
+    def on_update(report):
+        reports.append(report)
+        stop_event.set()
+
+    thread = threading.Thread(
+        target=watch,
+        args=(make_manager(temp_dir),),
+        kwargs={
+            "debounce": 0.05,
+            "poll": True,
+            "interval": 0.02,
+            "on_update": on_update,
+            "stop_event": stop_event,
+        },
+    )
+    thread.start()
+    time.sleep(0.05)
+    folder = manager.ensure_question_folder("1", "two-sum")
+    manager.ensure_question_readme(folder, PROBLEM)
+    manager.ensure_solution_file(folder, "python")
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert len(reports) == 1
+    assert [row["question_id"] for row in manager.parse_table_rows()] == [1]